@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   csv_benchmark.py
+@Date       :   2026/10/18
+@Desc       :   CSV 读取基准测试
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import csv
+import gc
+import io
+import operator
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pythontools.text.csv.csv_structure import CsvReader, CsvRow, CsvWriter, RowView  # noqa: E402
+
+DEFAULT_SIZE_MB = 1024
+MEMORY_ROWS = 200_000
+WRITE_ROWS = 1_000_000
+HEADER = "id,name,city,amount,comment\r\n"
+
+
+def generate_csv(path: str, size_mb: int) -> int:
+    """
+    生成指定大小的 CSV 文件, 每 10 行包含一个带换行符的限定字段, 返回数据行数
+    """
+    target = size_mb * 1024 * 1024
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADER)
+        written = len(HEADER)
+        while written < target:
+            lines = []
+            for i in range(rows, rows + 10_000):
+                comment = f'"line one\r\nline ""two"" {i}"' if i % 10 == 0 else f"comment {i}"
+                lines.append(f"{i},name{i % 997},city{i % 101},{i * 7 % 10_000}.{i % 100:02d},{comment}\r\n")
+            chunk = "".join(lines)
+            f.write(chunk)
+            written += len(chunk)
+            rows += len(lines)
+    return rows
+
+
+class LegacyCsvRow:
+    """
+    旧版没有 __slots__ 且双重拷贝数据的 CsvRow, 仅用于对比
+    """
+
+    def __init__(self, line_num: int, data: list[str], is_header: bool = False) -> None:
+        self.ori_line_num = line_num
+        self.is_header = is_header
+        self.data = tuple(list(data))
+
+
+def measure_bytes_per_row(build: Callable[[], list], rows: int) -> float:
+    """
+    返回构建的对象在原始行数据之外额外占用的平均字节数
+    """
+    gc.collect()
+    tracemalloc.start()
+    objs = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return current / rows
+
+
+def bench_memory_per_row(rows: int) -> None:
+    lines = (f"{i},name{i},city{i % 101},{i % 10_000},comment {i}" for i in range(rows))
+    buffer = list(csv.reader(io.StringIO("\n".join(lines))))
+    header = ["id", "name", "city", "amount", "comment"]
+    header_map = {name: i for i, name in enumerate(header)}
+    cases: dict[str, Callable[[], list]] = {
+        "dict per row": lambda: [dict(zip(header, row)) for row in buffer],
+        "legacy CsvRow": lambda: [LegacyCsvRow(i, row) for i, row in enumerate(buffer, 1)],
+        "CsvRow (__slots__)": lambda: [CsvRow(i, row) for i, row in enumerate(buffer, 1)],
+        "RowView": lambda: [RowView(buffer, i, header_map, i + 1) for i in range(len(buffer))],
+    }
+    for name, build in cases.items():
+        print(f"{name:<28} rows={rows:>10}  {measure_bytes_per_row(build, rows):>8.1f} bytes/row")
+
+
+def bench_writer(tmp_dir: str, rows: int) -> None:
+    data = [(i, f"name{i % 997}", f"city{i % 101}", i * 7 % 10_000, f"comment {i}") for i in range(rows)]
+
+    def write_per_row(path: str) -> None:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            for row in data:
+                writer.writerow(row)
+
+    def write_csv_writer(path: str, compression: str | None = None) -> None:
+        with CsvWriter(path, compression=compression) as writer:
+            writer.write_many(data)
+
+    cases: dict[str, Callable[[str], None]] = {
+        "csv.writer per row": write_per_row,
+        "CsvWriter.write_many": write_csv_writer,
+        "CsvWriter.write_many gzip": lambda path: write_csv_writer(path, CsvWriter.GZIP),
+    }
+    for name, write in cases.items():
+        path = os.path.join(tmp_dir, "written.csv")
+        start = time.perf_counter()
+        write(path)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} rows={rows:>10}  {elapsed:>8.2f}s  {rows / elapsed:>10.0f} rows/s")
+        os.remove(path)
+
+
+def bench_sequential(reader: CsvReader, size_mb: int) -> None:
+    start = time.perf_counter()
+    rows = sum(map(len, reader.iter_batches(65536)))
+    elapsed = time.perf_counter() - start
+    print(f"{'iter_batches (sequential)':<28} rows={rows:>10}  {elapsed:>8.2f}s  {size_mb / elapsed:>8.2f} MB/s")
+
+
+def bench_parallel(reader: CsvReader, size_mb: int, workers: int) -> None:
+    start = time.perf_counter()
+    rows = reader.read_parallel(workers, map_func=len, reduce_func=operator.add)
+    elapsed = time.perf_counter() - start
+    label = f"read_parallel(workers={workers})"
+    print(f"{label:<28} rows={rows:>10}  {elapsed:>8.2f}s  {size_mb / elapsed:>8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    bench_memory_per_row(MEMORY_ROWS)
+
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_MB
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, *(2**i for i in range(1, cpu_count.bit_length()) if 2**i <= cpu_count), cpu_count})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "synthetic.csv")
+        total_rows = generate_csv(csv_path, size_mb)
+        print(f"generated {size_mb} MB, {total_rows} rows, cpu_count={cpu_count}")
+
+        bench_writer(tmp_dir, WRITE_ROWS)
+
+        csv_reader = CsvReader(csv_path)
+        bench_sequential(csv_reader, size_mb)
+        for worker_count in worker_counts:
+            bench_parallel(csv_reader, size_mb, worker_count)
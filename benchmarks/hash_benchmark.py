@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   hash_benchmark.py
+@Date       :   2026/10/18
+@Desc       :   哈希算法吞吐量基准测试
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import os
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pythontools.core.utils.encoding.hash.hashutils import FnvHash, FnvHasher, MetroHash  # noqa: E402
+
+INPUT_SIZES = [8, 64, 1024, 64 * 1024, 1024 * 1024]
+TOTAL_BYTES_PER_CASE = 8 * 1024 * 1024
+MANY_KEYS = 200_000
+
+
+def measure(func: Callable[[], object], total_bytes: int) -> float:
+    """
+    执行给定函数并返回吞吐量(MB/s)
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return total_bytes / elapsed / 1024 / 1024
+
+
+def legacy_fnv_hash_64(data: memoryview) -> int:
+    """
+    旧版 FnvHash 的逐字符实现, 仅用于对比
+    """
+    hash_value = FnvHash.k64_offset
+    for char in bytes(data).decode("utf-8", errors="replace"):
+        hash_value ^= ord(char)
+        hash_value = (hash_value << 7) ^ (hash_value >> 57) ^ FnvHash.k64_prime
+        hash_value &= 0xFFFFFFFFFFFFFFFF
+    return hash_value
+
+
+def bench_single(name: str, hash_func: Callable[[memoryview], int]) -> None:
+    for size in INPUT_SIZES:
+        data = memoryview(os.urandom(size))
+        rounds = max(1, TOTAL_BYTES_PER_CASE // size)
+
+        def run(data=data, rounds=rounds) -> None:
+            for _ in range(rounds):
+                hash_func(data)
+
+        print(f"{name:<24} size={size:>8}  {measure(run, size * rounds):>10.2f} MB/s")
+
+
+def bench_fnv_streaming() -> None:
+    chunk = os.urandom(1024 * 1024)
+    rounds = 4
+
+    def run() -> None:
+        hasher = FnvHasher(64)
+        for _ in range(rounds):
+            hasher.update(chunk)
+
+    print(f"{'FnvHasher(64).update':<24} size={len(chunk):>8}  {measure(run, len(chunk) * rounds):>10.2f} MB/s")
+
+
+def bench_fnv_many() -> None:
+    keys = [os.urandom(16) for _ in range(MANY_KEYS)]
+    fnv = FnvHash()
+    start = time.perf_counter()
+    fnv.hash_many(keys)
+    elapsed = time.perf_counter() - start
+    print(f"FnvHash.hash_many(64)    keys={MANY_KEYS}  {MANY_KEYS / elapsed:>12.0f} keys/s")
+
+    start = time.perf_counter()
+    for key in keys:
+        fnv.hash_64(key)
+    elapsed = time.perf_counter() - start
+    print(f"FnvHash.hash_64 loop     keys={MANY_KEYS}  {MANY_KEYS / elapsed:>12.0f} keys/s")
+
+
+def bench_many(bits: int) -> None:
+    keys = [os.urandom(16) for _ in range(MANY_KEYS)]
+    start = time.perf_counter()
+    MetroHash.hash_many(keys, bits=bits)
+    elapsed = time.perf_counter() - start
+    print(f"MetroHash.hash_many({bits:<3}) keys={MANY_KEYS}  {MANY_KEYS / elapsed:>12.0f} keys/s")
+
+
+if __name__ == "__main__":
+    bench_single("MetroHash.hash_64", MetroHash.hash_64)
+    bench_single("MetroHash.hash_128", MetroHash.hash_128)
+    bench_many(64)
+    bench_many(128)
+    bench_single("legacy FnvHash.hash_64", legacy_fnv_hash_64)
+    bench_single("FnvHash.hash_64", FnvHash().hash_64)
+    bench_fnv_streaming()
+    bench_fnv_many()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   log_benchmark.py
+@Date       :   2026/10/18
+@Desc       :   回溯日志函数的基准测试
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import logging
+import os
+import sys
+import tempfile
+import threading
+import timeit
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pythontools.core import log  # noqa: E402
+
+CALLS = 200_000
+
+
+def legacy_backtrace_debug(msg, back_trace_len=0):
+    """
+    旧版实现: 先逐层获取栈帧拼接回溯信息, 再交给 logger 判断级别, 仅用于对比
+    """
+    temp_msg = (
+        f" * {os.getpid()}:{threading.current_thread().ident} "
+        f"{os.path.basename(sys._getframe(1 + back_trace_len).f_code.co_filename)}:"
+        f"{sys._getframe(1 + back_trace_len).f_lineno}]"
+    )
+    logging.getLogger().debug(f"{temp_msg}{msg}")
+
+
+def bench(name: str, func: Callable[[], None], calls: int = CALLS) -> None:
+    elapsed = min(timeit.repeat(func, number=calls, repeat=3))
+    print(f"{name:<36} {elapsed / calls * 1e9:>10.0f} ns/call")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log.init_comlog("benchmark", loglevel=log.INFO, logfile=os.path.join(tmp_dir, "benchmark.log"))
+
+        # 级别未启用: 应当只剩一次级别判断
+        bench("logging.debug (disabled)", lambda: logging.debug("message"))
+        bench("legacy backtrace_debug (disabled)", lambda: legacy_backtrace_debug("message"))
+        bench("backtrace_debug (disabled)", lambda: log.backtrace_debug("message"))
+        bench("debug_if (disabled)", lambda: log.debug_if(True, "message"))
+
+        # 级别已启用: 包含回溯信息、格式化与文件写入
+        bench("logging.info (enabled)", lambda: logging.info("message"), CALLS // 10)
+        bench("backtrace_info (enabled)", lambda: log.backtrace_info("message"), CALLS // 10)
@@ -14,16 +14,497 @@ Change Activity:
 """
 
 # here put the import lib
+import copy
+import functools
 import os
-import tempfile
+import shutil
+import struct
+import uuid
 import zipfile
-from datetime import datetime
+import zlib
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from os import PathLike
 from pathlib import Path
-from zipfile import ZipInfo
+from typing import IO, Any, BinaryIO, TypeVar
+from zipfile import ZipFile, ZipInfo
 
-from pythontools.core.io.fileutils import FileUtil
-from pythontools.core.utils.basicutils import StringUtil
+from pythontools.io.fileutils import FileUtil
+
+_T = TypeVar("_T")
+
+# 只含 BFINAL 标志的空 deflate 块, 用于结束由多个同步刷新块拼接而成的数据流
+_DEFLATE_FINAL_BLOCK = zlib.compressobj(wbits=-zlib.MAX_WBITS).flush()
+# deflate 回溯窗口大小, 每个块使用前一个块末尾的窗口作为预设字典
+_DEFLATE_WINDOW_SIZE = 1 << zlib.MAX_WBITS
+# 本地文件头中的 "使用数据描述符" 标志位
+_MASK_USE_DATA_DESCRIPTOR = 0x08
+# 文件名使用 UTF-8 编码的标志位
+_MASK_UTF_FILENAME = 0x800
+# 加密、压缩补丁数据和强加密标志位, 带有这些标志的成员只能通过 ZipFile.open 读取
+_MASK_UNSUPPORTED_BY_RAW_READ = 0x01 | 0x20 | 0x40
+
+
+def _deflate_block(data: bytes, level: int, zdict: bytes) -> bytes:
+    """
+    将一个数据块压缩为不带结束标志的原始 deflate 数据, 多个块按顺序拼接后仍是合法的 deflate 数据流
+    """
+    if zdict:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def _prefetch(iterable: Iterable[_T], size: int) -> Generator[_T, None, None]:
+    """
+    提前从 iterable 中取出 size 个元素, 使生产者提交的任务与消费者的写入重叠进行
+    """
+    buffer: deque[_T] = deque()
+    for item in iterable:
+        buffer.append(item)
+        if len(buffer) > size:
+            yield buffer.popleft()
+    yield from buffer
+
+
+class _ZipInternals:
+    """
+    对 zipfile 私有成员的所有访问都集中在这里
+
+    Notes
+    -----
+    直接复制压缩数据需要绕过 ZipFile 的公开接口: 写入时要读写 _writing、_writecheck、_didModify、start_dir 和
+    _seekable, 读取时要用 _FH_* 常量解析本地文件头并构造 ZipExtFile。这些成员在 3.11 ~ 3.13 中保持不变,
+    但不属于公开接口; 调用方先通过 can_write_raw / can_read_raw 检测, 不满足时退回到只使用公开接口的实现。
+    """
+
+    WRITE_ATTRS = ("_writing", "_writecheck", "_didModify", "start_dir", "_seekable")
+    READ_ATTRS = (
+        "_FH_FILENAME_LENGTH",
+        "_FH_EXTRA_FIELD_LENGTH",
+        "_FH_GENERAL_PURPOSE_FLAG_BITS",
+        "ZipExtFile",
+        "structFileHeader",
+        "sizeFileHeader",
+    )
+
+    @classmethod
+    def can_write_raw(cls, zf: ZipFile) -> bool:
+        return all(hasattr(zf, name) for name in cls.WRITE_ATTRS) and bool(zf._seekable)  # type: ignore
+
+    @classmethod
+    def can_read_raw(cls) -> bool:
+        return all(hasattr(zipfile, name) for name in cls.READ_ATTRS)
+
+    @classmethod
+    def get_central_directory_offset(cls, zf: ZipFile) -> int:
+        return zf.start_dir  # type: ignore
+
+    @classmethod
+    def begin_entry(cls, zf: ZipFile, zinfo: ZipInfo) -> None:
+        """
+        定位到中央目录的起始位置并占用写入句柄, zinfo.header_offset 被设置为新成员的偏移
+        """
+        if zf._writing:  # type: ignore
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it")
+        zf._writecheck(zinfo)  # type: ignore
+        zf._didModify = True  # type: ignore
+        zf.fp.seek(zf.start_dir)  # type: ignore
+        zinfo.header_offset = zf.fp.tell()  # type: ignore
+        zf._writing = True  # type: ignore
+
+    @classmethod
+    def finish_entry(cls, zf: ZipFile, zinfo: ZipInfo) -> None:
+        """
+        登记已经写完的成员并释放写入句柄, 当前位置即为中央目录新的起始位置
+        """
+        try:
+            zf.start_dir = zf.fp.tell()  # type: ignore
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[zinfo.filename] = zinfo
+        finally:
+            zf._writing = False  # type: ignore
+
+    @classmethod
+    def abort_entry(cls, zf: ZipFile) -> None:
+        zf._writing = False  # type: ignore
+
+    @classmethod
+    def open_member_data(cls, f: BinaryIO, zinfo: ZipInfo) -> IO[bytes] | None:
+        """
+        解析本地文件头, 跳过文件名和扩展字段后在 f 上构造解压流, 关闭解压流时同时关闭 f;
+        加密、使用未支持特性或本地文件头中的文件名与 zinfo 不一致时返回 None, 交给 ZipFile.open 处理
+        """
+        if zinfo.flag_bits & _MASK_UNSUPPORTED_BY_RAW_READ:
+            return None
+
+        f.seek(zinfo.header_offset)
+        fheader = f.read(zipfile.sizeFileHeader)
+        if len(fheader) != zipfile.sizeFileHeader or not fheader.startswith(zipfile.stringFileHeader):
+            raise zipfile.BadZipFile(f"Bad magic number for file header of {zinfo.filename!r}")
+        fheader_fields = struct.unpack(zipfile.structFileHeader, fheader)
+        fname = f.read(fheader_fields[zipfile._FH_FILENAME_LENGTH])  # type: ignore
+        # 与 ZipFile.open 一样按 UTF-8 标志位解码后与中央目录中的文件名比较
+        is_utf8 = fheader_fields[zipfile._FH_GENERAL_PURPOSE_FLAG_BITS] & _MASK_UTF_FILENAME  # type: ignore
+        if fname.decode("utf-8" if is_utf8 else "cp437", "replace") != zinfo.orig_filename:
+            return None
+        f.seek(fheader_fields[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)  # type: ignore
+        return zipfile.ZipExtFile(f, "r", zinfo, None, True)
+
+
+class _RawEntryWriter:
+    """
+    向 ZipFile 写入已经压缩好的成员数据, 关闭时回写本地文件头中的 CRC 和大小
+
+    Notes
+    -----
+    按照 ZipFile._open_to_write 与 _ZipWriteFile.close 的流程直接写底层文件, 要求 _ZipInternals.can_write_raw(zf)。
+    """
+
+    def __init__(self, zf: ZipFile, zinfo: ZipInfo) -> None:
+        self._zf = zf
+        self._zinfo = zinfo
+        self._zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        self._compress_size = 0
+
+        zinfo.CRC = 0
+        zinfo.compress_size = 0
+        zinfo.flag_bits &= ~_MASK_USE_DATA_DESCRIPTOR
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+        _ZipInternals.begin_entry(zf, zinfo)
+        try:
+            zf.fp.write(zinfo.FileHeader(self._zip64))  # type: ignore
+        except BaseException:
+            _ZipInternals.abort_entry(zf)
+            raise
+
+    def abort(self) -> None:
+        """
+        放弃当前成员, 使 ZipFile 可以正常关闭
+        """
+        _ZipInternals.abort_entry(self._zf)
+
+    def write(self, data: bytes) -> None:
+        self._zf.fp.write(data)  # type: ignore
+        self._compress_size += len(data)
+
+    def close(self, crc: int, file_size: int) -> None:
+        zf, zinfo = self._zf, self._zinfo
+        try:
+            if not self._zip64 and (file_size > zipfile.ZIP64_LIMIT or self._compress_size > zipfile.ZIP64_LIMIT):
+                raise RuntimeError("File size too large, try using force_zip64")
+
+            zinfo.CRC = crc
+            zinfo.file_size = file_size
+            zinfo.compress_size = self._compress_size
+            end = zf.fp.tell()  # type: ignore
+            zf.fp.seek(zinfo.header_offset)  # type: ignore
+            zf.fp.write(zinfo.FileHeader(self._zip64))  # type: ignore
+            zf.fp.seek(end)  # type: ignore
+        except BaseException:
+            _ZipInternals.abort_entry(zf)
+            raise
+        _ZipInternals.finish_entry(zf, zinfo)
+
+
+def _copy_raw_entry(zf: ZipFile, src: BinaryIO, zinfo: ZipInfo, length: int, buffer: bytearray) -> None:
+    """
+    将源归档中从 zinfo.header_offset 开始、长度为 length 的本地文件头、压缩数据和数据描述符原样复制到 zf
+    """
+    dest_info = copy.copy(zinfo)
+    _ZipInternals.begin_entry(zf, dest_info)
+    try:
+        view = memoryview(buffer)
+        src.seek(zinfo.header_offset)
+        while length > 0:
+            n = src.readinto(view[: min(length, len(view))])
+            if not n:
+                raise zipfile.BadZipFile(f"Truncated entry {zinfo.filename!r} in zip archive")
+            zf.fp.write(view[:n])  # type: ignore
+            length -= n
+    except BaseException:
+        _ZipInternals.abort_entry(zf)
+        raise
+    _ZipInternals.finish_entry(zf, dest_info)
+
+
+def _copy_entry(zip_in: ZipFile, zip_out: ZipFile, zinfo: ZipInfo, buffer_size: int) -> None:
+    """
+    只使用公开接口, 解压后重新压缩复制一个成员
+    """
+    force_zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+    with zip_in.open(zinfo) as src, zip_out.open(copy.copy(zinfo), "w", force_zip64=force_zip64) as dest:
+        shutil.copyfileobj(src, dest, buffer_size)
+
+
+def _open_member(zip_path: str, zinfo: ZipInfo) -> IO[bytes]:
+    """
+    根据 zinfo 中的偏移直接打开成员数据, 不需要重新解析中央目录
+    """
+    if _ZipInternals.can_read_raw():
+        f = open(zip_path, "rb")
+        try:
+            member = _ZipInternals.open_member_data(f, zinfo)
+        except BaseException:
+            f.close()
+            raise
+        if member is not None:
+            return member
+        f.close()
+
+    # ZipFile.open 负责完整的校验, 例如加密成员会抛出 RuntimeError;
+    # ZipExtFile 持有底层文件的引用, 关闭 ZipFile 后仍然可以读取
+    with ZipFile(zip_path, "r") as z:
+        return z.open(zinfo)
+
+
+def _extract_member(zip_path: str, zinfo: ZipInfo, target: str) -> None:
+    with _open_member(zip_path, zinfo) as src, open(target, "wb") as dest:
+        shutil.copyfileobj(src, dest, ZipIndex.COPY_BUFFER_SIZE)
+
+
+class ZipIndex:
+    """
+    归档文件的成员索引, 保存 成员名称 -> ZipInfo 的映射, 按 路径、大小和修改时间缓存
+
+    Attributes
+    ----------
+    path : str
+        归档文件的绝对路径
+    size : int
+        建立索引时归档文件的大小
+    mtime_ns : int
+        建立索引时归档文件的修改时间(纳秒)
+
+    Methods
+    -------
+    of(zip_file: str | PathLike) -> ZipIndex
+        获取归档文件的索引, 文件未变化时直接返回缓存
+    get_info(name: str) -> ZipInfo
+        获取成员信息
+    infolist() -> list[ZipInfo]
+        按归档顺序返回成员信息
+    open_member(name: str) -> IO[bytes]
+        以流的方式打开成员
+    read(name: str) -> bytes
+        读取成员的全部内容
+    extract_all(path: str | PathLike, **kwargs) -> Path
+        按成员大小从大到小并行解压
+
+    Notes
+    -----
+    open_member 每次使用独立的文件句柄, 根据索引中的偏移直接定位成员数据, 既不需要重新解析中央目录,
+    也不会在多个线程之间争用 ZipFile 内部的锁。
+
+    Examples:
+    ----------
+    >>> index = ZipIndex.of("assets.zip")  # doctest: +SKIP
+    >>> with index.open_member("images/logo.png") as f:  # doctest: +SKIP
+    ...     header = f.read(8)
+    """
+
+    COPY_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, zip_file: str | PathLike) -> None:
+        self.path = os.path.abspath(zip_file)
+        stat = os.stat(self.path)
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        with ZipFile(self.path, "r") as z:
+            self._infos = z.infolist()
+            self._name_to_info = dict(z.NameToInfo)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._name_to_info
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._name_to_info)
+
+    @classmethod
+    def of(cls, zip_file: str | PathLike) -> "ZipIndex":
+        """
+        获取归档文件的索引, 文件的大小和修改时间未变化时直接返回缓存
+
+        Parameters
+        ----------
+        zip_file : str | PathLike
+            归档文件
+
+        Returns
+        -------
+        ZipIndex
+            归档文件的索引
+        """
+        path_str = os.path.abspath(zip_file)
+        stat = os.stat(path_str)
+        return cls._get_cached_index(path_str, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_cached_index(cls, path_str: str, size: int, mtime_ns: int) -> "ZipIndex":
+        # 以文件大小和修改时间作为缓存键, 文件变化后旧的索引自然失效
+        return cls(path_str)
+
+    def get_info(self, name: str) -> ZipInfo:
+        """
+        获取成员信息
+
+        Parameters
+        ----------
+        name : str
+            成员名称
+
+        Returns
+        -------
+        ZipInfo
+            成员信息
+
+        Raises
+        ------
+        KeyError
+            如果成员不存在, 则抛出 KeyError
+        """
+        try:
+            return self._name_to_info[name]
+        except KeyError:
+            raise KeyError(f"There is no item named {name!r} in the archive") from None
+
+    def infolist(self) -> list[ZipInfo]:
+        """
+        按归档顺序返回成员信息
+
+        Returns
+        -------
+        list[ZipInfo]
+            成员信息列表
+        """
+        return list(self._infos)
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """
+        以流的方式打开成员, 返回的文件对象需要由调用方关闭
+
+        Parameters
+        ----------
+        name : str
+            成员名称
+
+        Returns
+        -------
+        IO[bytes]
+            可读的二进制文件对象
+
+        Raises
+        ------
+        KeyError
+            如果成员不存在, 则抛出 KeyError
+        """
+        return _open_member(self.path, self.get_info(name))
+
+    def read(self, name: str) -> bytes:
+        """
+        读取成员的全部内容
+
+        Parameters
+        ----------
+        name : str
+            成员名称
+
+        Returns
+        -------
+        bytes
+            成员内容
+        """
+        with self.open_member(name) as f:
+            return f.read()
+
+    def extract_all(
+        self,
+        path: str | PathLike,
+        *,
+        members: Iterable[str] | None = None,
+        workers: int = 1,
+        use_processes: bool = False,
+    ) -> Path:
+        """
+        解压成员到指定目录, 按成员大小从大到小调度, 避免最大的成员最后才开始
+
+        Parameters
+        ----------
+        path : str | PathLike
+            解压目录路径
+        members : Iterable[str] | None, optional
+            要解压的成员名称, 为 None 时解压全部成员, by default None
+        workers : int, optional
+            并行数, 为 1 时顺序解压, by default 1
+        use_processes : bool, optional
+            是否使用进程池, 默认使用线程池(zlib 解压时会释放 GIL), by default False
+
+        Returns
+        -------
+        Path
+            表示解压目录的 Path 对象
+
+        Raises
+        ------
+        ValueError
+            如果 workers 小于 1, 则抛出 ValueError
+        KeyError
+            如果 members 中的成员不存在, 则抛出 KeyError
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        path_obj = Path(path)
+        infos = self.infolist() if members is None else [self.get_info(name) for name in members]
+        tasks: list[tuple[str, ZipInfo, str]] = []
+        dirs = {os.fspath(path_obj)}
+        for info in infos:
+            target = self._get_target_path(info, path_obj)
+            if target is None:
+                continue
+            if info.is_dir():
+                dirs.add(target)
+                continue
+            dirs.add(os.path.dirname(target))
+            tasks.append((self.path, info, target))
+
+        # 目录在主线程中预先创建, 避免并行任务之间的竞争
+        for dir_path in sorted(dirs):
+            os.makedirs(dir_path, exist_ok=True)
+
+        tasks.sort(key=lambda task: task[1].file_size, reverse=True)
+        if workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                _extract_member(*task)
+            return path_obj
+
+        executor_cls: type[Executor] = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            for _ in executor.map(_extract_member, *zip(*tasks)):
+                pass
+        return path_obj
+
+    @staticmethod
+    def _get_target_path(zinfo: ZipInfo, root: Path) -> str | None:
+        # 与 ZipFile._extract_member 相同: 去掉盘符、绝对路径、"." 和 "..", 防止写到解压目录之外
+        arcname = zinfo.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        invalid_path_parts = ("", os.path.curdir, os.path.pardir)
+        arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid_path_parts)
+        if os.path.sep == "\\":
+            arcname = ZipFile._sanitize_windows_name(arcname, os.path.sep)  # type: ignore
+        if not arcname:
+            return None
+        return os.path.join(root, arcname)
 
 
 class ZipUtil:
@@ -36,12 +517,14 @@ class ZipUtil:
 
     Methods
     -------
+    update_zip(zip_file: str | PathLike, replacements=None, removals=(), **kwargs) -> Path
+        一次性批量替换、新增和删除归档文件中的成员, 未修改的成员直接复制压缩数据
     replace_zip_data(zip_file: str, filename: str, data: str) -> None
         替换归档文件的内容
-    zip_dir(dir_path: str | PathLike, zip_name: str) -> Path
-        压缩一个目录
-    unzip_to_dir(zip_name: str | PathLike, path: str | PathLike) -> Path
-        解压 zip 到指定目录
+    zip_dir(dir_path: str | PathLike, zip_name: str | PathLike, **kwargs) -> Path
+        流式并行地压缩一个目录
+    unzip_to_dir(zip_name: str | PathLike, path: str | PathLike, **kwargs) -> Path
+        解压 zip 到指定目录, 支持并行解压
     remove_from_zip(zip_file: str | PathLike[str], filename: str | PathLike[str]) -> Path
         从归档文件中删除指定文件
     get_zip_infolist(zip_file) -> list[ZipInfo]
@@ -54,6 +537,96 @@ class ZipUtil:
     ref: https://gist.github.com/UmbrellaBurns/284a27690bad2a87d22201445b25ca6a
     """
 
+    BLOCK_SIZE = 1024 * 1024
+    DEFAULT_COMPRESS_LEVEL = 6
+    # 本身已经压缩过的格式, 再次 deflate 几乎没有收益, 直接以 ZIP_STORED 存储
+    STORED_EXTENSIONS = frozenset(
+        {
+            ".7z", ".aac", ".avi", ".br", ".bz2", ".docx", ".flac", ".gif", ".gz", ".jar", ".jpeg", ".jpg",
+            ".lz4", ".lzma", ".mkv", ".mov", ".mp3", ".mp4", ".ogg", ".png", ".pptx", ".rar", ".tgz", ".webm",
+            ".webp", ".whl", ".xlsx", ".xz", ".zip", ".zst",
+        }
+    )  # fmt: skip
+
+    @classmethod
+    def update_zip(
+        cls,
+        zip_file: str | PathLike,
+        replacements: Mapping[str, str | bytes | PathLike] | None = None,
+        removals: Iterable[str] = (),
+        *,
+        compression: int = zipfile.ZIP_DEFLATED,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        buffer_size: int = BLOCK_SIZE,
+    ) -> Path:
+        """
+        一次性批量替换、新增和删除归档文件中的成员
+
+        Parameters
+        ----------
+        zip_file : str | PathLike
+            归档文件
+        replacements : Mapping[str, str | bytes | PathLike] | None, optional
+            成员名称 -> 新内容, str 按 UTF-8 编码, PathLike 表示从该文件流式写入;
+            不存在的成员会被追加到归档末尾, by default None
+        removals : Iterable[str], optional
+            要删除的成员名称, 不存在的名称会被忽略, by default ()
+        compression : int, optional
+            新写入成员的压缩方法, by default zipfile.ZIP_DEFLATED
+        compress_level : int, optional
+            新写入成员的压缩级别, by default 6
+        buffer_size : int, optional
+            复制时使用的缓冲区大小, by default 1 MiB
+
+        Returns
+        -------
+        Path
+            表示归档文件的 Path 对象
+
+        Notes
+        -----
+        未修改的成员不会解压和重新压缩: 按照中央目录中的偏移, 将其本地文件头、压缩数据和数据描述符原样复制到
+        同目录下的临时文件, 之后写入替换内容, 最后通过 os.replace 原子地替换原归档文件。
+        修改大归档中的少量成员时耗时只取决于顺序复制的速度。
+        """
+        path_obj = Path(zip_file)
+        replacements = replacements or {}
+        skipped = set(replacements).union(removals)
+        tmp_path = path_obj.with_name(f".{path_obj.name}.{uuid.uuid4().hex}.tmp")
+        buffer = bytearray(buffer_size)
+
+        try:
+            with (
+                ZipFile(path_obj, "r") as zip_in,
+                open(path_obj, "rb") as src,
+                open(tmp_path, "xb") as dest,
+                ZipFile(dest, "w", allowZip64=True) as zip_out,
+            ):
+                kept = [info for info in zip_in.infolist() if info.filename not in skipped]
+                if _ZipInternals.can_write_raw(zip_out):
+                    # 每个成员占据的字节范围延伸到下一个成员的本地文件头或中央目录的起始位置
+                    central_directory_offset = _ZipInternals.get_central_directory_offset(zip_in)
+                    boundaries = sorted({info.header_offset for info in zip_in.infolist()} | {central_directory_offset})
+                    next_offsets = dict(zip(boundaries, boundaries[1:]))
+                    for info in kept:
+                        length = next_offsets[info.header_offset] - info.header_offset
+                        _copy_raw_entry(zip_out, src, info, length, buffer)
+                else:
+                    for info in kept:
+                        _copy_entry(zip_in, zip_out, info, buffer_size)
+
+                for filename, data in replacements.items():
+                    if isinstance(data, PathLike):
+                        zip_out.write(data, filename, compress_type=compression, compresslevel=compress_level)
+                    else:
+                        zip_out.writestr(filename, data, compress_type=compression, compresslevel=compress_level)
+            os.replace(tmp_path, path_obj)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return path_obj
+
     @classmethod
     def replace_zip_data(cls, zip_file: str, filename: str, data: str) -> None:
         """
@@ -68,36 +641,42 @@ class ZipUtil:
         data : str
             替换数据
         """
-        # 1. 构建临时文件
-        now = datetime.now().strftime("%d.%m.%y_%I.%M")
-        temp_zip = os.path.join(tempfile.gettempdir(), zip_file.replace(".", f"_{now}."))
-
-        # 2. 将非替换内容写入到临时文件
-        with zipfile.ZipFile(zip_file, "r") as zip_in, zipfile.ZipFile(temp_zip, "w") as zip_out:
-            for item in zip_in.infolist():
-                file_data = zip_in.read(item.filename)
-                if StringUtil.not_equals(item.filename, filename):
-                    zip_out.writestr(item, file_data)
-
-        # 3. 删除旧的归档文件，重命名临时文件->归档文件
-        os.remove(zip_file)
-        os.rename(temp_zip, zip_file)
-
-        # 4. 写入替换内容到归档文件
-        with zipfile.ZipFile(zip_file, "a", compression=zipfile.ZIP_DEFLATED) as z:
-            z.writestr(filename, data)
+        cls.update_zip(zip_file, {filename: data})
 
     @classmethod
-    def zip_dir(cls, dir_path: str | PathLike, zip_name: str) -> Path:
+    def zip_dir(
+        cls,
+        dir_path: str | PathLike,
+        zip_name: str | PathLike,
+        *,
+        compression: int = zipfile.ZIP_DEFLATED,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        workers: int | None = None,
+        block_size: int = BLOCK_SIZE,
+        stored_extensions: Iterable[str] = STORED_EXTENSIONS,
+        **walk_kwargs: Any,
+    ) -> Path:
         """
-        压缩一个目录
+        流式并行地压缩一个目录, 文件按块读取, 不会整体读入内存
 
         Parameters
         ----------
         dir_path : str | PathLike
             目录路径
-        zip_name : str
+        zip_name : str | PathLike
             归档文件名称
+        compression : int, optional
+            压缩方法, by default zipfile.ZIP_DEFLATED
+        compress_level : int, optional
+            压缩级别, by default 6
+        workers : int | None, optional
+            压缩线程数, 为 None 时使用 CPU 核数, by default None
+        block_size : int, optional
+            每次读取和并行压缩的块大小, by default 1 MiB
+        stored_extensions : Iterable[str], optional
+            直接以 ZIP_STORED 存储的扩展名, by default STORED_EXTENSIONS
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件
 
         Returns
         -------
@@ -107,26 +686,122 @@ class ZipUtil:
         Raises
         ------
         ValueError
-            如果 dir_path 不是一个有效的目录, 则抛出 ValueError
+            如果 dir_path 不是一个有效的目录或 workers 小于 1, 则抛出 ValueError
+
+        Notes
+        -----
+        ZIP_DEFLATED 成员按块在线程池中压缩: 每个块以同步刷新结束并使用前一个块末尾 32 KiB 作为预设字典,
+        按原始顺序拼接后再追加一个结束块, 得到与单线程压缩兼容的 deflate 数据流, 压缩率几乎不受影响;
+        zlib 在压缩时会释放 GIL, 因此可以利用多核。其他压缩方法按顺序流式写入。
         """
-        zip_path_obj = Path(zip_name)
-        if not FileUtil.is_dir(zip_path_obj):
-        if not FileUtil.is_dir(zip_path_obj):
+        dir_path_obj = Path(dir_path)
+        if not FileUtil.is_dir(dir_path_obj):
             raise ValueError("Must give a valid directory")
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        stored_extension_set = {extension.lower() for extension in stored_extensions}
+        zinfo_lst: list[tuple[str, ZipInfo]] = []
+        for entry in FileUtil.walk(dir_path_obj, **walk_kwargs):
+            arcname = os.path.relpath(entry.path, dir_path_obj)
+            zinfo = ZipInfo.from_file(entry.path, arcname, strict_timestamps=False)
+            is_stored = os.path.splitext(entry.name)[1].lower() in stored_extension_set
+            zinfo.compress_type = zipfile.ZIP_STORED if is_stored else compression
+            zinfo_lst.append((entry.path, zinfo))
+        zinfo_lst.sort(key=lambda item: item[1].filename)
 
-        with zipfile.ZipFile(zip_path_obj, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as z:
-            path_obj_lst = FileUtil.list_files(dir_path)
-            path_obj_lst = FileUtil.list_files(dir_path)
-            for p in path_obj_lst:
-                z.write(p, p.relative_to(dir_path))
+        zip_path_obj = Path(zip_name)
+        try:
+            with (
+                ZipFile(zip_path_obj, "w", allowZip64=True, strict_timestamps=False) as z,
+                ThreadPoolExecutor(max_workers=workers) as executor,
+            ):
+                if _ZipInternals.can_write_raw(z):
+                    cls._write_entries(z, executor, zinfo_lst, compress_level, block_size, workers * 2)
+                else:
+                    for path, zinfo in zinfo_lst:
+                        z.write(path, zinfo.filename, compress_type=zinfo.compress_type, compresslevel=compress_level)
+        except BaseException:
+            zip_path_obj.unlink(missing_ok=True)
+            raise
 
         return zip_path_obj
 
+    @classmethod
+    def _write_entries(
+        cls,
+        z: ZipFile,
+        executor: ThreadPoolExecutor,
+        zinfo_lst: list[tuple[str, ZipInfo]],
+        compress_level: int,
+        block_size: int,
+        prefetch_size: int,
+    ) -> None:
+        writer: _RawEntryWriter | None = None
+        crc = file_size = 0
+        blocks = cls._iter_blocks(executor, zinfo_lst, compress_level, block_size)
+        try:
+            for zinfo, path, raw, compressed in _prefetch(blocks, prefetch_size):
+                if zinfo is None:
+                    crc = zlib.crc32(raw, crc)
+                    file_size += len(raw)
+                    writer.write(compressed.result() if isinstance(compressed, Future) else compressed)  # type: ignore
+                    continue
+
+                if writer is not None:
+                    writer.close(crc, file_size)
+                    writer = None
+                if zinfo.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                    writer = _RawEntryWriter(z, zinfo)
+                    crc = file_size = 0
+                else:
+                    # ZipFile.open 不会为传入的 ZipInfo 设置压缩级别, 由 write 负责在各版本上设置
+                    z.write(path, zinfo.filename, compress_type=zinfo.compress_type, compresslevel=compress_level)  # type: ignore
+            if writer is not None:
+                writer.close(crc, file_size)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+    @classmethod
+    def _iter_blocks(
+        cls,
+        executor: ThreadPoolExecutor,
+        zinfo_lst: list[tuple[str, ZipInfo]],
+        compress_level: int,
+        block_size: int,
+    ) -> Generator[tuple[ZipInfo | None, str | None, bytes, "Future[bytes] | bytes"], None, None]:
+        """
+        按归档顺序生成 (成员信息, 路径, b"", b"") 和 (None, None, 原始数据, 压缩数据) 两种元素,
+        deflate 块在生成时即提交到线程池
+        """
+        for path, zinfo in zinfo_lst:
+            yield zinfo, path, b"", b""
+            if zinfo.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                continue
+
+            is_deflated = zinfo.compress_type == zipfile.ZIP_DEFLATED
+            zdict = b""
+            with open(path, "rb") as f:
+                while block := f.read(block_size):
+                    if is_deflated:
+                        yield None, None, block, executor.submit(_deflate_block, block, compress_level, zdict)
+                        zdict = block[-_DEFLATE_WINDOW_SIZE:]
+                    else:
+                        yield None, None, block, block
+            if is_deflated:
+                yield None, None, b"", _DEFLATE_FINAL_BLOCK
+
     @classmethod
     def unzip_to_dir(
         cls,
         zip_name: str | PathLike,
         path: str | PathLike,
+        *,
+        workers: int = 1,
+        use_processes: bool = False,
     ) -> Path:
         """
         解压 zip 到指定目录
@@ -137,18 +812,17 @@ class ZipUtil:
             归档文件名称
         path : str | PathLike
             解压目录路径
+        workers : int, optional
+            并行数, 为 1 时顺序解压, by default 1
+        use_processes : bool, optional
+            是否使用进程池, by default False
 
         Returns
         -------
         Path
             表示解压目录的 Path 对象
         """
-        path_obj = Path(path)
-        with zipfile.ZipFile(path_obj, "r") as z:
-            for item in z.infolist():
-                z.extract(item, path)
-
-        return path_obj
+        return ZipIndex.of(zip_name).extract_all(path, workers=workers, use_processes=use_processes)
 
     @classmethod
     def remove_from_zip(cls, zip_file: str | PathLike[str], filename: str | PathLike[str]) -> Path:
@@ -167,34 +841,16 @@ class ZipUtil:
         Path
             表示归档文件的 Path 对象
         """
-        if isinstance(zip_file, PathLike):
-            zip_file = str(zip_file)
-
-        if isinstance(filename, PathLike):
-            filename = str(filename)
-
-        now = datetime.now().strftime("%d.%m.%y_%I.%M")
-        temp_zip = os.path.join(tempfile.gettempdir(), zip_file.replace(".", f"_{now}."))
-
-        with zipfile.ZipFile(zip_file, "r") as zip_in, zipfile.ZipFile(temp_zip, "w") as zip_out:
-            for item in zip_in.infolist():
-                file_data = zip_in.read(item.filename)
-                if StringUtil.not_equals(item.filename, filename):
-                    zip_out.writestr(item, file_data)
-
-        os.remove(zip_file)
-        os.rename(temp_zip, zip_file)
-
-        return Path(zip_file)
+        return cls.update_zip(zip_file, removals=[os.fspath(filename)])
 
     @classmethod
-    def get_zip_infolist(cls, zip_file) -> list[ZipInfo]:
+    def get_zip_infolist(cls, zip_file: str | PathLike) -> list[ZipInfo]:
         """
         获取压缩文件列表
 
         Parameters
         ----------
-        zip_file : _type_
+        zip_file : str | PathLike
             给定的归档文件
 
         Returns
@@ -202,11 +858,7 @@ class ZipUtil:
         list[ZipInfo]
             压缩文件列表
         """
-
-        with zipfile.ZipFile(zip_file, "r") as zip_in:
-            files_list: list[ZipInfo] = zip_in.infolist()
-
-        return files_list
+        return ZipIndex.of(zip_file).infolist()
 
     @classmethod
     def get_from_zip(
@@ -225,7 +877,7 @@ class ZipUtil:
         target_file : str | PathLike[str]
             目标文件名称
         mode : str, optional
-            读取模式, by default "r"
+            仅为兼容保留, 成员总是以只读方式读取, by default "r"
 
         Returns
         -------
@@ -240,8 +892,8 @@ class ZipUtil:
         if isinstance(target_file, PathLike):
             target_file = str(target_file)
 
-        with zipfile.ZipFile(zip_file, mode=mode) as z:
-            if target_file not in [x.filename for x in z.infolist()]:
-                raise AttributeError(f"File {target_file} does not exists in zip archive")
+        index = ZipIndex.of(zip_file)
+        if target_file not in index:
+            raise AttributeError(f"File {target_file} does not exists in zip archive")
 
-            return z.read(target_file)
+        return index.read(target_file)
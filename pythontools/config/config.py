@@ -15,17 +15,22 @@ Change Activity:
 # here put the import lib
 
 import enum
+import functools
 import json
+import os
 import threading
 import typing
 import warnings
+from collections.abc import Callable, Mapping
 from copy import deepcopy
+from types import MappingProxyType
 
 from pythontools.core.constants.string_constant import AutoName
 from pythontools.core.utils.basic_utils import BooleanUtil, StringUtil
 from pythontools.io.fileutils import FileUtil
 
 ConfigItemValue = int | float | str | bool
+DEFAULT_POLL_INTERVAL = 1.0
 
 
 class ConfigType(AutoName):
@@ -300,24 +305,295 @@ BASIC_CONFIG_ITEMS: list[BaseConfigItem] = [
 ]
 
 
+class ConfigSnapshot(typing.NamedTuple):
+    """
+    某一时刻全部配置值的不可变快照
+
+    Attributes
+    ----------
+    version : int
+        快照版本号, 每次发布新快照时加一
+    basic : Mapping[str, ConfigItemValue]
+        基础配置项名称 -> 值
+    customer : Mapping[str, typing.Any]
+        用户自定义配置项名称 -> 值
+    """
+
+    version: int
+    basic: Mapping[str, ConfigItemValue]
+    customer: Mapping[str, typing.Any]
+
+    def get_changed_keys(self, other: "ConfigSnapshot") -> frozenset[str]:
+        """
+        与另一个快照比较, 返回值不同或只存在于其中一个快照中的配置项名称
+
+        Parameters
+        ----------
+        other : ConfigSnapshot
+            另一个快照
+
+        Returns
+        -------
+        frozenset[str]
+            发生变化的配置项名称
+        """
+        changed = set()
+        for mine, theirs in ((self.basic, other.basic), (self.customer, other.customer)):
+            changed.update(key for key in mine.keys() | theirs.keys() if mine.get(key) != theirs.get(key))
+        return frozenset(changed)
+
+
+ConfigChangeCallback = Callable[[ConfigSnapshot, frozenset[str]], None]
+
+
+_MISSING = object()
+
+
+def flatten_dict(data: Mapping[str, typing.Any], sep: str = ".") -> dict[str, typing.Any]:
+    """
+    将嵌套字典展平为以点号分隔路径为键的字典, 列表等非字典的值保持不变
+
+    Example:
+    ----------
+    >>> flatten_dict({"db": {"host": "localhost", "port": 3306}, "debug_enable": True})
+    {'db.host': 'localhost', 'db.port': 3306, 'debug_enable': True}
+
+    Parameters
+    ----------
+    data : Mapping[str, typing.Any]
+        嵌套字典
+    sep : str, optional
+        路径分隔符, by default "."
+
+    Returns
+    -------
+    dict[str, typing.Any]
+        展平后的字典, 空字典会保留为对应路径的值
+    """
+    flat: dict[str, typing.Any] = {}
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, Mapping) and value:
+                stack.append((path + sep, value))
+            else:
+                flat[path] = value
+    return flat
+
+
+def _convert_value(value: typing.Any, value_type: Callable[[typing.Any], typing.Any] | None) -> typing.Any:
+    if value_type is None:
+        return value
+    if value_type is bool and isinstance(value, str):
+        return BooleanUtil.str_to_boolean(value)
+    if isinstance(value_type, type) and isinstance(value, value_type):
+        return value
+    return value_type(value)
+
+
+class FrozenConfig:
+    """
+    基于 __slots__ 的只读配置对象, 点号分隔路径的每一级对应一个属性
+
+    Notes
+    -----
+    每种属性组合对应一个动态生成并缓存的子类, 属性读取是普通的 slot 访问;
+    不是合法标识符、以 "_" 开头或与 FrozenConfig 成员同名的名称只能通过 config["a.b-c"] 形式读取。
+
+    Examples:
+    ----------
+    >>> frozen = config.freeze()  # doctest: +SKIP
+    ... frozen.db.port, frozen["db.port"], frozen.debug_enable
+    """
+
+    __slots__ = ("_values",)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __getitem__(self, path: str) -> typing.Any:
+        return self._values[path]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._values
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {dict(self._values)}>"
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """
+        返回以点号分隔路径为键的字典
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            展平后的配置
+        """
+        return dict(self._values)
+
+    @classmethod
+    def from_flat(cls, values: Mapping[str, typing.Any], sep: str = ".") -> "FrozenConfig":
+        """
+        由展平后的配置构建只读配置对象
+
+        Parameters
+        ----------
+        values : Mapping[str, typing.Any]
+            以点号分隔路径为键的配置
+        sep : str, optional
+            路径分隔符, by default "."
+
+        Returns
+        -------
+        FrozenConfig
+            只读配置对象
+        """
+        leaves: dict[str, typing.Any] = {}
+        children: dict[str, dict[str, typing.Any]] = {}
+        for path, value in values.items():
+            head, _, rest = path.partition(sep)
+            if rest:
+                children.setdefault(head, {})[rest] = value
+            else:
+                leaves[path] = value
+        # 同名的值优先于子路径, 子路径仍可通过 config["a.b"] 读取
+        attrs = {name: cls.from_flat(sub_values, sep) for name, sub_values in children.items() if name not in leaves}
+        attrs.update(leaves)
+        # 以 "_" 开头的名称会被改写或与内部属性冲突, 与方法同名的名称会覆盖方法, 这两类只能通过 config["..."] 读取
+        attrs = {
+            name: value
+            for name, value in attrs.items()
+            if name.isidentifier() and not name.startswith("_") and not hasattr(FrozenConfig, name)
+        }
+
+        obj = object.__new__(_get_frozen_class(tuple(sorted(attrs))))
+        object.__setattr__(obj, "_values", MappingProxyType(dict(values)))
+        for name, value in attrs.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+
+@functools.lru_cache(maxsize=256)
+def _get_frozen_class(names: tuple[str, ...]) -> type[FrozenConfig]:
+    return type(FrozenConfig.__name__, (FrozenConfig,), {"__slots__": names})
+
+
+class ConfigAccessor:
+    """
+    预先解析的配置读取器, 配置快照未变化时直接返回缓存的已转换值
+
+    Attributes
+    ----------
+    path : str
+        配置项名称或点号分隔的路径
+    value_type : Callable[[typing.Any], typing.Any] | None
+        值的转换函数, 如 int、float、bool, None 时不转换
+    default : typing.Any
+        配置项不存在时返回的默认值
+
+    Notes
+    -----
+    缓存保存为 (快照, 值) 元组并整体替换, 多线程读取时不需要加锁; 快照变化后的第一次读取会重新转换。
+    """
+
+    __slots__ = ("_get_snapshot", "_cache", "_key", "_is_basic", "path", "value_type", "default")
+
+    def __init__(
+        self,
+        config: "Configurations",
+        path: str,
+        value_type: Callable[[typing.Any], typing.Any] | None = None,
+        default: typing.Any = _MISSING,
+    ) -> None:
+        self._get_snapshot = config.get_snapshot
+        self.path = path
+        self.value_type = value_type
+        self.default = default
+        snapshot = config.get_snapshot()
+        # 只在创建时判断配置项属于基础配置还是用户自定义配置
+        self._is_basic = path.strip().lower() in snapshot.basic
+        self._key = path.strip().lower() if self._is_basic else path
+        self._cache = (snapshot, self._resolve(snapshot))
+
+    def __call__(self) -> typing.Any:
+        snapshot = self._get_snapshot()
+        cache = self._cache
+        if cache[0] is snapshot:
+            return cache[1]
+        value = self._resolve(snapshot)
+        self._cache = (snapshot, value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"<ConfigAccessor path={self.path} value_type={self.value_type}>"
+
+    def _resolve(self, snapshot: ConfigSnapshot) -> typing.Any:
+        values = snapshot.basic if self._is_basic else snapshot.customer
+        if self._key in values:
+            return _convert_value(values[self._key], self.value_type)
+        if self.default is _MISSING:
+            raise KeyError(f"{self.path} is not a valid config item")
+        return self.default
+
+
 class Configurations:
     """
     配置类
+
+    Notes
+    -----
+    所有配置值保存在一个不可变的 ConfigSnapshot 中, 读取配置时只读取当前快照的引用, 不加任何锁;
+    修改配置或重新加载配置文件时在实例锁内生成新的快照并整体替换, 然后在锁外通知订阅者。
+    开启 watch 后由后台线程轮询配置文件, 文件变化时在后台线程中解析并替换快照, 以配置文件和默认值为准,
+    运行时通过 add_config 等方法设置的值会被覆盖; 解析失败时保留原有配置。
+    配置文件中的嵌套字典在加载时展平为点号分隔的路径, 热点路径中可以使用 accessor 或 freeze 读取配置。
+
+    Examples:
+    ----------
+    >>> config = Configurations("config.json", watch=True)  # doctest: +SKIP
+    ... config.subscribe(lambda snapshot, changed: print(changed))
+    ... config.get_boolean_value("debug_enable")
     """
 
     _LOCK = threading.Lock()
 
-    def __init__(self, property_file_path: str | None = None) -> None:
+    def __init__(
+        self,
+        property_file_path: str | None = None,
+        *,
+        watch: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
         # 基础配置
         self.__basic_config: dict[str, BaseConfigItem] = {}
         # 用户自定义配置，仅仅以key-value形式存储
         self.__customer_config: dict[str, typing.Any] = {}
         # 配置文件，json格式
         self.__property_file_path: str | None = property_file_path
+        # 当前配置快照, 读取时不加锁
+        self.__snapshot = ConfigSnapshot(0, MappingProxyType({}), MappingProxyType({}))
+        # 修改配置和发布快照时使用的实例锁
+        self.__write_lock = threading.RLock()
+        # 订阅者, 写时复制
+        self.__subscribers: tuple[ConfigChangeCallback, ...] = ()
+        # 配置文件的 (mtime_ns, size, inode), 用于判断文件是否变化
+        self.__file_stamp: tuple[int, int, int] | None = None
+        self.__watcher: threading.Thread | None = None
+        # (快照, 只读配置对象) 缓存
+        self.__frozen: tuple[ConfigSnapshot | None, FrozenConfig | None] = (None, None)
+        self.__stop_event = threading.Event()
         # 1. 读取初始化配置
         self.__load_basic_config()
         # 2. 读取配置文件、合并配置项
         self.__load_config_from_file()
+        self.__publish()
+        if watch:
+            self.watch(poll_interval)
 
     def __repr__(self) -> str:
         s = [f"{repr(i)}" for i in self.__basic_config.values()]
@@ -403,7 +679,10 @@ class Configurations:
         item_value : typing.Any
             配置项值
         """
-        self.__customer_config[item_key] = item_value
+        with self.__write_lock:
+            self.__customer_config[item_key] = item_value
+            changes = self.__publish()
+        self.__notify(*changes)
 
     def set_basic_config(self, item_key: str, item_value: ConfigItemValue) -> None:
         """
@@ -416,8 +695,11 @@ class Configurations:
         item_value : ConfigItemValue
             配置项的值
         """
-        item = self.get_configItem_by_name(item_key)
-        item.set_value(item_value)
+        with self.__write_lock:
+            item = self.get_configItem_by_name(item_key)
+            item.set_value(item_value)
+            changes = self.__publish()
+        self.__notify(*changes)
 
     def set_customer_config(self, item_key: str, item_value: ConfigItemValue | None) -> ConfigItemValue | None:
         """
@@ -435,8 +717,11 @@ class Configurations:
         ConfigItemValue | None
             如果已经设置过值则返回旧值，否则返回None
         """
-        old_value = self.__customer_config.get(item_key, None)
-        self.__customer_config[item_key] = item_value
+        with self.__write_lock:
+            old_value = self.__customer_config.get(item_key, None)
+            self.__customer_config[item_key] = item_value
+            changes = self.__publish()
+        self.__notify(*changes)
         return old_value
 
     def get_config_value(self, item_key: str) -> ConfigItemValue | None:
@@ -453,13 +738,14 @@ class Configurations:
         ConfigItemValue | None
             配置项的值
         """
-        if self.is_not_basic_config(item_key) and self.is_not_customer_config(item_key):
-            warnings.warn(f"{item_key} is not a valid config item")
-            return None
-        elif self.is_basic_config(item_key):
-            return self.get_basic_config_value(item_key)
-        else:
-            return self.get_customer_config_value(item_key)
+        snapshot = self.__snapshot
+        key = item_key.strip().lower()
+        if key in snapshot.basic:
+            return snapshot.basic[key]
+        if key in snapshot.customer:
+            return snapshot.customer.get(item_key, None)
+        warnings.warn(f"{item_key} is not a valid config item")
+        return None
 
     def get_customer_config_value(self, item_key: str) -> str | None:
         """
@@ -475,7 +761,7 @@ class Configurations:
         str | None
             配置项的值
         """
-        return self.__customer_config.get(item_key, None)
+        return self.__snapshot.customer.get(item_key, None)
 
     def get_basic_config_value(self, item_key: str) -> ConfigItemValue:
         """
@@ -491,8 +777,10 @@ class Configurations:
         ConfigItemValue
             配置项的值
         """
-        item = self.get_configItem_by_name(item_key)
-        return item.get_value()
+        try:
+            return self.__snapshot.basic[item_key.lower()]
+        except KeyError:
+            raise KeyError(f"{item_key.lower()} is not a valid config item") from None
 
     def get_configItem_by_name(self, item_key: str) -> BaseConfigItem:
         """
@@ -579,10 +867,7 @@ class Configurations:
         KeyError
             如果配置项不存在则抛出异常
         """
-        item = self.get_configItem_by_name(item_key)
-        if not item.item_type == ConfigType.BOOLEAN:
-            raise ValueError(f"{item_key} is not a boolean config item")
-        return item.get_value()  # type: ignore
+        return self.__get_typed_value(item_key, ConfigType.BOOLEAN)  # type: ignore
 
     def get_string_value(self, item_key: str) -> str:
         """
@@ -609,10 +894,7 @@ class Configurations:
         KeyError
             如果配置项不存在则抛出异常
         """
-        item = self.get_configItem_by_name(item_key)
-        if item.item_type != ConfigType.STRING:
-            raise ValueError(f"{item_key} is not a string config item")
-        return item.get_value()  # type: ignore
+        return self.__get_typed_value(item_key, ConfigType.STRING)  # type: ignore
 
     def get_numeric_value(self, item_key: str) -> float | int:
         """
@@ -639,10 +921,7 @@ class Configurations:
         KeyError
             如果配置项不存在则抛出异常
         """
-        item = self.get_configItem_by_name(item_key)
-        if item.item_type != ConfigType.NUMERIC:
-            raise ValueError(f"{item_key} is not a numeric config item")
-        return item.get_value()  # type: ignore
+        return self.__get_typed_value(item_key, ConfigType.NUMERIC)  # type: ignore
 
     def reset_all_config(self) -> None:
         """
@@ -654,8 +933,11 @@ class Configurations:
         ... config.reset_all_config()
         None
         """
-        for v in self.__basic_config.values():
-            v.reset()
+        with self.__write_lock:
+            for v in self.__basic_config.values():
+                v.reset()
+            changes = self.__publish()
+        self.__notify(*changes)
 
     def reset_config(self, item_key: str) -> None:
         """
@@ -679,8 +961,11 @@ class Configurations:
             如果键不存在则抛出异常
 
         """
-        item = self.get_configItem_by_name(item_key)
-        item.reset()
+        with self.__write_lock:
+            item = self.get_configItem_by_name(item_key)
+            item.reset()
+            changes = self.__publish()
+        self.__notify(*changes)
 
     # test
     def get(self):
@@ -706,7 +991,7 @@ class Configurations:
         bool
             是否是用户自定义配置项
         """
-        return item_key.strip().lower() in self.__customer_config
+        return item_key.strip().lower() in self.__snapshot.customer
 
     def is_not_customer_config(self, item_key: str) -> bool:
         """
@@ -744,7 +1029,7 @@ class Configurations:
         bool
             是否是基础配置项
         """
-        return item_key.strip().lower() in self.__basic_config
+        return item_key.strip().lower() in self.__snapshot.basic
 
     def is_not_basic_config(self, item_key: str) -> bool:
         """
@@ -762,23 +1047,240 @@ class Configurations:
         """
         return not self.is_basic_config(item_key)
 
+    def accessor(
+        self,
+        path: str,
+        value_type: Callable[[typing.Any], typing.Any] | None = None,
+        default: typing.Any = _MISSING,
+    ) -> ConfigAccessor:
+        """
+        创建预先解析的配置读取器, 适合在请求处理等热点路径中反复读取同一个配置项
+
+        Example:
+        ----------
+        >>> port = config.accessor("db.port", int)  # doctest: +SKIP
+        ... port()
+        3306
+
+        Parameters
+        ----------
+        path : str
+            配置项名称或点号分隔的路径
+        value_type : Callable[[typing.Any], typing.Any] | None, optional
+            值的转换函数, 如 int、float、bool, by default None
+        default : typing.Any, optional
+            配置项不存在时返回的默认值, 不设置时抛出 KeyError
+
+        Returns
+        -------
+        ConfigAccessor
+            调用后返回配置值的读取器
+
+        Raises
+        ------
+        KeyError
+            如果配置项不存在并且没有设置默认值则抛出异常
+        """
+        return ConfigAccessor(self, path, value_type, default)
+
+    def freeze(self) -> FrozenConfig:
+        """
+        返回当前配置的只读对象, 基础配置和用户自定义配置按点号分隔的路径组织为嵌套属性, 每个快照只构建一次
+
+        Returns
+        -------
+        FrozenConfig
+            只读配置对象
+        """
+        snapshot = self.__snapshot
+        cached = self.__frozen
+        if cached[0] is snapshot:
+            return cached[1]  # type: ignore
+        frozen = FrozenConfig.from_flat({**snapshot.customer, **snapshot.basic})
+        self.__frozen = (snapshot, frozen)
+        return frozen
+
+    def get_snapshot(self) -> ConfigSnapshot:
+        """
+        获取当前配置快照, 不加锁
+
+        Returns
+        -------
+        ConfigSnapshot
+            当前配置快照
+        """
+        return self.__snapshot
+
+    def subscribe(self, callback: ConfigChangeCallback) -> None:
+        """
+        订阅配置变化, 每次发布的新快照中有配置项发生变化时调用 callback(新快照, 变化的配置项名称)
+
+        Parameters
+        ----------
+        callback : ConfigChangeCallback
+            回调函数, 在修改配置的线程或者 watch 的后台线程中被调用
+        """
+        with self.__write_lock:
+            self.__subscribers = (*self.__subscribers, callback)
+
+    def unsubscribe(self, callback: ConfigChangeCallback) -> None:
+        """
+        取消订阅配置变化
+
+        Parameters
+        ----------
+        callback : ConfigChangeCallback
+            subscribe 时传入的回调函数
+        """
+        with self.__write_lock:
+            self.__subscribers = tuple(sub for sub in self.__subscribers if sub != callback)
+
+    def reload(self) -> frozenset[str]:
+        """
+        重新读取配置文件, 以配置文件和默认值生成新的快照并替换当前快照
+
+        Returns
+        -------
+        frozenset[str]
+            发生变化的配置项名称
+
+        Raises
+        ------
+        ValueError
+            如果配置文件不是合法的 JSON 或者配置项的值不合法则抛出异常, 此时保留原有配置
+        TypeError
+            如果配置项的值类型不合法则抛出异常, 此时保留原有配置
+        """
+        stamp = self.__get_file_stamp()
+        basic_config = self.__copy_basic_config()
+        customer_config: dict[str, typing.Any] = {}
+        self.__merge_configs(basic_config, customer_config, self.__read_property_file())
+        with self.__write_lock:
+            self.__basic_config = basic_config
+            self.__customer_config = customer_config
+            self.__file_stamp = stamp
+            changes = self.__publish()
+        self.__notify(*changes)
+        return changes[1]
+
+    def watch(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """
+        启动后台线程轮询配置文件, 文件变化时自动重新加载, 已经启动时不做任何操作
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            轮询间隔(秒), by default DEFAULT_POLL_INTERVAL
+
+        Raises
+        ------
+        ValueError
+            如果没有设置配置文件或者轮询间隔不是正数则抛出异常
+        """
+        if StringUtil.is_blank(self.__property_file_path):
+            raise ValueError("property file path is not set")
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+
+        with self.__write_lock:
+            if self.__watcher is not None:
+                return
+            self.__stop_event.clear()
+            self.__watcher = threading.Thread(
+                target=self.__watch_file, args=(poll_interval,), name="config-watcher", daemon=True
+            )
+            self.__watcher.start()
+
+    def stop_watching(self) -> None:
+        """
+        停止轮询配置文件并等待后台线程退出
+        """
+        with self.__write_lock:
+            watcher, self.__watcher = self.__watcher, None
+        if watcher is not None:
+            self.__stop_event.set()
+            watcher.join()
+
+    def __watch_file(self, poll_interval: float) -> None:
+        while not self.__stop_event.wait(poll_interval):
+            if self.__get_file_stamp() == self.__file_stamp:
+                continue
+            try:
+                self.reload()
+            except (OSError, TypeError, ValueError) as e:
+                # 文件可能正在被写入, 保留原有配置, 下次文件变化时再重试
+                self.__file_stamp = self.__get_file_stamp()
+                warnings.warn(f"failed to reload config file {self.__property_file_path}: {e}")
+
+    def __get_typed_value(self, item_key: str, item_type: ConfigType) -> ConfigItemValue:
+        key = item_key.lower()
+        item = self.__basic_config.get(key)
+        if item is None:
+            raise KeyError(f"{key} is not a valid config item")
+        if item.item_type is not item_type:
+            raise ValueError(f"{item_key} is not a {item_type.value.lower()} config item")
+        return self.__snapshot.basic[key]
+
+    def __publish(self) -> tuple[ConfigSnapshot, frozenset[str]]:
+        old = self.__snapshot
+        new = ConfigSnapshot(
+            old.version + 1,
+            MappingProxyType({name: item.get_value() for name, item in self.__basic_config.items()}),
+            MappingProxyType(dict(self.__customer_config)),
+        )
+        self.__snapshot = new
+        return new, old.get_changed_keys(new)
+
+    def __notify(self, snapshot: ConfigSnapshot, changed: frozenset[str]) -> None:
+        if not changed:
+            return
+        for callback in self.__subscribers:
+            try:
+                callback(snapshot, changed)
+            except Exception as e:
+                warnings.warn(f"config change callback {callback!r} failed: {e}")
+
+    def __get_file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.__property_file_path)  # type: ignore
+        except (OSError, TypeError):
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def __copy_basic_config(self) -> dict[str, BaseConfigItem]:
+        with Configurations._LOCK:
+            return {item.name: deepcopy(item) for item in BASIC_CONFIG_ITEMS}
+
     def __load_basic_config(self) -> None:
-        Configurations._LOCK.acquire()
-        for item in BASIC_CONFIG_ITEMS:
-            self.__basic_config[item.name] = deepcopy(item)
+        self.__basic_config = self.__copy_basic_config()
 
-        Configurations._LOCK.release()
+    def __read_property_file(self) -> dict[str, typing.Any]:
+        if StringUtil.is_blank(self.__property_file_path):
+            return {}
+        if not FileUtil.is_file(self.__property_file_path):
+            warnings.warn(f"config file {self.__property_file_path} not found")
+            return {}
+        with open(self.__property_file_path) as f:  # type: ignore
+            return json.load(f)
+
+    @classmethod
+    def __merge_configs(
+        cls,
+        basic_config: dict[str, BaseConfigItem],
+        customer_config: dict[str, typing.Any],
+        configs: dict[str, typing.Any],
+    ) -> None:
+        for key, value in flatten_dict(configs).items():
+            item = basic_config.get(key.strip().lower())
+            if item is None:
+                warnings.warn(f"{key} is not a customer config item")
+                customer_config[key] = value
+            else:
+                item.set_value(value)
 
     def __load_config_from_file(self) -> None:
-        if not StringUtil.is_blank(self.__property_file_path):
-            if not FileUtil.is_file(self.__property_file_path):
-                warnings.warn(f"config file {self.__property_file_path} not found")
-                return
-            with open(self.__property_file_path) as f:  # type: ignore
-                customer_configs = json.load(f)
-                # TODO 展平字典
-                for key, value in customer_configs.items():
-                    self.add_config(key, value)
+        self.__file_stamp = self.__get_file_stamp()
+        self.__merge_configs(self.__basic_config, self.__customer_config, self.__read_property_file())
 
 
 @enum.unique
@@ -25,3 +25,33 @@ class FileHandlerType(Enum):
     ROTATION = auto()  # 按文件大小分割日志文件
     INFINITE = auto()  # 无限滚动日志文件
     TIME_ROTATION = auto()  # 按时间间隔分割日志文件
+    SIZE_TIME_ROTATION = auto()  # 按文件大小或时间间隔分割日志文件, 先满足的条件触发分割
+
+
+class LogFormat(Enum):
+    """
+    日志输出格式
+    """
+
+    TEXT = auto()  # 以 field_splitter 分隔字段的文本
+    JSON = auto()  # 每行一个 JSON 对象(JSON Lines)
+
+
+class RotationCompression(Enum):
+    """
+    分割后日志文件的压缩方式
+    """
+
+    NONE = auto()  # 不压缩
+    GZIP = auto()  # 压缩为 .gz 文件
+    ZIP = auto()  # 压缩为 .zip 文件
+
+
+class QueueOverflowPolicy(Enum):
+    """
+    异步日志队列已满时的处理策略
+    """
+
+    BLOCK = auto()  # 阻塞调用方直到队列有空位
+    DROP = auto()  # 直接丢弃日志
+    SAMPLE = auto()  # 按比例随机抽样, 抽中的日志阻塞写入, 其余丢弃
@@ -120,7 +120,10 @@ class CommonExpression:
 class CharsetUtil:
     ISO_8859_1: typing.Final[str] = "ISO-8859-1"
     UTF_8: typing.Final[str] = "UTF-8"
+    UTF_8_SIG: typing.Final[str] = "UTF-8-SIG"
     GBK: typing.Final[str] = "GBK"
+    GB2312: typing.Final[str] = "GB2312"
+    GB18030: typing.Final[str] = "GB18030"
 
 
 class Strategy(AutoName):
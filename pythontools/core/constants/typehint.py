@@ -13,6 +13,7 @@ Change Activity:
 -------------------------------------------------
 """
 
+import mmap
 from os import PathLike
 from typing import TypeAlias, TypeVar
 
@@ -20,5 +21,6 @@ from typing import TypeAlias, TypeVar
 StrOrBytesPath: TypeAlias = str | bytes | PathLike[str] | PathLike[bytes]
 FileDescriptorOrPath: TypeAlias = int | StrOrBytesPath
 PrimitiveType: TypeAlias = int | float | str | bool | bytes | bytearray | memoryview
+ReadableBuffer: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
 ContainerType: TypeAlias = list | tuple | set | frozenset | dict
 T = TypeVar("T")
@@ -115,10 +115,10 @@ class IntegerConverter(AbstractConverter):
             # NOTE 复数转整数，取的是模
             return abs(value.real)  # type: ignore
         elif isinstance(value, str):
-            if ReUtil.is_match(PatternPool.FLOAT_NUM, value):
-                return int(float(value))
-            elif ReUtil.is_match(PatternPool.INTEGER, value):
+            if ReUtil.is_match(PatternPool.INTEGER, value):
                 return int(value)
+            elif ReUtil.is_match(PatternPool.FLOAT_NUM, value):
+                return int(float(value))
 
         try:
             return int(value)
@@ -15,19 +15,34 @@ Change Activity:
 
 # here put the import lib
 import collections
+import copy
+import functools
+import gzip
+import json
 import logging
 import logging.handlers
+import mmap
 import os
 import platform
+import queue
 import random
 import re
+import shutil
+import socket
 import sys
 import threading
 import time
 import warnings
+import zipfile
+from collections import Counter
+from collections.abc import Generator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from logging import Logger, handlers
+from operator import methodcaller
+from os import PathLike
 
-from .constants.log_constant import FileHandlerType
+from .constants.log_constant import FileHandlerType, LogFormat, QueueOverflowPolicy, RotationCompression
 from .constants.string_constant import CharPool, CharsetUtil
 from .errors import LoggerException
 
@@ -36,6 +51,10 @@ DEFAULT_ENCODING = CharsetUtil.UTF_8
 DEFAULT_MAX_LOG_SIZE = 1024 * 1024 * 10  # 10M
 DEFAULT_BACKUP_COUNTS = 10
 DEFAULT_INTERVAL = 30
+DEFAULT_ROTATION_INTERVAL = 24 * 60 * 60  # 1天
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_BATCH_SIZE = 512
 
 DEBUG = logging.DEBUG
 INFO = logging.INFO
@@ -44,6 +63,12 @@ ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 FATAL = logging.FATAL
 G_INITED_LOGGER: list[str] = []
+# co_filename -> 文件名, 供回溯日志使用
+_CODE_FILE_CACHE: dict[str, str] = {}
+_FIELD_SPLIT_RE = re.compile("[ \t]+")
+_COMPRESS_BUFFER_SIZE = 1024 * 1024
+# json 模块的 C 实现, 将 str 编码为带引号的 JSON 字符串, 保留非 ASCII 字符
+_encode_json_str = json.encoder.encode_basestring  # type: ignore
 
 
 info = logging.info
@@ -65,7 +90,31 @@ LoggerParams = collections.namedtuple(
         "gen_wf",  # True/False, generate log lines with level >= WARNING
         "field_splitter",  # 日志字段分隔符
         "encoding",  # 日志编码
+        "async_mode",  # 是否通过队列在后台线程中格式化并写入日志
+        "queue_size",  # 异步日志队列的最大长度
+        "overflow_policy",  # 异步日志队列已满时的处理策略
+        "sample_rate",  # 队列已满时按 SAMPLE 策略保留日志的比例
+        "batch_size",  # 后台线程每批处理的最大日志条数, 每批只 flush 一次
+        "log_format",  # 日志输出格式, 文本或 JSON Lines
+        "rotation_interval",  # SIZE_TIME_ROTATION 的分割时间间隔, 单位为秒
+        "max_total_size",  # SIZE_TIME_ROTATION 所有分割文件占用的总字节数上限
+        "compression",  # SIZE_TIME_ROTATION 分割文件的压缩方式
+        "rate_limit",  # 每个调用点每秒允许的日志条数, None 表示不限流
+        "dedup_window",  # 合并重复日志的时间窗口, 单位为秒, None 表示不合并
     ],
+    defaults=(
+        False,
+        DEFAULT_QUEUE_SIZE,
+        QueueOverflowPolicy.BLOCK,
+        DEFAULT_SAMPLE_RATE,
+        DEFAULT_BATCH_SIZE,
+        LogFormat.TEXT,
+        DEFAULT_ROTATION_INTERVAL,
+        None,
+        RotationCompression.GZIP,
+        None,
+        None,
+    ),
 )
 
 
@@ -93,11 +142,11 @@ class _Singleton:  # pylint: disable=R0903
         self.__cls = cls
 
     def __call__(self, *args, **kwargs):
-        # pylint: disable=consider-using-with
-        self._LOCK.acquire()
+        # 实例创建后不再加锁, 日志函数的每次调用都会经过这里
         if self.__instance is None:
-            self.__instance = self.__cls(*args, **kwargs)
-        self._LOCK.release()
+            with self._LOCK:
+                if self.__instance is None:
+                    self.__instance = self.__cls(*args, **kwargs)
         return self.__instance
 
 
@@ -128,6 +177,587 @@ class RandomFilter(logging.Filter):
         return random.random() < self.rate
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    按 (logger, 代码位置, 日志级别) 限流的令牌桶过滤器
+
+    Attributes
+    ----------
+    rate : float
+        每个调用点每秒补充的令牌数, 即长期允许的日志条数
+    burst : float
+        每个调用点令牌桶的容量, 即允许的突发日志条数
+    suppressed : int
+        被限流丢弃的日志总条数
+
+    Notes
+    -----
+    过滤器不加锁, 依赖 GIL 保证字典读写的原子性, 每个调用点的状态只在自己的桶里更新, 线程之间几乎没有竞争;
+    多线程同时命中同一个调用点时, 放行条数和计数可能有少量误差。
+    某个调用点被限流后, 下一条放行的日志末尾会附上期间被丢弃的条数。
+    """
+
+    MAX_BUCKETS = 4096
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        super().__init__()
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        self.suppressed = 0
+        # key -> [剩余令牌数, 上次补充令牌的时间, 被丢弃的条数]
+        self._buckets: dict[tuple[str, str, int, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.pathname, record.lineno, record.levelno)
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_BUCKETS:
+                self._buckets.clear()
+            self._buckets[key] = [self.burst - 1, now, 0]
+            return True
+
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            bucket[2] += 1
+            self.suppressed += 1
+            return False
+
+        bucket[0] = tokens - 1
+        if bucket[2]:
+            _append_to_message(record, f" [rate limited, {bucket[2]} similar records suppressed]")
+            bucket[2] = 0
+        return True
+
+
+class DedupFilter(logging.Filter):
+    """
+    合并时间窗口内重复日志的过滤器, 相同 logger、级别和内容的日志在窗口内只放行第一条
+
+    Attributes
+    ----------
+    window : float
+        合并重复日志的时间窗口(秒)
+    suppressed : int
+        被合并掉的日志总条数
+
+    Notes
+    -----
+    窗口结束后同一内容的下一条日志会被放行, 并在末尾附上 "previous message repeated N times",
+    表示上一个窗口内被合并掉的条数。与 RateLimitFilter 一样不加锁, 并发时计数可能有少量误差。
+    """
+
+    MAX_ENTRIES = 4096
+
+    def __init__(self, window: float = 1.0) -> None:
+        super().__init__()
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        self.window = window
+        self.suppressed = 0
+        # key -> [窗口开始时间, 窗口内被合并的条数]
+        self._entries: dict[tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.window:
+            entry[1] += 1
+            self.suppressed += 1
+            return False
+
+        if entry is None:
+            if len(self._entries) >= self.MAX_ENTRIES:
+                self._evict(now)
+            self._entries[key] = [now, 0]
+            return True
+
+        if entry[1]:
+            _append_to_message(record, f" [previous message repeated {entry[1]} times]")
+        entry[0] = now
+        entry[1] = 0
+        return True
+
+    def _evict(self, now: float) -> None:
+        # 先清理已经过期的窗口, 仍然过多时全部清空
+        for key, entry in list(self._entries.items()):
+            if now - entry[0] >= self.window:
+                self._entries.pop(key, None)
+        if len(self._entries) >= self.MAX_ENTRIES:
+            self._entries.clear()
+
+
+class _SharedFilterChain(logging.Filter):
+    """
+    挂在多个 handler 上的过滤器链, 每条日志只判定一次, 其余 handler 复用记录在日志上的结果
+
+    Notes
+    -----
+    限流和去重过滤器是有状态的, 同一条日志经过多个 handler 时不能重复计数。
+    过滤器挂在 handler 上而不是 logger 上, 从子 logger 传播上来的日志同样会被过滤。
+    """
+
+    def __init__(self, filters: list[logging.Filter]) -> None:
+        super().__init__()
+        self.filters = filters
+        self._attr = f"_filter_chain_{id(self)}"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        passed = record.__dict__.get(self._attr)
+        if passed is None:
+            passed = all(f.filter(record) for f in self.filters)
+            record.__dict__[self._attr] = passed
+        return passed
+
+
+def _append_to_message(record: logging.LogRecord, suffix: str) -> None:
+    record.msg = record.message = record.getMessage() + suffix
+    record.args = None
+
+
+# 异步模式下在调用方线程渲染异常信息使用的格式化器
+_EXC_FORMATTER = logging.Formatter()
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    带有界队列和溢出策略的 QueueHandler, 调用方线程只负责把日志放入队列
+
+    Attributes
+    ----------
+    overflow_policy : QueueOverflowPolicy
+        队列已满时的处理策略
+    sampler : RandomFilter
+        SAMPLE 策略使用的随机过滤器
+    dropped : int
+        因队列已满而被丢弃的日志条数
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+    ) -> None:
+        super().__init__(log_queue)
+        self.listener: logging.handlers.QueueListener | None = None
+        self.overflow_policy = overflow_policy
+        self.sampler = RandomFilter(sample_rate)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 调用方线程只做浅复制并合并日志参数, 不修改调用方的 record, 完整的格式化留给后台线程
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # traceback 对象不能跨线程保留, 预先渲染为 exc_text, 由目标 handler 的格式化器决定输出位置
+            if not record.exc_text:
+                record.exc_text = (self.formatter or _EXC_FORMATTER).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow_policy == QueueOverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == QueueOverflowPolicy.SAMPLE and self.sampler.filter(record):
+                self.queue.put(record)
+            else:
+                self.dropped += 1
+
+    def close(self) -> None:
+        # 关闭时停止后台线程, 保证队列中剩余的日志全部写出; 重复关闭时不再停止
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+        super().close()
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """
+    批量处理日志的 QueueListener, 每次最多取出 batch_size 条日志, 处理完一批后才 flush 一次
+
+    Attributes
+    ----------
+    batch_size : int
+        每批处理的最大日志条数
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self) -> None:
+        # 队列满时也要保证结束标记能放入队列
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        log_queue = self.queue
+        while True:
+            batch = [log_queue.get()]
+            while len(batch) < self.batch_size and batch[-1] is not self._sentinel:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is self._sentinel
+            self._handle_batch(batch[:-1] if stop else batch)
+            for _ in batch:
+                log_queue.task_done()
+            if stop:
+                return
+
+    def _handle_batch(self, records: list[logging.LogRecord]) -> None:
+        # StreamHandler.emit 每写一条都会 flush, 批处理时在 handler 的锁内逐条写入不 flush, 整批结束后只 flush 一次
+        if not records:
+            return
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            with handler.lock:  # type: ignore
+                for record in records:
+                    if self.respect_handler_level and record.levelno < handler.level:
+                        continue
+                    result = handler.filter(record)
+                    if result:
+                        _emit_without_flush(handler, result if isinstance(result, logging.LogRecord) else record)
+                handler.flush()
+
+
+def _emit_without_flush(handler: logging.Handler, record: logging.LogRecord) -> None:
+    """
+    写入一条日志但不 flush, 只处理标准库的 StreamHandler、FileHandler、BaseRotatingHandler 与
+    SizeTimeRotatingFileHandler, 其他 handler 直接调用 emit
+    """
+    emit = type(handler).emit
+    if emit is SizeTimeRotatingFileHandler.emit:
+        write = handler._write_record  # type: ignore
+    elif emit in (logging.StreamHandler.emit, logging.FileHandler.emit, handlers.BaseRotatingHandler.emit):
+        write = functools.partial(_write_stream_record, handler)
+    else:
+        handler.emit(record)
+        return
+
+    try:
+        write(record)
+    except RecursionError:
+        raise
+    except Exception:
+        handler.handleError(record)
+
+
+def _write_stream_record(handler: logging.StreamHandler, record: logging.LogRecord) -> None:
+    if isinstance(handler, handlers.BaseRotatingHandler) and handler.shouldRollover(record):
+        handler.doRollover()
+    if handler.stream is None:
+        # delay=True 的 FileHandler 还没有打开文件, 由 emit 负责打开
+        handler.emit(record)
+        return
+    handler.stream.write(handler.format(record) + handler.terminator)
+
+
+class SizeTimeRotatingFileHandler(handlers.BaseRotatingHandler):
+    """
+    按文件大小或时间间隔分割日志文件, 先满足的条件触发分割, 分割后的文件在后台线程中压缩并按磁盘预算清理
+
+    Attributes
+    ----------
+    max_bytes : int
+        单个日志文件的最大大小(字节), 小于等于 0 时不按大小分割
+    interval : float
+        分割的时间间隔(秒), 小于等于 0 时不按时间分割
+    backup_count : int
+        最多保留的分割文件数, 小于等于 0 时不限制
+    max_total_size : int | None
+        所有分割文件占用的总字节数上限, None 时不限制
+    compression : RotationCompression
+        分割文件的压缩方式
+
+    Methods
+    -------
+    shouldRollover(record: logging.LogRecord) -> bool
+        是否需要分割日志文件
+    doRollover() -> None
+        分割日志文件
+    get_rotated_files() -> list[str]
+        按从旧到新的顺序返回已分割的文件
+
+    Notes
+    -----
+    写入的字节数由 handler 自行累计, 不需要每条日志都 seek/tell 或者重复格式化; 文件在写入后超过 max_bytes 时,
+    下一条日志触发分割, 因此单个文件最多超出一条日志的大小。
+    分割时日志线程只做一次同目录的 rename 并重新打开文件, 压缩和清理都在后台线程中完成;
+    关闭 handler 时会等待尚未完成的压缩。分割文件命名为 <日志文件>.<YYYYmmdd-HHMMSSfff>[.n][.gz|.zip]。
+    """
+
+    def __init__(
+        self,
+        filename: str | PathLike,
+        max_bytes: int = DEFAULT_MAX_LOG_SIZE,
+        interval: float = DEFAULT_ROTATION_INTERVAL,
+        *,
+        backup_count: int = DEFAULT_ROTATION_COUNTS,
+        max_total_size: int | None = None,
+        compression: RotationCompression = RotationCompression.GZIP,
+        encoding: str | None = None,
+        delay: bool = False,
+    ) -> None:
+        super().__init__(filename, "a", encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.max_total_size = max_total_size
+        self.compression = compression
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        self._rollover_at = time.time() + interval if interval > 0 else float("inf")
+        self._pending: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._queued: set[str] = set()
+        self._worker: threading.Thread | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._write_record(record)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _write_record(self, record: logging.LogRecord) -> None:
+        if self.shouldRollover(record):
+            self.doRollover()
+        if self.stream is None:
+            self.stream = self._open()
+        msg = self.format(record) + self.terminator
+        self.stream.write(msg)
+        self._size += len(msg) if msg.isascii() else len(msg.encode(self.encoding or DEFAULT_ENCODING, "replace"))
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        是否需要分割日志文件
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            将要写入的日志
+
+        Returns
+        -------
+        bool
+            当前文件超过 max_bytes 或者到达分割时间时返回 True, 空文件不会被分割
+        """
+        if self._size <= 0:
+            return False
+        return (0 < self.max_bytes <= self._size) or record.created >= self._rollover_at
+
+    def doRollover(self) -> None:
+        """
+        将当前日志文件重命名为分割文件并重新打开, 压缩和清理交给后台线程
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore
+
+        now = time.time()
+        if os.path.exists(self.baseFilename):
+            rotated = self._get_rotated_name(now)
+            # 先登记再重命名, 后台线程清理时不会把尚未压缩的文件当作已分割的文件删除
+            self._queued.add(rotated)
+            try:
+                os.replace(self.baseFilename, rotated)
+            except BaseException:
+                self._queued.discard(rotated)
+                raise
+            self._submit(rotated)
+        if not self.delay:
+            self.stream = self._open()
+        self._size = 0
+        if self.interval > 0:
+            self._rollover_at = now + self.interval
+
+    def close(self) -> None:
+        """
+        关闭文件并等待后台线程完成尚未结束的压缩和清理
+        """
+        with self.lock:  # type: ignore
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._pending.put(None)
+            worker.join()
+        super().close()
+
+    def get_rotated_files(self) -> list[str]:
+        """
+        按从旧到新的顺序返回已分割的文件, 包括尚未压缩的文件
+
+        Returns
+        -------
+        list[str]
+            分割文件路径
+        """
+        dir_name, base_name = os.path.split(self.baseFilename)
+        prefix = base_name + "."
+        entries = []
+        with os.scandir(dir_name) as it:
+            for entry in it:
+                if not entry.name.startswith(prefix) or not entry.name[len(prefix) : len(prefix) + 1].isdigit():
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.name, entry.path))
+                except OSError:
+                    continue
+        return [path for _, _, path in sorted(entries)]
+
+    def _get_rotated_name(self, now: float) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"{int(now * 1000) % 1000:03d}"
+        rotated = f"{self.baseFilename}.{stamp}"
+        suffix = 0
+        while any(os.path.exists(rotated + ext) for ext in ("", ".gz", ".zip")):
+            suffix += 1
+            rotated = f"{self.baseFilename}.{stamp}.{suffix}"
+        return rotated
+
+    def _submit(self, rotated: str) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, name="log-rotation", daemon=True)
+            self._worker.start()
+        self._pending.put(rotated)
+
+    def _run_worker(self) -> None:
+        while (rotated := self._pending.get()) is not None:
+            try:
+                self._compress(rotated)
+                self._queued.discard(rotated)
+                self._apply_retention()
+            except OSError as e:
+                self._queued.discard(rotated)
+                _fail_handle(f"failed to compress or clean up rotated log {rotated}", e)
+
+    def _compress(self, rotated: str) -> None:
+        match self.compression:
+            case RotationCompression.GZIP:
+                target = rotated + ".gz"
+                with open(rotated, "rb") as src, gzip.open(target + ".tmp", "wb") as dst:
+                    shutil.copyfileobj(src, dst, _COMPRESS_BUFFER_SIZE)
+            case RotationCompression.ZIP:
+                target = rotated + ".zip"
+                with zipfile.ZipFile(target + ".tmp", "w", zipfile.ZIP_DEFLATED) as zf:
+                    zf.write(rotated, os.path.basename(rotated))
+            case _:
+                return
+
+        # 保留原文件的修改时间, 以便清理时按时间排序
+        stat = os.stat(rotated)
+        os.utime(target + ".tmp", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(target + ".tmp", target)
+        os.remove(rotated)
+
+    def _apply_retention(self) -> None:
+        # 仍在等待压缩的文件不参与清理
+        rotated_files = [
+            path for path in self.get_rotated_files() if not path.endswith(".tmp") and path not in self._queued
+        ]
+        sizes = [os.path.getsize(path) for path in rotated_files]
+        total_size = sum(sizes)
+        excess = len(rotated_files) - self.backup_count if self.backup_count > 0 else 0
+        for path, size in zip(rotated_files, sizes):
+            over_budget = self.max_total_size is not None and total_size > self.max_total_size
+            if excess <= 0 and not over_budget:
+                break
+            os.remove(path)
+            total_size -= size
+            excess -= 1
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    JSON Lines 格式化器, 每条日志输出为一行 JSON 对象
+
+    Attributes
+    ----------
+    host : str
+        主机名
+    platform : str
+        平台信息
+
+    Notes
+    -----
+    主机名和平台信息在初始化时序列化一次; 代码位置、日志级别和整秒的时间戳分别按调用点、级别和秒缓存为
+    已经编码好的 JSON 片段, 每条日志只需编码消息等动态字段并用一个 f-string 拼接, 不构造中间字典,
+    也不调用 json.dumps。输出字段:
+    ts, level, logger, msg, pid, process, tid, thread, file, line, func, host, platform, 以及可选的 exc_info、stack_info。
+    """
+
+    MAX_CALLSITE_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.host = socket.gethostname()
+        self.platform = get_platform_info()
+        self._static_fields = f',"host":{_encode_json_str(self.host)},"platform":{_encode_json_str(self.platform)}'
+        self._callsite_cache: dict[tuple[str, int, str], str] = {}
+        self._level_cache: dict[str, str] = {}
+        # (整秒时间戳, 日期和时间部分, 时区部分), 整体替换, 多个 handler 共享格式化器时也不会读到不一致的状态
+        self._ts_cache: tuple[int, str, str] = (-1, "", "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        level = self._level_cache.get(record.levelname)
+        if level is None:
+            level = self._level_cache[record.levelname] = _encode_json_str(record.levelname)
+
+        callsite_key = (record.pathname, record.lineno, record.funcName)
+        callsite = self._callsite_cache.get(callsite_key)
+        if callsite is None:
+            if len(self._callsite_cache) >= self.MAX_CALLSITE_CACHE_SIZE:
+                self._callsite_cache.clear()
+            callsite = self._callsite_cache[callsite_key] = (
+                f'"file":{_encode_json_str(record.pathname)},"line":{record.lineno},'
+                f'"func":{_encode_json_str(record.funcName or "")}'
+            )
+
+        extra = ""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            extra = f',"exc_info":{_encode_json_str(record.exc_text)}'
+        if record.stack_info:
+            extra += f',"stack_info":{_encode_json_str(self.formatStack(record.stack_info))}'
+
+        return (
+            f'{{"ts":"{self._format_ts(record)}","level":{level},"logger":{_encode_json_str(record.name)},'
+            f'"msg":{_encode_json_str(record.getMessage())},"pid":{record.process},'
+            f'"process":{_encode_json_str(record.processName or "")},"tid":{record.thread},'
+            f'"thread":{_encode_json_str(record.threadName or "")},{callsite}{self._static_fields}{extra}}}'
+        )
+
+    def _format_ts(self, record: logging.LogRecord) -> str:
+        # 同一秒内的日志共用日期、时间和时区部分, 只拼接毫秒
+        second = int(record.created)
+        cache = self._ts_cache
+        if second != cache[0]:
+            local_time = self.converter(second)
+            tz = time.strftime("%z", local_time)
+            cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", local_time), f"{tz[:3]}:{tz[3:]}")
+            self._ts_cache = cache
+        return f"{cache[1]}.{int(record.msecs):03d}{cache[2]}"
+
+
 class LogInitializer:
     """
     default log initializer
@@ -164,10 +794,45 @@ class LogInitializer:
         cls.check_and_create_log_file(str_log_file)
         # 设置日志格式
         formatter = cls.get_formatter(log_params)
+        existing_handlers = list(logger.handlers)
         # 设置控制台 handler
         cls.set_stream_handler(logger, log_params, formatter)
         # 设置文件 handler
         cls.set_file_handler(logger, log_params, formatter)
+        new_handlers = [h for h in logger.handlers if h not in existing_handlers]
+        # 异步模式下将新增的 handler 移到后台线程
+        if log_params.async_mode:
+            new_handlers = [cls.set_queue_handler(logger, log_params, new_handlers)]
+        # 设置限流和去重过滤器, 异步模式下在入队前过滤
+        cls.set_filters(new_handlers, log_params)
+
+    @classmethod
+    def set_filters(cls, target_handlers: list[logging.Handler], log_params: LoggerParams) -> None:
+        """
+        按配置为 handler 添加限流和去重过滤器
+
+        Parameters
+        ----------
+        target_handlers : list[logging.Handler]
+            要添加过滤器的 handler, 共享同一组过滤器
+        log_params : LoggerParams
+            配置参数
+
+        Notes
+        -----
+        logger 上的过滤器不会作用于从子 logger 传播上来的日志, 因此过滤器挂在 handler 上。
+        """
+        filters: list[logging.Filter] = []
+        if log_params.dedup_window is not None:
+            filters.append(DedupFilter(log_params.dedup_window))
+        if log_params.rate_limit is not None:
+            filters.append(RateLimitFilter(log_params.rate_limit))
+        if not filters:
+            return
+
+        chain = _SharedFilterChain(filters)
+        for handler in target_handlers:
+            handler.addFilter(chain)
 
     @classmethod
     def proc_thd_id(cls) -> str:
@@ -179,7 +844,7 @@ class LogInitializer:
         str
             进程ID:线程ID
         """
-        return f"{os.getpid()}:{threading.current_thread().ident}"
+        return f"{os.getpid()}:{threading.get_ident()}"
 
     @classmethod
     def get_code_line(cls, back=0) -> int:
@@ -213,7 +878,15 @@ class LogInitializer:
         str
             给定栈帧代码对象所属的文件名
         """
-        return os.path.basename(sys._getframe(back + 1).f_code.co_filename)
+        return cls._get_basename(sys._getframe(back + 1).f_code.co_filename)
+
+    @staticmethod
+    def _get_basename(co_filename: str) -> str:
+        # co_filename 的哈希值由字符串对象缓存, 查字典比每次调用 os.path.basename 便宜得多
+        try:
+            return _CODE_FILE_CACHE[co_filename]
+        except KeyError:
+            return _CODE_FILE_CACHE.setdefault(co_filename, os.path.basename(co_filename))
 
     @classmethod
     def log_file_func_info(
@@ -235,12 +908,14 @@ class LogInitializer:
         -------
         str
             日志回溯信息
-        """
-
-        temp_msg = f" * {cls.proc_thd_id()} {cls.get_code_file(2 + back_trace_len)}:\
-            {cls.get_code_line(2 + back_trace_len)}]"
 
-        return f"{temp_msg}{msg}"
+        Notes
+        -----
+        只获取一次调用方栈帧, 文件名通过 _get_basename 缓存
+        """
+        frame = sys._getframe(back_trace_len + 2)  # pylint:disable=W0212
+        code_file = cls._get_basename(frame.f_code.co_filename)
+        return f" * {os.getpid()}:{threading.get_ident()} {code_file}:{frame.f_lineno}]{msg}"
 
     @classmethod
     def get_formatter(
@@ -260,6 +935,9 @@ class LogInitializer:
         logging.Formatter
             Formatter 实例
         """
+        if log_params.log_format == LogFormat.JSON:
+            return JsonLinesFormatter()
+
         tznum = time.strftime("%z")
         tzkey = time.strftime("%Z")
         splitter = log_params.field_splitter
@@ -324,6 +1002,47 @@ class LogInitializer:
         cls._set_wf(logger, log_params, formatter, fdhandler)
         logger.addHandler(fdhandler)
 
+    @classmethod
+    def set_queue_handler(
+        cls,
+        logger: Logger,
+        log_params: LoggerParams,
+        target_handlers: list[logging.Handler],
+    ) -> AsyncQueueHandler:
+        """
+        将 target_handlers 从 logger 移到后台线程, logger 上只保留一个 AsyncQueueHandler
+
+        Parameters
+        ----------
+        logger : Logger
+            要设置的Logger对象
+        log_params : LoggerParams
+            设置参数
+        target_handlers : list[logging.Handler]
+            由后台线程负责格式化和写入的 handler
+
+        Returns
+        -------
+        AsyncQueueHandler
+            添加到 logger 上的 AsyncQueueHandler
+
+        Notes
+        -----
+        调用方线程只负责合并日志参数并入队, 格式化和文件 I/O 都在后台线程中进行。
+        AsyncQueueHandler 关闭时(包括解释器退出时的 logging.shutdown)会停止后台线程并写出队列中剩余的日志。
+        """
+        for handler in target_handlers:
+            logger.removeHandler(handler)
+
+        log_queue: queue.Queue = queue.Queue(log_params.queue_size)
+        queue_handler = AsyncQueueHandler(log_queue, log_params.overflow_policy, log_params.sample_rate)
+        queue_handler.setLevel(log_params.loglevel)
+        listener = BatchQueueListener(log_queue, *target_handlers, batch_size=log_params.batch_size)
+        queue_handler.listener = listener
+        listener.start()
+        logger.addHandler(queue_handler)
+        return queue_handler
+
     @classmethod
     def check_and_create_log_file(cls, str_log_file: str) -> None:
         """
@@ -386,6 +1105,16 @@ class LogInitializer:
                     "a",
                     encoding=encoding,
                 )
+            case FileHandlerType.SIZE_TIME_ROTATION:
+                return SizeTimeRotatingFileHandler(
+                    str_log_file,
+                    maxsize,
+                    log_params.rotation_interval,
+                    backup_count=DEFAULT_ROTATION_COUNTS,
+                    max_total_size=log_params.max_total_size,
+                    compression=log_params.compression,
+                    encoding=encoding,
+                )
             case FileHandlerType.TIME_ROTATION:
                 return handlers.TimedRotatingFileHandler(
                     str_log_file,
@@ -471,9 +1200,12 @@ class _RootLoggerMan:
         """
 
         temp_logger = self._rootlogger
-        # 移除 handler
+        # 移除 handler, 异步 handler 需要关闭以停止后台线程
         while len(temp_logger.handlers) > 0:  # type: ignore
-            temp_logger.removeHandler(temp_logger.handlers[0])  # type: ignore
+            handler = temp_logger.handlers[0]  # type: ignore
+            temp_logger.removeHandler(handler)  # type: ignore
+            if isinstance(handler, AsyncQueueHandler):
+                handler.close()
         del temp_logger
         self._rootlogger = logger
         logging.root = logger
@@ -500,6 +1232,17 @@ def init_comlog(
     gen_wf: bool = False,
     splitter: str = CharPool.VERTICAL_LINE,
     encoding: str = DEFAULT_ENCODING,
+    async_mode: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+    sample_rate: float = DEFAULT_SAMPLE_RATE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    log_format: LogFormat = LogFormat.TEXT,
+    rotation_interval: float = DEFAULT_ROTATION_INTERVAL,
+    max_total_size: int | None = None,
+    compression: RotationCompression = RotationCompression.GZIP,
+    rate_limit: float | None = None,
+    dedup_window: float | None = None,
 ):
     """
     初始化默认logger
@@ -524,6 +1267,28 @@ def init_comlog(
         日志字段分隔符, by default CharPool.VERTICAL_LINE
     encoding : str, optional
         日志编码, by default DEFAULT_ENCODING
+    async_mode : bool, optional
+        是否通过有界队列在后台线程中格式化并写入日志, by default False
+    queue_size : int, optional
+        异步日志队列的最大长度, by default DEFAULT_QUEUE_SIZE
+    overflow_policy : QueueOverflowPolicy, optional
+        队列已满时的处理策略, by default QueueOverflowPolicy.BLOCK
+    sample_rate : float, optional
+        队列已满时按 SAMPLE 策略保留日志的比例, by default DEFAULT_SAMPLE_RATE
+    batch_size : int, optional
+        后台线程每批处理的最大日志条数, by default DEFAULT_BATCH_SIZE
+    log_format : LogFormat, optional
+        日志输出格式, LogFormat.JSON 时每条日志输出为一行 JSON, 忽略 splitter, by default LogFormat.TEXT
+    rotation_interval : float, optional
+        log_type 为 SIZE_TIME_ROTATION 时的分割时间间隔(秒), by default DEFAULT_ROTATION_INTERVAL
+    max_total_size : int | None, optional
+        log_type 为 SIZE_TIME_ROTATION 时所有分割文件占用的总字节数上限, by default None
+    compression : RotationCompression, optional
+        log_type 为 SIZE_TIME_ROTATION 时分割文件的压缩方式, 在后台线程中进行, by default RotationCompression.GZIP
+    rate_limit : float | None, optional
+        每个 (logger, 代码位置, 日志级别) 每秒允许的日志条数, None 表示不限流, by default None
+    dedup_window : float | None, optional
+        合并相同日志的时间窗口(秒), None 表示不合并, by default None
     """
     logger_man = _RootLoggerMan()
     root_logger = logging.getLogger()
@@ -539,6 +1304,17 @@ def init_comlog(
             gen_wf,
             splitter,
             encoding,
+            async_mode,
+            queue_size,
+            overflow_policy,
+            sample_rate,
+            batch_size,
+            log_format,
+            rotation_interval,
+            max_total_size,
+            compression,
+            rate_limit,
+            dedup_window,
         )
 
         LogInitializer.setup_file_logger(root_logger, logger_params)
@@ -562,6 +1338,17 @@ def re_init_comlog(
     gen_wf=False,
     splitter=CharPool.VERTICAL_LINE,
     encoding=DEFAULT_ENCODING,
+    async_mode: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+    sample_rate: float = DEFAULT_SAMPLE_RATE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    log_format: LogFormat = LogFormat.TEXT,
+    rotation_interval: float = DEFAULT_ROTATION_INTERVAL,
+    max_total_size: int | None = None,
+    compression: RotationCompression = RotationCompression.GZIP,
+    rate_limit: float | None = None,
+    dedup_window: float | None = None,
 ):
     # 检查 logger_name 是否已经被使用
     global G_INITED_LOGGER
@@ -582,6 +1369,17 @@ def re_init_comlog(
         gen_wf,
         splitter,
         encoding,
+        async_mode,
+        queue_size,
+        overflow_policy,
+        sample_rate,
+        batch_size,
+        log_format,
+        rotation_interval,
+        max_total_size,
+        compression,
+        rate_limit,
+        dedup_window,
     )
     LogInitializer.setup_file_logger(tmp_logger, logger_params)
     logger_man.reset_rootlogger(tmp_logger)
@@ -592,76 +1390,55 @@ def _fail_handle(msg, e):
     print(f"{msg}\nerror:{e}")
 
 
+def _backtrace_log(level: int, msg, back_trace_len: int, report_uninitialized: bool = False) -> None:
+    try:
+        logger = _RootLoggerMan().get_root_logger()
+        # 日志级别未启用时直接返回, 不做任何栈帧检查
+        if not logger.isEnabledFor(level):
+            return
+        msg = LogInitializer.log_file_func_info(msg, back_trace_len + 1)
+        logger.log(level, msg, stacklevel=back_trace_len + 3)
+    except LoggerException as log_err:
+        if report_uninitialized:
+            _fail_handle(msg, log_err)
+    # pylint: disable=broad-except
+    except Exception as err:
+        _fail_handle(msg, err)
+
+
 def backtrace_info(msg, back_trace_len=0):
     """
     info with backtrace support
     """
-    try:
-        msg = LogInitializer.log_file_func_info(msg, back_trace_len)
-        logger_man = _RootLoggerMan()
-        logger_man.get_root_logger().info(msg)
-    except LoggerException:
-        return
-    except Exception as err:
-        _fail_handle(msg, err)
+    _backtrace_log(logging.INFO, msg, back_trace_len)
 
 
 def backtrace_debug(msg, back_trace_len=0):
     """
     debug with backtrace support
     """
-    try:
-        msg = LogInitializer.log_file_func_info(msg, back_trace_len)
-        logger_man = _RootLoggerMan()
-        logger_man.get_root_logger().debug(msg)
-    except LoggerException:
-        return
-    except Exception as err:
-        _fail_handle(msg, err)
+    _backtrace_log(logging.DEBUG, msg, back_trace_len)
 
 
 def backtrace_warn(msg, back_trace_len=0):
     """
     warning msg with backtrace support
     """
-    try:
-        msg = LogInitializer.log_file_func_info(msg, back_trace_len)
-        logger_man = _RootLoggerMan()
-        logger_man.get_root_logger().warning(msg)
-    except LoggerException:
-        return
-    # pylint: disable=broad-except
-    except Exception as err:
-        _fail_handle(msg, err)
+    _backtrace_log(logging.WARNING, msg, back_trace_len)
 
 
 def backtrace_error(msg, back_trace_len=0):
     """
     error msg with backtarce support
     """
-    try:
-        msg = LogInitializer.log_file_func_info(msg, back_trace_len)
-        logger_man = _RootLoggerMan()
-        logger_man.get_root_logger().error(msg)
-    except LoggerException as log_err:
-        _fail_handle(msg, log_err)
-    except Exception as err:
-        _fail_handle(msg, err)
+    _backtrace_log(logging.ERROR, msg, back_trace_len, report_uninitialized=True)
 
 
 def backtrace_critical(msg, back_trace_len=0):
     """
     logging.CRITICAL with backtrace support
     """
-    try:
-        msg = LogInitializer.log_file_func_info(msg, back_trace_len)
-        logger_man = _RootLoggerMan()
-        logger_man.get_root_logger().critical(msg)
-    except LoggerException:
-        return
-    # pylint:disable=broad-except
-    except Exception as err:
-        _fail_handle(msg, err)
+    _backtrace_log(logging.CRITICAL, msg, back_trace_len)
 
 
 def set_log_level(logging_level: int) -> None:
@@ -708,8 +1485,7 @@ def parse(logline):
     content = logline[logline.rfind("]") + 1 :].strip()
     # content = content[(content.find(']') + 1):]
     # content = content[(content.find(']') + 1):].strip()
-    regex = re.compile("[ \t]+")
-    items = regex.split(logline)
+    items = _FIELD_SPLIT_RE.split(logline)
     loglevel, date, time_, timezone, _, pid_tid, src = items[:7]
     pid, tid = pid_tid.strip("[]").split(":")
     tznum, tzkey = timezone.strip("+)").split("(")
@@ -730,34 +1506,415 @@ def parse(logline):
         raise ValueError(errinfo) from errinfo
 
 
+class LogLine:
+    """
+    init_comlog 输出的一条日志
+
+    Attributes
+    ----------
+    date : str
+        日期, 例如 2026-10-18
+    time : str
+        时间, 例如 16:12:22,924
+    tznum : str
+        时区偏移, 例如 +0800
+    tzkey : str
+        时区名称, 例如 CST
+    loglevel : str
+        日志级别
+    pid : int
+        进程 ID
+    tid : int
+        线程 ID
+    pathname : str
+        源文件路径
+    func : str
+        函数名称
+    lineno : int
+        行号
+    msg : str
+        日志内容, 多行日志(例如异常堆栈)的后续行以换行符拼接
+    """
+
+    __slots__ = ("date", "time", "tznum", "tzkey", "loglevel", "pid", "tid", "pathname", "func", "lineno", "msg")
+
+    def __init__(
+        self,
+        date: str,
+        time_: str,
+        tznum: str,
+        tzkey: str,
+        loglevel: str,
+        pid: int,
+        tid: int,
+        pathname: str,
+        func: str,
+        lineno: int,
+        msg: str,
+    ) -> None:
+        self.date = date
+        self.time = time_
+        self.tznum = tznum
+        self.tzkey = tzkey
+        self.loglevel = loglevel
+        self.pid = pid
+        self.tid = tid
+        self.pathname = pathname
+        self.func = func
+        self.lineno = lineno
+        self.msg = msg
+
+    def __repr__(self) -> str:
+        return f"LogLine({self.date} {self.time} {self.loglevel} {self.srcline} {self.msg!r})"
+
+    @property
+    def srcline(self) -> str:
+        return f"{self.pathname}:{self.lineno}"
+
+    def to_dict(self) -> dict:
+        """
+        转换为与 parse 结果相同键名的字典
+
+        Returns
+        -------
+        dict
+            日志字段字典
+        """
+        return {
+            "loglevel": self.loglevel,
+            "date": self.date,
+            "time": self.time,
+            "pid": self.pid,
+            "tid": self.tid,
+            "srcline": self.srcline,
+            "msg": self.msg,
+            "tznum": int(self.tznum),
+            "tzkey": self.tzkey,
+        }
+
+
+@dataclass
+class LogStats:
+    """
+    日志文件的聚合统计
+
+    Attributes
+    ----------
+    records : int
+        日志条数, 不包括多行日志的后续行
+    levels : Counter[str]
+        日志级别 -> 条数
+    pids : Counter[int]
+        进程 ID -> 条数
+    threads : Counter[tuple[int, int]]
+        (进程 ID, 线程 ID) -> 条数
+    srclines : Counter[str]
+        源文件路径:行号 -> 条数
+    buckets : Counter[str]
+        时间桶 -> 条数
+    """
+
+    records: int = 0
+    levels: Counter[str] = field(default_factory=Counter)
+    pids: Counter[int] = field(default_factory=Counter)
+    threads: Counter[tuple[int, int]] = field(default_factory=Counter)
+    srclines: Counter[str] = field(default_factory=Counter)
+    buckets: Counter[str] = field(default_factory=Counter)
+
+    def update(self, other: "LogStats") -> "LogStats":
+        """
+        合并另一份统计结果
+
+        Parameters
+        ----------
+        other : LogStats
+            另一份统计结果
+
+        Returns
+        -------
+        LogStats
+            合并后的自身
+        """
+        self.records += other.records
+        self.levels.update(other.levels)
+        self.pids.update(other.pids)
+        self.threads.update(other.threads)
+        self.srclines.update(other.srclines)
+        self.buckets.update(other.buckets)
+        return self
+
+
+class LogParser:
+    """
+    init_comlog 日志格式的预编译解析器
+
+    Attributes
+    ----------
+    splitter : str
+        日志字段分隔符, 需要与 init_comlog 的 splitter 一致
+
+    Methods
+    -------
+    parse(line: str) -> LogLine | None
+        解析一行日志
+    iter_records(lines: Iterable[str]) -> Generator[LogLine, None, None]
+        解析多行日志, 不匹配的行作为上一条日志的后续行
+    parse_file(path: str | PathLike, bucket: str = "minute", encoding: str = DEFAULT_ENCODING) -> LogStats
+        一次遍历聚合日志文件
+
+    Notes
+    -----
+    parse_file 将 mmap 按换行符切分为 CHUNK_SIZE 大小的块, 用 bytes 正则匹配每行的头部, 不逐行解码, 也不构造 LogLine;
+    时间桶由正则直接截取, 匹配结果先按 (时间桶, 级别, 进程, 线程, 文件, 行号) 组合计数, 最后再拆分到各个维度。
+    """
+
+    # 时间戳各部分: 日期、时、分、秒、毫秒
+    TIMESTAMP_PARTS = (r"\d{4}-\d{2}-\d{2}", r" \d{2}", r":\d{2}", r":\d{2}", r",\d{3}")
+    # 时间桶 -> 时间桶包含的时间戳部分数量
+    BUCKETS = {"day": 1, "hour": 2, "minute": 3, "second": 4}
+    _STAT_GROUPS = methodcaller("group", "bucket", "loglevel", "pid", "tid", "pathname", "lineno")
+    CHUNK_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, splitter: str = CharPool.VERTICAL_LINE) -> None:
+        self.splitter = splitter
+        self._line_re = re.compile(self._get_pattern(splitter) + r"(?P<msg>.*)")
+        self._bucket_res: dict[str, re.Pattern[bytes]] = {}
+
+    @classmethod
+    def _get_pattern(cls, splitter: str, bucket: str | None = None) -> str:
+        if bucket is None:
+            timestamp = r"(?P<date>\d{4}-\d{2}-\d{2}) (?P<time>\d{2}:\d{2}:\d{2},\d{3})"
+        else:
+            parts = cls.BUCKETS[bucket]
+            timestamp = rf"(?P<bucket>{''.join(cls.TIMESTAMP_PARTS[:parts])}){''.join(cls.TIMESTAMP_PARTS[parts:])}"
+        sp = re.escape(splitter)
+        return (
+            rf"^ ?{timestamp} (?P<tznum>[+-]\d{{4}})\((?P<tzkey>[^)\n]*)\) {sp} (?P<loglevel>\S+) +{sp} "
+            rf"[^\n]*?\((?P<pid>\d+)\):[^\n]*?\((?P<tid>[0-9a-f]+)\) {sp} (?P<pathname>[^\n]*?) {sp} "
+            rf"(?P<func>[^:\n]*):(?P<lineno>\d+) - "
+        )
+
+    def parse(self, line: str) -> LogLine | None:
+        """
+        解析一行日志
+
+        Parameters
+        ----------
+        line : str
+            日志行
+
+        Returns
+        -------
+        LogLine | None
+            解析结果, 不是日志头部的行返回 None
+        """
+        match = self._line_re.match(line.rstrip("\r\n"))
+        if match is None:
+            return None
+        date, time_, tznum, tzkey, loglevel, pid, tid, pathname, func, lineno, msg = match.groups()
+        return LogLine(date, time_, tznum, tzkey, loglevel, int(pid), int(tid, 16), pathname, func, int(lineno), msg)
+
+    def iter_records(self, lines: Iterable[str]) -> Generator[LogLine, None, None]:
+        """
+        解析多行日志, 不匹配的行(例如异常堆栈)拼接到上一条日志的 msg 中
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            日志行
+
+        Yields
+        ------
+        Generator[LogLine, None, None]
+            日志记录
+        """
+        current: LogLine | None = None
+        for line in lines:
+            record = self.parse(line)
+            if record is not None:
+                if current is not None:
+                    yield current
+                current = record
+            elif current is not None:
+                current.msg += "\n" + line.rstrip("\r\n")
+        if current is not None:
+            yield current
+
+    def parse_file(
+        self,
+        path: str | PathLike,
+        bucket: str = "minute",
+        encoding: str = DEFAULT_ENCODING,
+    ) -> LogStats:
+        """
+        一次遍历聚合日志文件, 统计日志级别、进程、线程、代码位置和时间桶的条数
+
+        Parameters
+        ----------
+        path : str | PathLike
+            日志文件路径
+        bucket : str, optional
+            时间桶粒度, 可选 day、hour、minute、second, by default "minute"
+        encoding : str, optional
+            日志编码, by default DEFAULT_ENCODING
+
+        Returns
+        -------
+        LogStats
+            聚合统计
+
+        Raises
+        ------
+        ValueError
+            如果 bucket 不是支持的时间桶粒度, 则抛出 ValueError
+        """
+        if bucket not in self.BUCKETS:
+            raise ValueError(f"bucket must be one of {list(self.BUCKETS)}, got {bucket!r}")
+        regex = self._bucket_res.get(bucket)
+        if regex is None:
+            regex = self._bucket_res[bucket] = re.compile(self._get_pattern(self.splitter, bucket).encode())
+
+        stats = LogStats()
+        combined: Counter[tuple[bytes, ...]] = Counter()
+        with open(path, "rb") as f_obj:
+            if os.fstat(f_obj.fileno()).st_size == 0:
+                return stats
+            with mmap.mmap(f_obj.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for start, end in self._iter_chunks(buf):
+                    # 分行、匹配、取分组和计数都在 C 中完成, 没有逐行的 Python 字节码
+                    lines = buf[start:end].splitlines()
+                    combined.update(map(self._STAT_GROUPS, filter(None, map(regex.match, lines))))
+
+        for (bucket_key, loglevel, pid, tid, pathname, lineno), cnt in combined.items():
+            pid_num = int(pid)
+            stats.records += cnt
+            stats.levels[loglevel.decode(encoding, "replace")] += cnt
+            stats.pids[pid_num] += cnt
+            stats.threads[(pid_num, int(tid, 16))] += cnt
+            stats.srclines[f"{pathname.decode(encoding, 'replace')}:{int(lineno)}"] += cnt
+            stats.buckets[bucket_key.decode(encoding)] += cnt
+        return stats
+
+    @classmethod
+    def _iter_chunks(cls, buf: mmap.mmap) -> Generator[tuple[int, int], None, None]:
+        size = len(buf)
+        start = 0
+        while start < size:
+            end = buf.rfind(b"\n", start, start + cls.CHUNK_SIZE) + 1
+            if start + cls.CHUNK_SIZE >= size:
+                end = size
+            elif end <= start:
+                # 单行超过 CHUNK_SIZE, 一直延伸到该行结束
+                end = buf.find(b"\n", start + cls.CHUNK_SIZE) + 1 or size
+            yield start, end
+            start = end
+
+
+@functools.lru_cache(maxsize=8)
+def _get_log_parser(splitter: str) -> LogParser:
+    return LogParser(splitter)
+
+
+def parse_file(
+    path: str | PathLike,
+    *,
+    splitter: str = CharPool.VERTICAL_LINE,
+    bucket: str = "minute",
+    encoding: str = DEFAULT_ENCODING,
+) -> LogStats:
+    """
+    一次遍历聚合 init_comlog 输出的日志文件
+
+    Parameters
+    ----------
+    path : str | PathLike
+        日志文件路径
+    splitter : str, optional
+        日志字段分隔符, by default CharPool.VERTICAL_LINE
+    bucket : str, optional
+        时间桶粒度, 可选 day、hour、minute、second, by default "minute"
+    encoding : str, optional
+        日志编码, by default DEFAULT_ENCODING
+
+    Returns
+    -------
+    LogStats
+        聚合统计
+    """
+    return _get_log_parser(splitter).parse_file(path, bucket, encoding)
+
+
+def parse_files(
+    paths: Iterable[str | PathLike],
+    *,
+    workers: int | None = None,
+    splitter: str = CharPool.VERTICAL_LINE,
+    bucket: str = "minute",
+    encoding: str = DEFAULT_ENCODING,
+) -> LogStats:
+    """
+    聚合一组日志文件(例如滚动生成的 app.log、app.log.1 ...), 每个文件由进程池中的一个进程处理
+
+    Parameters
+    ----------
+    paths : Iterable[str | PathLike]
+        日志文件路径
+    workers : int | None, optional
+        进程数, 为 None 时使用 CPU 核数, 为 1 时在当前进程中顺序处理, by default None
+    splitter : str, optional
+        日志字段分隔符, by default CharPool.VERTICAL_LINE
+    bucket : str, optional
+        时间桶粒度, by default "minute"
+    encoding : str, optional
+        日志编码, by default DEFAULT_ENCODING
+
+    Returns
+    -------
+    LogStats
+        所有文件合并后的聚合统计
+    """
+    path_lst = list(paths)
+    func = functools.partial(parse_file, splitter=splitter, bucket=bucket, encoding=encoding)
+    stats = LogStats()
+    if workers == 1 or len(path_lst) <= 1:
+        for file_stats in map(func, path_lst):
+            stats.update(file_stats)
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_stats in executor.map(func, path_lst):
+            stats.update(file_stats)
+    return stats
+
+
 def info_if(bol, msg, back_trace_len=1):
     """log msg with info loglevel if bol is true"""
     if bol:
-        info(msg, back_trace_len)
+        backtrace_info(msg, back_trace_len)
 
 
 def error_if(bol, msg, back_trace_len=1):
     """log msg with error loglevel if bol is true"""
     if bol:
-        error(msg, back_trace_len)
+        backtrace_error(msg, back_trace_len)
 
 
 def warn_if(bol, msg, back_trace_len=1):
     """log msg with error loglevel if bol is true"""
     if bol:
-        warn(msg, back_trace_len)
+        backtrace_warn(msg, back_trace_len)
 
 
 def critical_if(bol, msg, back_trace_len=1):
     """log msg with critical loglevel if bol is true"""
     if bol:
-        critical(msg, back_trace_len)
+        backtrace_critical(msg, back_trace_len)
 
 
 def debug_if(bol, msg, back_trace_len=1):
     """log msg with critical loglevel if bol is true"""
     if bol:
-        debug(msg, back_trace_len)
+        backtrace_debug(msg, back_trace_len)
 
 
 def is_linux_platform() -> bool:
@@ -14,7 +14,9 @@ Change Activity:
 """
 # here put the import lib
 
+import functools
 import itertools as it
+import re
 import string
 import sys
 import typing
@@ -23,7 +25,8 @@ from typing import Any
 
 from ..constants.string_constant import CharPool, CharsetUtil
 from ..decorator import UnCheckFunction
-from .randomutils import RandomUtil
+from ..errors import RegexValidationError
+from .random_utils import RandomUtil
 
 
 class BooleanUtil:
@@ -3143,3 +3146,190 @@ class StringUtil(SequenceUtil):
                 basic_dict["other"] += 1
 
         return basic_dict
+
+
+class ReUtil:
+    """
+    正则工具类, pattern 参数既可以是字符串, 也可以是预编译的 re.Pattern
+    """
+
+    @classmethod
+    def get_pattern(cls, pattern: str | re.Pattern[str]) -> re.Pattern[str]:
+        """
+        获取预编译的正则表达式, 字符串会被编译并缓存
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+
+        Returns
+        -------
+        re.Pattern[str]
+            预编译的正则表达式
+        """
+        return pattern if isinstance(pattern, re.Pattern) else _compile_pattern(pattern)
+
+    @classmethod
+    def is_match(cls, pattern: str | re.Pattern[str], s: str, *, raise_exception: bool = False) -> bool:
+        """
+        从字符串开头匹配正则表达式
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+        s : str
+            待匹配的字符串
+        raise_exception : bool, optional
+            匹配失败时是否引发异常, by default False
+
+        Returns
+        -------
+        bool
+            是否匹配
+
+        Raises
+        ------
+        RegexValidationError
+            如果匹配失败并且 raise_exception=True, 则抛出异常
+        """
+        res = s is not None and cls.get_pattern(pattern).match(s) is not None
+        return cls._check_result(res, pattern, s, raise_exception)
+
+    @classmethod
+    def is_match_reg(cls, s: str, reg: str | re.Pattern[str], *, raise_exception: bool = False) -> bool:
+        """
+        从字符串开头匹配正则表达式, 与 is_match 相同, 只是参数顺序不同
+
+        Parameters
+        ----------
+        s : str
+            待匹配的字符串
+        reg : str | re.Pattern[str]
+            正则表达式
+        raise_exception : bool, optional
+            匹配失败时是否引发异常, by default False
+
+        Returns
+        -------
+        bool
+            是否匹配
+        """
+        return cls.is_match(reg, s, raise_exception=raise_exception)
+
+    @classmethod
+    def is_contains(cls, pattern: str | re.Pattern[str], s: str, *, raise_exception: bool = False) -> bool:
+        """
+        字符串中是否包含匹配正则表达式的子串
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+        s : str
+            待查找的字符串
+        raise_exception : bool, optional
+            没有找到时是否引发异常, by default False
+
+        Returns
+        -------
+        bool
+            是否包含
+
+        Raises
+        ------
+        RegexValidationError
+            如果没有找到并且 raise_exception=True, 则抛出异常
+        """
+        res = s is not None and cls.get_pattern(pattern).search(s) is not None
+        return cls._check_result(res, pattern, s, raise_exception)
+
+    @classmethod
+    def get_matched_group_by_idx(cls, pattern: str | re.Pattern[str], s: str, idx: int = 0) -> str | None:
+        """
+        从字符串开头匹配正则表达式, 返回指定序号的分组
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+        s : str
+            待匹配的字符串
+        idx : int, optional
+            分组序号, 0 表示整个匹配, by default 0
+
+        Returns
+        -------
+        str | None
+            分组内容, 没有匹配时返回 None
+        """
+        matched = cls.get_pattern(pattern).match(s)
+        return None if matched is None else matched.group(idx)
+
+    @classmethod
+    def get_group_0(cls, pattern: str | re.Pattern[str], s: str) -> str | None:
+        """
+        获取整个匹配的内容
+        """
+        return cls.get_matched_group_by_idx(pattern, s, 0)
+
+    @classmethod
+    def get_group_1(cls, pattern: str | re.Pattern[str], s: str) -> str | None:
+        """
+        获取第一个分组的内容
+        """
+        return cls.get_matched_group_by_idx(pattern, s, 1)
+
+    @classmethod
+    def get_match_group(cls, pattern: str | re.Pattern[str], s: str) -> dict[str, str | None] | None:
+        """
+        从字符串开头匹配正则表达式, 返回命名分组
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+        s : str
+            待匹配的字符串
+
+        Returns
+        -------
+        dict[str, str | None] | None
+            命名分组名称 -> 内容, 没有匹配时返回 None
+        """
+        matched = cls.get_pattern(pattern).match(s)
+        return None if matched is None else matched.groupdict()
+
+    @classmethod
+    def find_all(cls, pattern: str | re.Pattern[str], s: str, from_idx: int = 0) -> list[str]:
+        """
+        从指定位置开始查找所有匹配正则表达式的子串
+
+        Parameters
+        ----------
+        pattern : str | re.Pattern[str]
+            正则表达式
+        s : str
+            待查找的字符串
+        from_idx : int, optional
+            查找开始位置索引, by default 0
+
+        Returns
+        -------
+        list[str]
+            所有匹配的子串, 按出现顺序排列
+        """
+        return [matched.group(0) for matched in cls.get_pattern(pattern).finditer(s, from_idx)]
+
+    @classmethod
+    def _check_result(cls, res: bool, pattern: str | re.Pattern[str], s: str, raise_exception: bool) -> bool:
+        if not res and raise_exception:
+            pattern_str = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+            raise RegexValidationError(pattern, s, f"{s!r} does not match pattern {pattern_str!r}")
+        return res
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
@@ -29,7 +29,7 @@ Change Activity:
 # here put the import lib
 from ..constants.string_constant import CharPool, DesensitizedType
 from ..decorator import UnCheckFunction
-from .basicutils import StringUtil
+from .basic_utils import StringUtil
 
 DesensitizedType.mro
 
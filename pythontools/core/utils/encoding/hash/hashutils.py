@@ -14,16 +14,66 @@ Change Activity:
 """
 
 # here put the import lib
+import array
 import struct
+from collections.abc import Iterable
+from typing import Self
 
 from pythontools.core.constants.string_constant import CharsetUtil
+from pythontools.core.constants.typehint import ReadableBuffer
 from pythontools.core.errors import UnsupportedOperationError
-from pythontools.core.utils.basic_utils import StringUtil
 from pythontools.core.utils.encoding.hash.hash import Hash32, Hash64, Hash128
 
 
+def _as_byte_view(data: ReadableBuffer | str) -> memoryview:
+    """
+    将给定数据转换成一维字节视图, 不发生数据拷贝(字符串除外, 需按 UTF-8 编码)
+
+    Parameters
+    ----------
+    data : ReadableBuffer | str
+        待转换数据, 支持 bytes、bytearray、memoryview、mmap 以及其他实现了缓冲协议的对象
+
+    Returns
+    -------
+    memoryview
+        格式为 "B" 的一维字节视图
+    """
+    if isinstance(data, str):
+        data = data.encode(CharsetUtil.UTF_8)
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
 class MetroHash(Hash128, Hash64, Hash32):
-    # TODO 实现该哈希类
+    """
+    MetroHash 算法, 实现了 MetroHash64 与 MetroHash128
+
+    Attributes:
+    ----------
+        k0_64 ~ k3_64: MetroHash64 使用的常量
+        k0_128 ~ k3_128: MetroHash128 使用的常量
+
+    Methods:
+    -------
+        hash_32(data: ReadableBuffer | str, seed: int = 0) -> int:
+            计算32位哈希值, 由64位哈希值折叠得到
+        hash_64(data: ReadableBuffer | str, seed: int = 0) -> int:
+            计算64位哈希值
+        hash_128(data: ReadableBuffer | str, seed: int = 0) -> int:
+            计算128位哈希值
+        hash_many(buffers: Iterable[ReadableBuffer | str], bits: int = 64, seed: int = 0) -> list[int]:
+            批量计算哈希值
+
+    NOTES:
+    ------
+        1. 以 32 字节为一块, 直接从缓冲区中按小端序读取 4 个 64 位整数, 不会拷贝数据
+        2. 结果与参考实现的小端序摘要一致, 即 int.from_bytes(digest, "little")
+        ref: https://github.com/jandrewrogers/MetroHash
+    """
+
     # 64位加盐
     k0_64 = 0xD6D018F5
     k1_64 = 0xA2AA033B
@@ -36,45 +86,268 @@ class MetroHash(Hash128, Hash64, Hash32):
     k2_128 = 0x7BDEC03B
     k3_128 = 0x2F5870A5
 
+    MASK_32 = 0xFFFFFFFF
+    MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+    _BLOCK = struct.Struct("<4Q")
+    _PAIR = struct.Struct("<2Q")
+    _U64 = struct.Struct("<Q")
+    _U32 = struct.Struct("<I")
+    _U16 = struct.Struct("<H")
+
     @classmethod
-    def hash_32(cls, data: bytes | str) -> int:
-        raise NotImplementedError
+    def hash_32(cls, data: ReadableBuffer | str, seed: int = 0) -> int:
+        """
+        32 位哈希算法, MetroHash 没有 32 位版本, 由 64 位哈希值的高低位异或得到
+
+        Parameters
+        ----------
+        data : ReadableBuffer | str
+            待哈希数据
+        seed : int, optional
+            种子, by default 0
+
+        Returns
+        -------
+        int
+            32 位哈希值
+        """
+        h = cls._hash_64(_as_byte_view(data), seed)
+        return (h ^ (h >> 32)) & cls.MASK_32
 
     @classmethod
-    def hash_64(cls, data: bytes | str) -> int:
-        if isinstance(data, str):
-            data = StringUtil.to_bytes(data)
-        return cls._hash_64(data)
+    def hash_64(cls, data: ReadableBuffer | str, seed: int = 0) -> int:
+        """
+        64 位哈希算法(MetroHash64)
+
+        Parameters
+        ----------
+        data : ReadableBuffer | str
+            待哈希数据
+        seed : int, optional
+            种子, by default 0
+
+        Returns
+        -------
+        int
+            64 位哈希值
+        """
+        return cls._hash_64(_as_byte_view(data), seed)
 
     @classmethod
-    def _hash_64(cls, data: bytes, seed: int = 1337) -> int:
-        def rotate_right(value, shift):
-            return ((value >> shift) | (value << (64 - shift))) & 0xFFFFFFFFFFFFFFFF
+    def hash_128(cls, data: ReadableBuffer | str, seed: int = 0) -> int:
+        """
+        128 位哈希算法(MetroHash128)
 
-        def read_u64(data, offset):
-            return struct.unpack_from("<Q", data, offset)[0]
+        Parameters
+        ----------
+        data : ReadableBuffer | str
+            待哈希数据
+        seed : int, optional
+            种子, by default 0
 
-        def read_u32(data, offset):
-            return struct.unpack_from("<I", data, offset)[0]
+        Returns
+        -------
+        int
+            128 位哈希值, 低 64 位为 v0, 高 64 位为 v1
+        """
+        return cls._hash_128(_as_byte_view(data), seed)
 
-        def read_u16(data, offset):
-            return struct.unpack_from("<H", data, offset)[0]
+    @classmethod
+    def hash_many(
+        cls,
+        buffers: Iterable[ReadableBuffer | str],
+        *,
+        bits: int = 64,
+        seed: int = 0,
+    ) -> list[int]:
+        """
+        批量计算哈希值, 避免逐个调用时重复的方法查找与参数检查
 
-        def read_u8(data, offset):
-            return struct.unpack_from("<B", data, offset)[0]
+        Parameters
+        ----------
+        buffers : Iterable[ReadableBuffer | str]
+            待哈希数据的可迭代对象
+        bits : int, optional
+            哈希位数, 可选 32、64、128, by default 64
+        seed : int, optional
+            种子, by default 0
 
-        hash_val = (seed + cls.k2_64) * cls.k0_64
-        v0 = hash_val
+        Returns
+        -------
+        list[int]
+            与输入顺序一致的哈希值列表
 
-        if (bytes_length := StringUtil.get_length(data)) >= 32:
-            while bytes_length >= 32:
-                v0 += 1
+        Raises
+        ------
+        ValueError
+            如果 bits 不是 32、64、128 之一, 则抛出 ValueError
+        """
+        to_view = _as_byte_view
+        match bits:
+            case 64:
+                hash_func = cls._hash_64
+                return [hash_func(to_view(buf), seed) for buf in buffers]
+            case 128:
+                hash_func = cls._hash_128
+                return [hash_func(to_view(buf), seed) for buf in buffers]
+            case 32:
+                hash_func = cls._hash_64
+                mask = cls.MASK_32
+                return [((h := hash_func(to_view(buf), seed)) ^ (h >> 32)) & mask for buf in buffers]
+            case _:
+                raise ValueError(f"bits must be one of 32, 64, 128, got {bits}")
 
-        return hash_val
+    @classmethod
+    def _hash_64(cls, buf: memoryview, seed: int = 0) -> int:
+        k0, k1, k2, k3 = cls.k0_64, cls.k1_64, cls.k2_64, cls.k3_64
+        mask = cls.MASK_64
+        length = len(buf)
+
+        h = ((seed + k2) * k0) & mask
+        ptr = 0
+
+        if length >= 32:
+            v0 = v1 = v2 = v3 = h
+            ptr = length & ~31
+            for r0, r1, r2, r3 in cls._BLOCK.iter_unpack(buf[:ptr]):
+                v0 = (v0 + r0 * k0) & mask
+                v0 = ((v0 >> 29 | v0 << 35) + v2) & mask
+                v1 = (v1 + r1 * k1) & mask
+                v1 = ((v1 >> 29 | v1 << 35) + v3) & mask
+                v2 = (v2 + r2 * k2) & mask
+                v2 = ((v2 >> 29 | v2 << 35) + v0) & mask
+                v3 = (v3 + r3 * k3) & mask
+                v3 = ((v3 >> 29 | v3 << 35) + v1) & mask
+
+            t = ((v0 + v3) * k0 + v1) & mask
+            v2 = (v2 ^ ((t >> 37 | t << 27) & mask) * k1) & mask
+            t = ((v1 + v2) * k1 + v0) & mask
+            v3 = (v3 ^ ((t >> 37 | t << 27) & mask) * k0) & mask
+            t = ((v0 + v2) * k0 + v3) & mask
+            v0 = (v0 ^ ((t >> 37 | t << 27) & mask) * k1) & mask
+            t = ((v1 + v3) * k1 + v2) & mask
+            v1 = (v1 ^ ((t >> 37 | t << 27) & mask) * k0) & mask
+            h = (h + (v0 ^ v1)) & mask
+
+        if length - ptr >= 16:
+            r0, r1 = cls._PAIR.unpack_from(buf, ptr)
+            ptr += 16
+            v0 = (h + r0 * k2) & mask
+            v0 = ((v0 >> 29 | v0 << 35) * k3) & mask
+            v1 = (h + r1 * k2) & mask
+            v1 = ((v1 >> 29 | v1 << 35) * k3) & mask
+            t = (v0 * k0) & mask
+            v0 = (v0 ^ (((t >> 21 | t << 43) & mask) + v1)) & mask
+            t = (v1 * k3) & mask
+            v1 = (v1 ^ (((t >> 21 | t << 43) & mask) + v0)) & mask
+            h = (h + v1) & mask
+
+        if length - ptr >= 8:
+            h = (h + cls._U64.unpack_from(buf, ptr)[0] * k3) & mask
+            ptr += 8
+            h = (h ^ ((h >> 55 | h << 9) & mask) * k1) & mask
+
+        if length - ptr >= 4:
+            h = (h + cls._U32.unpack_from(buf, ptr)[0] * k3) & mask
+            ptr += 4
+            h = (h ^ ((h >> 26 | h << 38) & mask) * k1) & mask
+
+        if length - ptr >= 2:
+            h = (h + cls._U16.unpack_from(buf, ptr)[0] * k3) & mask
+            ptr += 2
+            h = (h ^ ((h >> 48 | h << 16) & mask) * k1) & mask
+
+        if length - ptr >= 1:
+            h = (h + buf[ptr] * k3) & mask
+            h = (h ^ ((h >> 37 | h << 27) & mask) * k1) & mask
+
+        h ^= (h >> 28 | h << 36) & mask
+        h = (h * k0) & mask
+        h ^= (h >> 29 | h << 35) & mask
+        return h
 
     @classmethod
-    def hash_128(cls, data: bytes | str) -> int:
-        raise NotImplementedError
+    def _hash_128(cls, buf: memoryview, seed: int = 0) -> int:
+        k0, k1, k2, k3 = cls.k0_128, cls.k1_128, cls.k2_128, cls.k3_128
+        mask = cls.MASK_64
+        length = len(buf)
+
+        v0 = ((seed - k0) * k3) & mask
+        v1 = ((seed + k1) * k2) & mask
+        ptr = 0
+
+        if length >= 32:
+            v2 = ((seed + k0) * k2) & mask
+            v3 = ((seed - k1) * k3) & mask
+            ptr = length & ~31
+            for r0, r1, r2, r3 in cls._BLOCK.iter_unpack(buf[:ptr]):
+                v0 = (v0 + r0 * k0) & mask
+                v0 = ((v0 >> 29 | v0 << 35) + v2) & mask
+                v1 = (v1 + r1 * k1) & mask
+                v1 = ((v1 >> 29 | v1 << 35) + v3) & mask
+                v2 = (v2 + r2 * k2) & mask
+                v2 = ((v2 >> 29 | v2 << 35) + v0) & mask
+                v3 = (v3 + r3 * k3) & mask
+                v3 = ((v3 >> 29 | v3 << 35) + v1) & mask
+
+            t = ((v0 + v3) * k0 + v1) & mask
+            v2 = (v2 ^ ((t >> 21 | t << 43) & mask) * k1) & mask
+            t = ((v1 + v2) * k1 + v0) & mask
+            v3 = (v3 ^ ((t >> 21 | t << 43) & mask) * k0) & mask
+            t = ((v0 + v2) * k0 + v3) & mask
+            v0 = (v0 ^ ((t >> 21 | t << 43) & mask) * k1) & mask
+            t = ((v1 + v3) * k1 + v2) & mask
+            v1 = (v1 ^ ((t >> 21 | t << 43) & mask) * k0) & mask
+
+        if length - ptr >= 16:
+            r0, r1 = cls._PAIR.unpack_from(buf, ptr)
+            v0 = (v0 + r0 * k2) & mask
+            v0 = ((v0 >> 33 | v0 << 31) * k3) & mask
+            v1 = (v1 + r1 * k2) & mask
+            v1 = ((v1 >> 33 | v1 << 31) * k3) & mask
+            ptr += 16
+            t = (v0 * k2 + v1) & mask
+            v0 = (v0 ^ ((t >> 45 | t << 19) & mask) * k1) & mask
+            t = (v1 * k3 + v0) & mask
+            v1 = (v1 ^ ((t >> 45 | t << 19) & mask) * k0) & mask
+
+        if length - ptr >= 8:
+            v0 = (v0 + cls._U64.unpack_from(buf, ptr)[0] * k2) & mask
+            v0 = ((v0 >> 33 | v0 << 31) * k3) & mask
+            ptr += 8
+            t = (v0 * k2 + v1) & mask
+            v0 = (v0 ^ ((t >> 27 | t << 37) & mask) * k1) & mask
+
+        if length - ptr >= 4:
+            v1 = (v1 + cls._U32.unpack_from(buf, ptr)[0] * k2) & mask
+            v1 = ((v1 >> 33 | v1 << 31) * k3) & mask
+            ptr += 4
+            t = (v1 * k3 + v0) & mask
+            v1 = (v1 ^ ((t >> 46 | t << 18) & mask) * k0) & mask
+
+        if length - ptr >= 2:
+            v0 = (v0 + cls._U16.unpack_from(buf, ptr)[0] * k2) & mask
+            v0 = ((v0 >> 33 | v0 << 31) * k3) & mask
+            ptr += 2
+            t = (v0 * k2 + v1) & mask
+            v0 = (v0 ^ ((t >> 22 | t << 42) & mask) * k1) & mask
+
+        if length - ptr >= 1:
+            v1 = (v1 + buf[ptr] * k2) & mask
+            v1 = ((v1 >> 33 | v1 << 31) * k3) & mask
+            t = (v1 * k3 + v0) & mask
+            v1 = (v1 ^ ((t >> 58 | t << 6) & mask) * k0) & mask
+
+        t = (v0 * k0 + v1) & mask
+        v0 = (v0 + (t >> 13 | t << 51)) & mask
+        t = (v1 * k1 + v0) & mask
+        v1 = (v1 + (t >> 37 | t << 27)) & mask
+        t = (v0 * k2 + v1) & mask
+        v0 = (v0 + (t >> 13 | t << 51)) & mask
+        t = (v1 * k3 + v0) & mask
+        v1 = (v1 + (t >> 37 | t << 27)) & mask
+        return v0 | (v1 << 64)
 
 
 class FnvHash(Hash64, Hash32, Hash128):
@@ -89,15 +362,18 @@ class FnvHash(Hash64, Hash32, Hash128):
 
     Methods:
     -------
-        hash_32(data: bytes | str) -> int:
+        hash_32(data: ReadableBuffer | str) -> int:
             计算32位FNV Hash值
 
-        hash_64(data: bytes | str) -> int:
+        hash_64(data: ReadableBuffer | str) -> int:
             计算64位FNV Hash值
 
-        hash_128(data: bytes | str) -> int:
+        hash_128(data: ReadableBuffer | str) -> int:
             计算128位FNV Hash值
 
+        hash_many(keys: Iterable[ReadableBuffer | str] | array.array, bits: int = 64) -> list[int]:
+            批量计算FNV Hash值
+
     NOTES:
     ------
         FNV Hash算法是一种快速且高效的哈希算法, 它利用了哈希函数的自身特性来避免哈希冲突。
@@ -115,23 +391,31 @@ class FnvHash(Hash64, Hash32, Hash128):
 
     - offset_basis:初始的哈希值, 该值在最早的版本中是0, 为了增强哈希的可靠性, 后续修改为非0的值
     - FNV_prime: FNV用于散列的质数
+    - 本实现按字节(octet)计算, 字符串先按 UTF-8 编码, 因此对非 ASCII 字符同样正确
     """
 
     k32_offset = 0x811C9DC5
-    k64_offset = 0xCBF29CE484222000
-    k128_offset = 0x6C62272E07BB00000000000000000000
+    k64_offset = 0xCBF29CE484222325
+    k128_offset = 0x6C62272E07BB014262B821756295C58D
 
     k32_prime = 0x1000193
     k64_prime = 0x100000001B3
-    k128_prime = 0x10000000000000000000000
+    k128_prime = 0x1000000000000000000013B
 
-    def hash_128(self, data: bytes | str) -> int:
+    # 位数 -> (offset_basis, FNV_prime, mask)
+    PARAMS: dict[int, tuple[int, int, int]] = {
+        32: (k32_offset, k32_prime, (1 << 32) - 1),
+        64: (k64_offset, k64_prime, (1 << 64) - 1),
+        128: (k128_offset, k128_prime, (1 << 128) - 1),
+    }
+
+    def hash_128(self, data: ReadableBuffer | str) -> int:
         """
         128 位哈希算法
 
         Parameters
         ----------
-        data : bytes | str
+        data : ReadableBuffer | str
             待哈希数据
 
         Returns
@@ -139,15 +423,15 @@ class FnvHash(Hash64, Hash32, Hash128):
         int
             128 位哈希值
         """
-        return self.__hash(data, FnvHash.k128_offset, FnvHash.k128_prime, 128)
+        return self.fnv_1a(_as_byte_view(data), *FnvHash.PARAMS[128])
 
-    def hash_64(self, data: bytes | str) -> int:
+    def hash_64(self, data: ReadableBuffer | str) -> int:
         """
         64 位哈希算法
 
         Parameters
         ----------
-        data : bytes | str
+        data : ReadableBuffer | str
             待哈希数据
 
         Returns
@@ -155,15 +439,15 @@ class FnvHash(Hash64, Hash32, Hash128):
         int
             64 位哈希值
         """
-        return self.__hash(data, FnvHash.k64_offset, FnvHash.k64_prime, 64)
+        return self.fnv_1a(_as_byte_view(data), *FnvHash.PARAMS[64])
 
-    def hash_32(self, data: bytes | str) -> int:
+    def hash_32(self, data: ReadableBuffer | str) -> int:
         """
         32 位哈希算法
 
         Parameters
         ----------
-        data : bytes | str
+        data : ReadableBuffer | str
             待哈希数据
 
         Returns
@@ -171,7 +455,7 @@ class FnvHash(Hash64, Hash32, Hash128):
         int
             32 位哈希值
         """
-        return self.__hash(data, FnvHash.k32_offset, FnvHash.k32_prime, 32)
+        return self.fnv_1a(_as_byte_view(data), *FnvHash.PARAMS[32])
 
     def hash(self, data: bytes | str) -> int:
         """
@@ -194,26 +478,191 @@ class FnvHash(Hash64, Hash32, Hash128):
         """
         raise UnsupportedOperationError("can not use hash method, please use hash_32, hash_64 or hash_128 method")
 
-    def __hash(
+    def hash_many(
         self,
-        data: bytes | str,
-        basic_offset: int,
-        prime: int,
-        bytes_length: int,
-    ) -> int:
-        if isinstance(data, bytes):
-            data = data.decode(CharsetUtil.UTF_8)
-        hash_value = basic_offset
-        for char in data:
-            hash_value ^= ord(char)
-            if bytes_length == 32:
-                hash_value = (hash_value << 5) ^ (hash_value >> 27) ^ prime
-                hash_value &= 0xFFFFFFFF
-            elif bytes_length == 64:
-                hash_value = (hash_value << 7) ^ (hash_value >> 57) ^ prime
-                hash_value &= 0xFFFFFFFFFFFFFFFF
-            else:
-                hash_value = (hash_value << 13) ^ (hash_value >> 116) ^ prime
-                hash_value &= 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+        keys: Iterable[ReadableBuffer | str] | array.array,
+        *,
+        bits: int = 64,
+    ) -> list[int]:
+        """
+        批量计算哈希值, 参数只解析一次, 循环内不再做方法查找
 
+        Parameters
+        ----------
+        keys : Iterable[ReadableBuffer | str] | array.array
+            待哈希数据, 如果是 array.array, 则对其中每个元素的原始字节分别计算哈希
+        bits : int, optional
+            哈希位数, 可选 32、64、128, by default 64
+
+        Returns
+        -------
+        list[int]
+            与输入顺序一致的哈希值列表
+
+        Raises
+        ------
+        ValueError
+            如果 bits 不是 32、64、128 之一, 则抛出 ValueError
+        """
+        if bits not in FnvHash.PARAMS:
+            raise ValueError(f"bits must be one of 32, 64, 128, got {bits}")
+        offset, prime, mask = FnvHash.PARAMS[bits]
+
+        if isinstance(keys, array.array):
+            view = memoryview(keys).cast("B")
+            step = keys.itemsize
+            keys = (view[i : i + step] for i in range(0, len(view), step))
+
+        # 逐键内联 FNV-1a, 省去每个键一次函数调用的开销
+        result: list[int] = []
+        append = result.append
+        for key in keys:
+            if isinstance(key, str):
+                key = key.encode(CharsetUtil.UTF_8)
+            elif not isinstance(key, bytes | bytearray):
+                key = _as_byte_view(key)
+            hash_value = offset
+            for octet in key:
+                hash_value = ((hash_value ^ octet) * prime) & mask
+            append(hash_value)
+        return result
+
+    @staticmethod
+    def fnv_1a(buf: Iterable[int], hash_value: int, prime: int, mask: int) -> int:
+        """
+        FNV-1a 核心计算, 从给定的哈希值开始逐字节迭代, 可用于增量计算
+
+        Parameters
+        ----------
+        buf : Iterable[int]
+            字节序列, 通常是 memoryview 或 bytes
+        hash_value : int
+            初始哈希值, 首次计算时为 offset_basis
+        prime : int
+            FNV_prime
+        mask : int
+            结果掩码
+
+        Returns
+        -------
+        int
+            哈希值
+        """
+        for octet in buf:
+            hash_value = ((hash_value ^ octet) * prime) & mask
         return hash_value
+
+
+class FnvHasher:
+    """
+    FNV-1a 增量哈希对象, 接口与 hashlib 保持一致, 可以分块计算大文件或网络流的哈希值, 内存占用固定
+
+    Examples:
+    ----------
+    >>> hasher = FnvHasher(64)
+    >>> with open("big.log", "rb") as f:
+    ...     for chunk in iter(lambda: f.read(1 << 20), b""):
+    ...         hasher.update(chunk)
+    >>> hasher.intdigest() == FnvHash().hash_64(open("big.log", "rb").read())
+    True
+
+    Attributes
+    ----------
+    bits : int
+        哈希位数
+    digest_size : int
+        摘要字节数
+
+    Methods
+    -------
+    update(data: ReadableBuffer | str) -> Self
+        追加数据
+    digest() -> bytes
+        返回大端序字节摘要
+    hexdigest() -> str
+        返回十六进制摘要
+    intdigest() -> int
+        返回整数摘要, 与 FnvHash.hash_xx 的结果一致
+    copy() -> FnvHasher
+        复制当前状态
+    """
+
+    __slots__ = ("bits", "digest_size", "_value", "_prime", "_mask")
+
+    def __init__(self, bits: int = 64, data: ReadableBuffer | str | None = None) -> None:
+        if bits not in FnvHash.PARAMS:
+            raise ValueError(f"bits must be one of 32, 64, 128, got {bits}")
+        offset, prime, mask = FnvHash.PARAMS[bits]
+        self.bits = bits
+        self.digest_size = bits // 8
+        self._value = offset
+        self._prime = prime
+        self._mask = mask
+        if data is not None:
+            self.update(data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} bits={self.bits} value={self.hexdigest()}>"
+
+    def update(self, data: ReadableBuffer | str) -> Self:
+        """
+        追加数据
+
+        Parameters
+        ----------
+        data : ReadableBuffer | str
+            追加的数据块
+
+        Returns
+        -------
+        Self
+            当前对象, 支持链式调用
+        """
+        self._value = FnvHash.fnv_1a(_as_byte_view(data), self._value, self._prime, self._mask)
+        return self
+
+    def intdigest(self) -> int:
+        """
+        返回整数形式的摘要
+
+        Returns
+        -------
+        int
+            哈希值
+        """
+        return self._value
+
+    def digest(self) -> bytes:
+        """
+        返回字节形式的摘要(大端序)
+
+        Returns
+        -------
+        bytes
+            哈希值字节序列
+        """
+        return self._value.to_bytes(self.digest_size, "big")
+
+    def hexdigest(self) -> str:
+        """
+        返回十六进制形式的摘要
+
+        Returns
+        -------
+        str
+            十六进制字符串
+        """
+        return self.digest().hex()
+
+    def copy(self) -> "FnvHasher":
+        """
+        复制当前哈希对象
+
+        Returns
+        -------
+        FnvHasher
+            状态相同的新对象
+        """
+        other = FnvHasher(self.bits)
+        other._value = self._value
+        return other
@@ -0,0 +1,551 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   sharding.py
+@Date       :   2026/10/18
+@Desc       :   基于 Hash32/Hash64/Hash128 的分片路由
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import bisect
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any
+
+from pythontools.core.constants.typehint import ReadableBuffer
+from pythontools.core.utils.encoding.hash.hash import Hash, Hash32, Hash64, Hash128
+from pythontools.core.utils.encoding.hash.hashutils import MetroHash
+
+Key = ReadableBuffer | str
+HashFunc = Callable[[Key], int]
+BatchHashFunc = Callable[[Iterable[Key]], list[int]]
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def get_hash_funcs(hasher: Hash | type[Hash]) -> tuple[HashFunc, BatchHashFunc]:
+    """
+    根据给定的哈希器获取单个和批量哈希函数, 优先使用 64 位, 其次 32 位, 最后 128 位
+
+    Parameters
+    ----------
+    hasher : Hash | type[Hash]
+        哈希器实例或者哈希器类, 如 FnvHash()、MetroHash
+
+    Returns
+    -------
+    tuple[HashFunc, BatchHashFunc]
+        (单个哈希函数, 批量哈希函数), 如果哈希器提供 hash_many 则批量函数直接使用它
+
+    Raises
+    ------
+    TypeError
+        如果给定对象不是 Hash32/Hash64/Hash128 的实现, 则抛出 TypeError
+    """
+    if isinstance(hasher, type):
+        hasher = hasher()
+
+    for hash_cls, bits, name in ((Hash64, 64, "hash_64"), (Hash32, 32, "hash_32"), (Hash128, 128, "hash_128")):
+        if isinstance(hasher, hash_cls):
+            hash_func: HashFunc = getattr(hasher, name)
+            break
+    else:
+        raise TypeError(f"{type(hasher).__name__} is not a Hash32, Hash64 or Hash128 implementation")
+
+    hash_many = getattr(hasher, "hash_many", None)
+    if hash_many is not None:
+
+        def batch_func(keys: Iterable[Key]) -> list[int]:
+            return hash_many(keys, bits=bits)
+
+    else:
+
+        def batch_func(keys: Iterable[Key]) -> list[int]:
+            return [hash_func(k) for k in keys]
+
+    return hash_func, batch_func
+
+
+class Sharder(ABC):
+    """
+    分片路由基类
+
+    Methods
+    -------
+    get_node(key: Key) -> Any
+        获取给定键所在的节点
+    assign_many(keys: Iterable[Key]) -> list[Any]
+        批量获取给定键所在的节点
+    partition(keys: Iterable[Key]) -> dict[Any, list[Key]]
+        将给定键按节点分组
+    """
+
+    def __init__(self, hasher: Hash | type[Hash] = MetroHash) -> None:
+        self._hash_func, self._hash_many = get_hash_funcs(hasher)
+
+    @abstractmethod
+    def get_node(self, key: Key) -> Any: ...
+
+    @abstractmethod
+    def assign_many(self, keys: Iterable[Key]) -> list[Any]: ...
+
+    def partition(self, keys: Iterable[Key]) -> dict[Any, list[Key]]:
+        """
+        将给定键按所在节点分组
+
+        Parameters
+        ----------
+        keys : Iterable[Key]
+            待分组的键
+
+        Returns
+        -------
+        dict[Any, list[Key]]
+            节点 -> 键列表
+        """
+        keys = keys if isinstance(keys, Sequence) else list(keys)
+        groups: dict[Any, list[Key]] = {}
+        for key, node in zip(keys, self.assign_many(keys)):
+            groups.setdefault(node, []).append(key)
+        return groups
+
+
+class ConsistentHashRing(Sharder):
+    """
+    带虚拟节点的一致性哈希环
+
+    Examples:
+    ----------
+    >>> ring = ConsistentHashRing(["db-0", "db-1", "db-2"], vnodes=100)
+    >>> ring.get_node("user:42")
+    'db-2'
+    >>> ring.add_node("db-3")
+    >>> ring.assign_many(["user:1", "user:2"])
+    ['db-0', 'db-1']
+
+    Attributes
+    ----------
+    vnodes : int
+        每个节点(权重为 1 时)的虚拟节点数量
+
+    Methods
+    -------
+    add_node(node: Hashable, weight: int = 1) -> None
+        添加节点, 仅插入该节点的虚拟节点
+    remove_node(node: Hashable) -> None
+        删除节点, 仅移除该节点的虚拟节点
+    get_node(key: Key) -> Hashable
+        获取给定键所在的节点
+    assign_many(keys: Iterable[Key]) -> list[Hashable]
+        批量获取给定键所在的节点
+
+    Notes
+    -----
+    1. 环由两个平行的有序数组组成: 哈希点 _points 与对应节点 _owners, 查找使用 bisect, 复杂度 O(log(N * vnodes))
+    2. 增删节点时只插入或删除该节点自身的虚拟节点, 其他键的归属保持不变
+    """
+
+    DEFAULT_VNODES = 160
+
+    def __init__(
+        self,
+        nodes: Iterable[Hashable] = (),
+        *,
+        vnodes: int = DEFAULT_VNODES,
+        hasher: Hash | type[Hash] = MetroHash,
+    ) -> None:
+        super().__init__(hasher)
+        if vnodes <= 0:
+            raise ValueError(f"vnodes must be positive, got {vnodes}")
+        self.vnodes = vnodes
+        self._points: list[int] = []
+        self._owners: list[Hashable] = []
+        self._weights: dict[Hashable, int] = {}
+        self.add_nodes(nodes)
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._weights
+
+    @property
+    def nodes(self) -> list[Hashable]:
+        return list(self._weights)
+
+    def add_node(self, node: Hashable, weight: int = 1) -> None:
+        """
+        添加节点
+
+        Parameters
+        ----------
+        node : Hashable
+            节点
+        weight : int, optional
+            权重, 虚拟节点数量为 vnodes * weight, by default 1
+
+        Raises
+        ------
+        ValueError
+            如果节点已经存在或者权重非正, 则抛出 ValueError
+        """
+        if node in self._weights:
+            raise ValueError(f"node {node!r} already exists")
+        if weight <= 0:
+            raise ValueError(f"weight must be positive, got {weight}")
+
+        self._weights[node] = weight
+        points, owners = self._points, self._owners
+        for point in self._hash_many(self._vnode_keys(node, weight)):
+            idx = bisect.bisect_left(points, point)
+            points.insert(idx, point)
+            owners.insert(idx, node)
+
+    def add_nodes(self, nodes: Iterable[Hashable]) -> None:
+        """
+        批量添加节点, 合并后只排序一次
+
+        Parameters
+        ----------
+        nodes : Iterable[Hashable]
+            节点集合
+        """
+        pairs = list(zip(self._points, self._owners))
+        for node in nodes:
+            if node in self._weights:
+                raise ValueError(f"node {node!r} already exists")
+            self._weights[node] = 1
+            pairs.extend((point, node) for point in self._hash_many(self._vnode_keys(node, 1)))
+
+        pairs.sort(key=lambda pair: pair[0])
+        self._points = [point for point, _ in pairs]
+        self._owners = [owner for _, owner in pairs]
+
+    def remove_node(self, node: Hashable) -> None:
+        """
+        删除节点
+
+        Parameters
+        ----------
+        node : Hashable
+            节点
+
+        Raises
+        ------
+        KeyError
+            如果节点不存在, 则抛出 KeyError
+        """
+        weight = self._weights.pop(node)
+        points, owners = self._points, self._owners
+        for point in self._hash_many(self._vnode_keys(node, weight)):
+            idx = bisect.bisect_left(points, point)
+            # 不同节点的虚拟节点可能哈希到同一个点, 需要找到属于该节点的那一个
+            while idx < len(points) and points[idx] == point:
+                if owners[idx] == node:
+                    del points[idx]
+                    del owners[idx]
+                    break
+                idx += 1
+
+    def get_node(self, key: Key) -> Hashable:
+        """
+        获取给定键所在的节点
+
+        Parameters
+        ----------
+        key : Key
+            键
+
+        Returns
+        -------
+        Hashable
+            节点
+
+        Raises
+        ------
+        LookupError
+            如果环为空, 则抛出 LookupError
+        """
+        if not self._points:
+            raise LookupError("hash ring is empty")
+        idx = bisect.bisect_left(self._points, self._hash_func(key))
+        return self._owners[idx if idx < len(self._owners) else 0]
+
+    def assign_many(self, keys: Iterable[Key]) -> list[Hashable]:
+        """
+        批量获取给定键所在的节点, 键的哈希值批量计算, 循环中仅执行 bisect
+
+        Parameters
+        ----------
+        keys : Iterable[Key]
+            键
+
+        Returns
+        -------
+        list[Hashable]
+            与输入顺序一致的节点列表
+        """
+        if not self._points:
+            raise LookupError("hash ring is empty")
+        points, owners = self._points, self._owners
+        # 末尾追加第一个节点, 使越过最大哈希点的键回绕到环首, 省去逐键判断
+        owners = [*owners, owners[0]]
+        bisect_left = bisect.bisect_left
+        return [owners[bisect_left(points, h)] for h in self._hash_many(keys)]
+
+    def _vnode_keys(self, node: Hashable, weight: int) -> list[str]:
+        return [f"{node}#{i}" for i in range(self.vnodes * weight)]
+
+
+class JumpHashSharder(Sharder):
+    """
+    Jump Consistent Hash 分片, 将键映射到 [0, num_buckets) 中的一个桶, 无需存储环
+
+    Examples:
+    ----------
+    >>> sharder = JumpHashSharder(16)
+    >>> sharder.get_node("user:42")
+    7
+    >>> sharder.assign_many(["user:1", "user:2"])
+    [5, 8]
+
+    Attributes
+    ----------
+    num_buckets : int
+        桶数量
+
+    Notes
+    -----
+    1. 只能在末尾增加或删除桶, 桶数从 n 变为 n + 1 时, 只有约 1 / (n + 1) 的键会移动
+    2. ref: Lamping & Veach, A Fast, Minimal Memory, Consistent Hash Algorithm, 2014
+    """
+
+    def __init__(self, num_buckets: int, *, hasher: Hash | type[Hash] = MetroHash) -> None:
+        super().__init__(hasher)
+        self.num_buckets = 0
+        self.set_num_buckets(num_buckets)
+
+    def set_num_buckets(self, num_buckets: int) -> None:
+        """
+        设置桶数量
+
+        Parameters
+        ----------
+        num_buckets : int
+            桶数量
+
+        Raises
+        ------
+        ValueError
+            如果桶数量非正, 则抛出 ValueError
+        """
+        if num_buckets <= 0:
+            raise ValueError(f"num_buckets must be positive, got {num_buckets}")
+        self.num_buckets = num_buckets
+
+    @classmethod
+    def jump_hash(cls, key: int, num_buckets: int) -> int:
+        """
+        Jump Consistent Hash 算法
+
+        Parameters
+        ----------
+        key : int
+            64 位整数键, 超出 64 位的部分会被截断
+        num_buckets : int
+            桶数量
+
+        Returns
+        -------
+        int
+            桶编号
+        """
+        key &= MASK_64
+        bucket, j = -1, 0
+        while j < num_buckets:
+            bucket = j
+            key = (key * 2862933555777941757 + 1) & MASK_64
+            j = int((bucket + 1) * (2147483648.0 / ((key >> 33) + 1)))
+        return bucket
+
+    def get_node(self, key: Key) -> int:
+        """
+        获取给定键所在的桶
+
+        Parameters
+        ----------
+        key : Key
+            键
+
+        Returns
+        -------
+        int
+            桶编号
+        """
+        return self.jump_hash(self._hash_func(key), self.num_buckets)
+
+    def assign_many(self, keys: Iterable[Key]) -> list[int]:
+        """
+        批量获取给定键所在的桶, 算法主体内联在循环中
+
+        Parameters
+        ----------
+        keys : Iterable[Key]
+            键
+
+        Returns
+        -------
+        list[int]
+            与输入顺序一致的桶编号列表
+        """
+        num_buckets = self.num_buckets
+        result: list[int] = []
+        append = result.append
+        for key in self._hash_many(keys):
+            key &= MASK_64
+            bucket, j = -1, 0
+            while j < num_buckets:
+                bucket = j
+                key = (key * 2862933555777941757 + 1) & MASK_64
+                j = int((bucket + 1) * (2147483648.0 / ((key >> 33) + 1)))
+            append(bucket)
+        return result
+
+
+class RendezvousHashSharder(Sharder):
+    """
+    Rendezvous(最高随机权重, HRW)哈希分片
+
+    Examples:
+    ----------
+    >>> sharder = RendezvousHashSharder(["db-0", "db-1", "db-2"])
+    >>> sharder.get_node("user:42")
+    'db-0'
+
+    Methods
+    -------
+    add_node(node: Hashable) -> None
+        添加节点
+    remove_node(node: Hashable) -> None
+        删除节点
+
+    Notes
+    -----
+    1. 每个键选择 SplitMix64(键哈希 ^ 节点哈希) 最大的节点, 增删节点时只有属于该节点的键会移动
+    2. 节点哈希在增删节点时预先计算, 每个键只计算一次哈希, 复杂度 O(节点数)
+    """
+
+    def __init__(self, nodes: Iterable[Hashable] = (), *, hasher: Hash | type[Hash] = MetroHash) -> None:
+        super().__init__(hasher)
+        self._nodes: list[Hashable] = []
+        self._seeds: list[int] = []
+        for node in nodes:
+            self.add_node(node)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._nodes
+
+    @property
+    def nodes(self) -> list[Hashable]:
+        return list(self._nodes)
+
+    def add_node(self, node: Hashable) -> None:
+        """
+        添加节点
+
+        Parameters
+        ----------
+        node : Hashable
+            节点
+
+        Raises
+        ------
+        ValueError
+            如果节点已经存在, 则抛出 ValueError
+        """
+        if node in self._nodes:
+            raise ValueError(f"node {node!r} already exists")
+        self._nodes.append(node)
+        self._seeds.append(self._hash_func(f"{node}") & MASK_64)
+
+    def remove_node(self, node: Hashable) -> None:
+        """
+        删除节点
+
+        Parameters
+        ----------
+        node : Hashable
+            节点
+
+        Raises
+        ------
+        ValueError
+            如果节点不存在, 则抛出 ValueError
+        """
+        idx = self._nodes.index(node)
+        del self._nodes[idx]
+        del self._seeds[idx]
+
+    def get_node(self, key: Key) -> Hashable:
+        """
+        获取给定键所在的节点
+
+        Parameters
+        ----------
+        key : Key
+            键
+
+        Returns
+        -------
+        Hashable
+            节点
+
+        Raises
+        ------
+        LookupError
+            如果没有节点, 则抛出 LookupError
+        """
+        return self.assign_many([key])[0]
+
+    def assign_many(self, keys: Iterable[Key]) -> list[Hashable]:
+        """
+        批量获取给定键所在的节点
+
+        Parameters
+        ----------
+        keys : Iterable[Key]
+            键
+
+        Returns
+        -------
+        list[Hashable]
+            与输入顺序一致的节点列表
+        """
+        if not self._nodes:
+            raise LookupError("no node available")
+        nodes, seeds = self._nodes, self._seeds
+        indexes = range(len(seeds))
+        result: list[Hashable] = []
+        append = result.append
+        for h in self._hash_many(keys):
+            h &= MASK_64
+            best_idx, best_score = 0, -1
+            for idx in indexes:
+                value = h ^ seeds[idx]
+                value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+                value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+                score = value ^ (value >> 31)
+                if score > best_score:
+                    best_idx, best_score = idx, score
+            append(nodes[best_idx])
+        return result
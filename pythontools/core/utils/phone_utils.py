@@ -14,8 +14,9 @@ Change Activity:
 """
 # here put the import lib
 
+from ..constants.pattern_pool import PatternPool
 from ..decorator import UnCheckFunction
-from .basicutils import StringUtil
+from .basic_utils import ReUtil, StringUtil
 
 # 是否显示Warning信息
 WARNING_ENABLED = True
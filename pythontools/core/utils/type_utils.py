@@ -18,13 +18,13 @@ import inspect
 import sys
 import typing as t
 from collections.abc import Callable, Mapping
+from typing import Any
 
 from pythontools.core.constants.typehint import T
 
 from ..constants.type_constant import FunctionType
 from ..decorator import UnCheckFunction
-from ..validators.type_validator import TypeValidator
-from .basicutils import StringUtil
+from .basic_utils import StringUtil
 
 WARNING_ENABLED = True
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   dedup.py
+@Date       :   2026/10/18
+@Desc       :   分阶段的重复文件查找
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import hashlib
+import json
+import mmap
+import os
+from collections import defaultdict
+from collections.abc import Callable, Generator, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from typing import Any, NamedTuple
+
+from pythontools.core.constants.typehint import ReadableBuffer
+from pythontools.core.utils.encoding.hash.hashutils import MetroHash
+
+from .fileutils import FileUtil
+
+
+def blake2b_hexdigest(buffer: ReadableBuffer) -> str:
+    """
+    计算 BLAKE2b 十六进制摘要, 计算过程中会释放 GIL, 适合在线程池中对大文件进行全量哈希
+    """
+    return hashlib.blake2b(buffer).hexdigest()
+
+
+class DuplicateGroup(NamedTuple):
+    """
+    一组内容相同的文件
+
+    Attributes
+    ----------
+    size : int
+        文件大小(字节)
+    digest : str
+        全量哈希
+    paths : list[str]
+        文件路径, 已排序
+    """
+
+    size: int
+    digest: str
+    paths: list[str]
+
+    @property
+    def wasted_bytes(self) -> int:
+        """
+        除保留一份之外其余副本占用的字节数
+        """
+        return self.size * (len(self.paths) - 1)
+
+
+class DuplicateFinder:
+    """
+    重复文件查找器, 依次按 文件大小 -> 首尾部分哈希 -> 全量哈希 分组, 每一阶段只处理上一阶段仍有重复的候选文件
+
+    Attributes
+    ----------
+    partial_size : int
+        部分哈希时从文件开头和结尾各读取的字节数
+    partial_hash : Callable[[ReadableBuffer], Hashable]
+        部分哈希函数, 默认为 MetroHash.hash_128
+    full_hash : Callable[[ReadableBuffer], str]
+        全量哈希函数, 接收整个文件的 mmap, 默认为 BLAKE2b
+    workers : int
+        读取和哈希文件的线程数
+    min_size : int
+        参与比较的最小文件大小, 默认忽略空文件
+
+    Methods
+    -------
+    iter_duplicates(*roots, **walk_kwargs) -> Generator[DuplicateGroup, None, None]
+        按文件大小从大到小逐组返回重复文件
+    find(*roots, **walk_kwargs) -> list[DuplicateGroup]
+        返回所有重复文件组
+    to_report(groups: Iterable[DuplicateGroup]) -> dict[str, Any]
+        生成可序列化为 JSON 的报告
+    write_report(f_name: str | PathLike, *roots, **walk_kwargs) -> dict[str, Any]
+        查找重复文件并写入 JSON 报告
+
+    Notes
+    -----
+    不超过 2 * partial_size 的文件在部分哈希阶段已经被完整读取, 直接使用 full_hash 计算最终摘要, 不会再读第二次;
+    部分哈希只用于过滤候选文件, 最终结果始终以 full_hash 为准。无法读取的文件会被跳过。
+    """
+
+    DEFAULT_PARTIAL_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        *,
+        partial_size: int = DEFAULT_PARTIAL_SIZE,
+        partial_hash: Callable[[ReadableBuffer], Hashable] = MetroHash.hash_128,
+        full_hash: Callable[[ReadableBuffer], str] = blake2b_hexdigest,
+        workers: int | None = None,
+        min_size: int = 1,
+    ) -> None:
+        if partial_size <= 0:
+            raise ValueError(f"partial_size must be positive, got {partial_size}")
+        self.partial_size = partial_size
+        self.partial_hash = partial_hash
+        self.full_hash = full_hash
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        if self.workers < 1:
+            raise ValueError(f"workers must be positive, got {self.workers}")
+        self.min_size = min_size
+
+    def iter_duplicates(
+        self,
+        *roots: str | PathLike,
+        **walk_kwargs: Any,
+    ) -> Generator[DuplicateGroup, None, None]:
+        """
+        查找给定目录下的重复文件, 按文件大小从大到小逐组返回
+
+        Parameters
+        ----------
+        *roots : str | PathLike
+            要扫描的目录
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件
+
+        Yields
+        ------
+        Generator[DuplicateGroup, None, None]
+            重复文件组
+        """
+        by_size = self._group_by_size(roots, walk_kwargs)
+        candidates = [(path, size) for size, paths in by_size.items() if len(paths) > 1 for path in paths]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # 第二阶段: 首尾部分哈希, 小文件直接得到最终摘要
+            by_partial: dict[tuple[int, bool, Hashable], list[str]] = defaultdict(list)
+            for (path, size), key in zip(candidates, executor.map(self._get_partial_key, candidates)):
+                if key is not None:
+                    by_partial[(size, *key)].append(path)
+
+            groups = sorted(
+                ((size, is_final, key, paths) for (size, is_final, key), paths in by_partial.items() if len(paths) > 1),
+                key=lambda group: -group[0],
+            )
+            for size, is_final, key, paths in groups:
+                if is_final:
+                    yield DuplicateGroup(size, key, sorted(paths))  # type: ignore
+                    continue
+
+                # 第三阶段: 通过 mmap 计算全量哈希
+                by_digest: dict[str, list[str]] = defaultdict(list)
+                for path, digest in zip(paths, executor.map(self._get_full_digest, paths)):
+                    if digest is not None:
+                        by_digest[digest].append(path)
+                for digest, same_paths in sorted(by_digest.items()):
+                    if len(same_paths) > 1:
+                        yield DuplicateGroup(size, digest, sorted(same_paths))
+
+    def find(self, *roots: str | PathLike, **walk_kwargs: Any) -> list[DuplicateGroup]:
+        """
+        查找给定目录下的所有重复文件组
+
+        Parameters
+        ----------
+        *roots : str | PathLike
+            要扫描的目录
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件
+
+        Returns
+        -------
+        list[DuplicateGroup]
+            重复文件组, 按文件大小从大到小排列
+        """
+        return list(self.iter_duplicates(*roots, **walk_kwargs))
+
+    @classmethod
+    def to_report(cls, groups: Iterable[DuplicateGroup]) -> dict[str, Any]:
+        """
+        生成可序列化为 JSON 的报告
+
+        Parameters
+        ----------
+        groups : Iterable[DuplicateGroup]
+            重复文件组
+
+        Returns
+        -------
+        dict[str, Any]
+            包含重复文件组、重复文件数量和可节省字节数的报告
+        """
+        group_lst = list(groups)
+        return {
+            "groups": [group._asdict() for group in group_lst],
+            "duplicate_files": sum(len(group.paths) - 1 for group in group_lst),
+            "wasted_bytes": sum(group.wasted_bytes for group in group_lst),
+        }
+
+    def write_report(self, f_name: str | PathLike, *roots: str | PathLike, **walk_kwargs: Any) -> dict[str, Any]:
+        """
+        查找重复文件并写入 JSON 报告
+
+        Parameters
+        ----------
+        f_name : str | PathLike
+            报告文件路径
+        *roots : str | PathLike
+            要扫描的目录
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件
+
+        Returns
+        -------
+        dict[str, Any]
+            写入的报告
+        """
+        report = {
+            "roots": [os.fspath(root) for root in roots],
+            **self.to_report(self.iter_duplicates(*roots, **walk_kwargs)),
+        }
+        path_obj = FileUtil.get_path_object(f_name)
+        path_obj.parent.mkdir(parents=True, exist_ok=True)
+        with open(path_obj, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+    def _group_by_size(self, roots: Iterable[str | PathLike], walk_kwargs: dict[str, Any]) -> dict[int, list[str]]:
+        walk_kwargs = {"min_size": self.min_size, **walk_kwargs}
+        by_size: dict[int, list[str]] = defaultdict(list)
+        seen: set[str] = set()
+        for root in roots:
+            for entry in FileUtil.walk(root, **walk_kwargs):
+                path = os.path.abspath(entry.path)
+                if path in seen:
+                    continue
+                seen.add(path)
+                try:
+                    by_size[entry.stat().st_size].append(path)
+                except OSError:
+                    continue
+        return by_size
+
+    def _get_partial_key(self, candidate: tuple[str, int]) -> tuple[bool, Hashable] | None:
+        path, size = candidate
+        try:
+            with open(path, "rb") as f:
+                if size <= 2 * self.partial_size:
+                    return True, self.full_hash(f.read())
+                head = f.read(self.partial_size)
+                f.seek(-self.partial_size, os.SEEK_END)
+                return False, self.partial_hash(head + f.read(self.partial_size))
+        except OSError:
+            return None
+
+    def _get_full_digest(self, path: str) -> str | None:
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return self.full_hash(buf)
+        except (OSError, ValueError):
+            return None
@@ -14,12 +14,22 @@ Change Activity:
 """
 
 # here put the import lib
+import codecs
+import fnmatch
+import functools
+import io
+import itertools
 import os
 import re
+import struct
+import sys
 import tempfile
 import time
+import typing as t
 import unicodedata
 import uuid
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from operator import eq
 from os import PathLike
@@ -31,7 +41,6 @@ from ..core.utils.basic_utils import SequenceUtil, StringUtil
 from ..core.utils.datetime_utils import DatetimeUtil
 
 
-class FileUtil:
 class FileUtil:
     """
     文件、系统工具类
@@ -89,10 +98,24 @@ class FileUtil:
         获取文件名
     get_extension_from_filename(filename: str) -> str
         获取文件扩展名
-    get_line_cnt_of_file(p: str | PathLike[str], encoding: str = CharsetUtil.UTF_8) -> int
+    get_line_cnt_of_file(p: str | PathLike[str]) -> int
         获取文件行数
+    build_line_index(p: str | PathLike[str], *, persist: bool = True) -> array
+        构建行首偏移量索引, 并保存为旁路文件
+    get_line(p: str | PathLike[str], line_num: int, *, encoding: str = CharsetUtil.UTF_8) -> str
+        根据行号读取一行
+    get_lines_range(p: str | PathLike[str], start: int, end: int, *, encoding: str = CharsetUtil.UTF_8) -> list[str]
+        读取给定行号范围内的行
+    detect_charset(p: str | PathLike[str], *, sample_size: int = 64 * 1024) -> str | None
+        根据文件开头的样本检测编码
+    iter_lines(p: str | PathLike[str], encoding: str = "auto") -> Generator[str, None, None]
+        流式读取文件行, 解码失败时在当前位置切换编码
+    get_lines(p: str | PathLike[str]) -> list[str]
+        读取文件所有行
     list_files(p: str | PathLike[str], recursive: bool = False, include_ignore: bool = False) -> list[str]
         获取给定路径下的文件列表
+    walk(p: str | PathLike[str], *, extensions=None, pattern=None, ...) -> Generator[os.DirEntry[str], None, None]
+        基于 os.scandir 遍历目录树, 支持过滤条件与线程池并行
     list_dirs(p: str | PathLike[str], recursive: bool = False, include_ignore: bool = False) -> list[str]
         获取给定路径下的文件夹列表
     windows_to_linux_line_ending(s: str) -> str
@@ -103,15 +126,19 @@ class FileUtil:
 
     WINDOWS_LINE_ENDING = "\r\n"
     LINUX_LINE_ENDING = "\n"
-    FILENAME_ASCII_STRIP_RE = re.compile(r"[^A-Za-z0-9_.-]")
-    WINDOWS_DEVICE_FILES = {
-        "CON",
-        "PRN",
-        "AUX",
-        "NUL",
-        *(f"COM{i}" for i in range(10)),
-        *(f"LPT{i}" for i in range(10)),
-    }
+    READ_BUFFER_SIZE = 4 * 1024 * 1024
+    LINE_INDEX_SUFFIX = ".lidx"
+    LINE_INDEX_MAGIC = b"PTLI"
+    LINE_INDEX_HEADER = struct.Struct("<4sQQ")
+    NEWLINE_RE = re.compile(b"\n")
+    AUTO_ENCODING = "auto"
+    CHARSET_SAMPLE_SIZE = 64 * 1024
+    CHARSET_CANDIDATES: tuple[str, ...] = (
+        CharsetUtil.UTF_8,
+        CharsetUtil.GBK,
+        CharsetUtil.GB2312,
+        CharsetUtil.GB18030,
+    )
     FILENAME_ASCII_STRIP_RE = re.compile(r"[^A-Za-z0-9_.-]")
     WINDOWS_DEVICE_FILES = {
         "CON",
@@ -727,6 +754,7 @@ class FileUtil:
         last_modify_time_in_mill = DatetimeUtil.convert_time(
             last_modify_time_in_nanoseconds, TimeUnit.NANOSECONDS, TimeUnit.MILLISECONDS
         )
+        return last_modify_time_in_mill
 
     @classmethod
     def get_last_modify_time_in_seconds(cls, p: str | PathLike[str], *, check_exist: bool = False) -> float:
@@ -860,14 +888,144 @@ class FileUtil:
         list[Path]
             给定路径下所有符合提取规则的文件列表
         """
-        path_obj = cls.get_path_object(p)
+        if not cls.is_dir(p):
+            return []
+        f_paths = (Path(entry.path) for entry in cls.walk(p))
+        return [f_path for f_path in f_paths if all(predicate(f_path) for predicate in predicates)]
 
-        return [
-            Path(f_path) / f
-            for f_path, _, fs in os.walk(path_obj)
-            for f in fs
-            if SequenceUtil.is_empty(predicates) or all(predicate(Path(f_path) / f) for predicate in predicates)
-        ]
+    @classmethod
+    def walk(
+        cls,
+        p: str | PathLike[str],
+        *,
+        extensions: t.Iterable[str] | None = None,
+        pattern: str | None = None,
+        include_hidden: bool = True,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        modified_after: float | None = None,
+        modified_before: float | None = None,
+        predicate: t.Callable[[os.DirEntry[str]], bool] | None = None,
+        include_files: bool = True,
+        include_dirs: bool = False,
+        follow_symlinks: bool = False,
+        workers: int = 1,
+    ) -> t.Generator[os.DirEntry[str], None, None]:
+        """
+        基于 os.scandir 递归遍历目录树, 复用 DirEntry 中缓存的类型和 stat 信息, 不会为每个文件额外调用 stat
+
+        Parameters
+        ----------
+        p : str | PathLike[str]
+            根目录, 根目录本身不会被返回
+        extensions : Iterable[str] | None, optional
+            文件扩展名, 可以带或不带 ".", 只作用于文件, by default None
+        pattern : str | None, optional
+            文件名的 glob 模式(fnmatch), by default None
+        include_hidden : bool, optional
+            是否包含隐藏文件(以 "." 或 "__" 开头), 为 False 时也不会进入隐藏文件夹, by default True
+        min_size : int | None, optional
+            最小文件大小(字节), 只作用于文件, by default None
+        max_size : int | None, optional
+            最大文件大小(字节), 只作用于文件, by default None
+        modified_after : float | None, optional
+            最后修改时间的下限(时间戳, 秒, 包含), by default None
+        modified_before : float | None, optional
+            最后修改时间的上限(时间戳, 秒, 不包含), by default None
+        predicate : Callable[[os.DirEntry[str]], bool] | None, optional
+            自定义过滤条件, 在其余条件都满足后调用, by default None
+        include_files : bool, optional
+            是否返回文件, by default True
+        include_dirs : bool, optional
+            是否返回文件夹, by default False
+        follow_symlinks : bool, optional
+            是否进入指向文件夹的符号链接, 跟随时需要自行避免链接成环; 不跟随时链接仍按文件夹返回, by default False
+        workers : int, optional
+            线程数, 大于 1 时每个文件夹作为一个任务在线程池中扫描, 返回顺序不固定, by default 1
+
+        Yields
+        ------
+        Generator[os.DirEntry[str], None, None]
+            满足条件的 DirEntry, 可以通过 entry.path 获取路径, entry.stat() 不会再次访问磁盘
+
+        Raises
+        ------
+        ValueError
+            如果根目录不是文件夹或者 workers 小于 1
+
+        Notes
+        -----
+        与 os.walk 一样, 无法访问的文件夹会被跳过; workers 为 1 时的返回顺序与 os.walk 自顶向下的顺序一致
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        root = os.fspath(cls.get_path_object(p))
+        cls.is_dir(root, raise_exception=True)
+
+        suffixes = None if extensions is None else {ext if ext.startswith(".") else f".{ext}" for ext in extensions}
+        need_stat = any(v is not None for v in (min_size, max_size, modified_after, modified_before))
+
+        def is_match(entry: os.DirEntry[str], is_file: bool) -> bool:
+            if pattern is not None and not fnmatch.fnmatch(entry.name, pattern):
+                return False
+            if is_file and suffixes is not None and os.path.splitext(entry.name)[1] not in suffixes:
+                return False
+            if need_stat:
+                stat = entry.stat(follow_symlinks=follow_symlinks)
+                if is_file and min_size is not None and stat.st_size < min_size:
+                    return False
+                if is_file and max_size is not None and stat.st_size > max_size:
+                    return False
+                if modified_after is not None and stat.st_mtime < modified_after:
+                    return False
+                if modified_before is not None and stat.st_mtime >= modified_before:
+                    return False
+            return predicate is None or predicate(entry)
+
+        def scan(dir_path: str) -> tuple[list[os.DirEntry[str]], list[str]]:
+            matched: list[os.DirEntry[str]] = []
+            sub_dirs: list[str] = []
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                return matched, sub_dirs
+            with entries:
+                for entry in entries:
+                    if not include_hidden and (entry.name.startswith(".") or entry.name.startswith("__")):
+                        continue
+                    try:
+                        # 指向文件夹的链接始终按文件夹分类, 只是不跟随链接时不进入
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if follow_symlinks or not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                        if include_dirs and is_match(entry, False):
+                            matched.append(entry)
+                    elif include_files and is_match(entry, True):
+                        matched.append(entry)
+            return matched, sub_dirs
+
+        if workers == 1:
+            stack = [root]
+            while stack:
+                matched, sub_dirs = scan(stack.pop())
+                yield from matched
+                stack.extend(reversed(sub_dirs))
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending: set[Future] = {executor.submit(scan, root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matched, sub_dirs = future.result()
+                    pending.update(executor.submit(scan, sub_dir) for sub_dir in sub_dirs)
+                    yield from matched
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     @classmethod
     def get_basename_from_path(cls, p: str | PathLike[str]) -> str:
@@ -925,8 +1083,9 @@ class FileUtil:
         list[Path]
             符合条件的文件列表
         """
-        predicate_func = functools.partial(cls.is_match_extension, extension=extension, check_exist=False)
-        return cls.list_files_from_path(p, predicate_func)
+        if not cls.is_dir(p):
+            return []
+        return [Path(entry.path) for entry in cls.walk(p, extensions=[extension])]
 
     @t.overload
     def get_path_without_ext(cls, path: str) -> str: ...
@@ -954,50 +1113,343 @@ class FileUtil:
         return os.path.splitext(path)[0]
 
     @classmethod
-    def get_line_cnt_of_file(cls, f: str) -> int:
+    def get_line_cnt_of_file(cls, f: str | PathLike[str]) -> int:
         """
-        计算文件行数
+        计算文件行数, 按字节统计换行符, 不进行解码也不为每一行创建字符串
 
         Parameters
         ----------
-        f : str
+        f : str | PathLike[str]
             文件路径
 
         Returns
         -------
         int
-            行数
+            行数, 最后一行没有换行符时也计为一行
+
+        Notes
+        -----
+        只把 \\n 视为换行符, 因此 \\r\\n 结尾的文件同样适用, 但单独的 \\r 不会被当作换行
         """
-        with open(Path(f)) as f_obj:
-            i = -1
-            for i, _ in enumerate(f_obj):
-                pass
-        return i + 1
+        buf = bytearray(cls.READ_BUFFER_SIZE)
+        cnt, last_byte = 0, b"\n"
+        with open(cls.get_path_object(f), "rb", buffering=0) as f_obj:
+            while n := f_obj.readinto(buf):
+                cnt += buf.count(b"\n", 0, n)
+                last_byte = buf[n - 1 : n]
+        return cnt if last_byte == b"\n" else cnt + 1
 
     @classmethod
-    def get_lines(cls, fs: str) -> list[str]:
+    def build_line_index(cls, p: str | PathLike[str], *, persist: bool = True) -> array:
         """
-        读取文件所有行
+        构建行首偏移量索引, 第 i 个元素是第 i + 1 行的起始字节偏移量
+
+        Parameters
+        ----------
+        p : str | PathLike[str]
+            文件路径
+        persist : bool, optional
+            是否保存为同目录下的旁路文件(<文件名>.lidx), 保存失败时会忽略, by default True
+
+        Returns
+        -------
+        array
+            类型为 'Q' 的偏移量数组, 长度等于文件行数
+        """
+        path_obj = cls.get_path_object(p)
+        stat = path_obj.stat()
+        offsets = array("Q")
+        buf = bytearray(cls.READ_BUFFER_SIZE)
+        base = 0
+        with open(path_obj, "rb", buffering=0) as f_obj:
+            while n := f_obj.readinto(buf):
+                offsets.extend(base + m.end() for m in cls.NEWLINE_RE.finditer(buf, 0, n))
+                base += n
+        # 每个换行符之后是下一行的开始, 文件末尾的换行符之后没有新行
+        if offsets and offsets[-1] == base:
+            offsets.pop()
+        if base:
+            offsets.insert(0, 0)
+
+        if persist:
+            cls._save_line_index(path_obj, stat, offsets)
+        return offsets
+
+    @classmethod
+    def get_line(cls, p: str | PathLike[str], line_num: int, *, encoding: str = CharsetUtil.UTF_8) -> str:
+        """
+        根据行号读取一行, 通过行索引直接定位, 不会从头扫描文件
+
+        Parameters
+        ----------
+        p : str | PathLike[str]
+            文件路径
+        line_num : int
+            行号, 从 1 开始
+        encoding : str, optional
+            文件编码, by default CharsetUtil.UTF_8
+
+        Returns
+        -------
+        str
+            该行内容, 包含行尾换行符
+
+        Raises
+        ------
+        IndexError
+            如果行号超出范围
+        """
+        lines = cls.get_lines_range(p, line_num, line_num, encoding=encoding)
+        return lines[0]
+
+    @classmethod
+    def get_lines_range(
+        cls,
+        p: str | PathLike[str],
+        start: int,
+        end: int,
+        *,
+        encoding: str = CharsetUtil.UTF_8,
+    ) -> list[str]:
+        """
+        读取 [start, end] 行号范围内的行, 优先复用旁路索引文件, 索引过期时会重新构建
+
+        Parameters
+        ----------
+        p : str | PathLike[str]
+            文件路径
+        start : int
+            起始行号, 从 1 开始
+        end : int
+            结束行号(包含)
+        encoding : str, optional
+            文件编码, by default CharsetUtil.UTF_8
+
+        Returns
+        -------
+        list[str]
+            行内容列表, 每行包含行尾换行符
+
+        Raises
+        ------
+        IndexError
+            如果行号超出范围或者 start 大于 end
+        """
+        path_obj = cls.get_path_object(p)
+        offsets = cls._get_line_index(path_obj)
+        if not 1 <= start <= end <= len(offsets):
+            raise IndexError(f"line range [{start}, {end}] is out of range: [1, {len(offsets)}]")
+
+        begin_offset = offsets[start - 1]
+        with open(path_obj, "rb") as f_obj:
+            f_obj.seek(begin_offset)
+            data = f_obj.read() if end == len(offsets) else f_obj.read(offsets[end] - begin_offset)
+
+        bounds = [offset - begin_offset for offset in offsets[start - 1 : end]]
+        bounds.append(len(data))
+        return [data[a:b].decode(encoding) for a, b in itertools.pairwise(bounds)]
+
+    @classmethod
+    def _get_line_index(cls, path_obj: Path) -> array:
+        stat = path_obj.stat()
+        return cls._get_cached_line_index(str(path_obj), stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _get_cached_line_index(cls, path_str: str, size: int, mtime_ns: int) -> array:
+        # 以文件大小和修改时间作为缓存键, 文件变化后旧的索引自然失效
+        offsets = cls._load_line_index(Path(path_str), size, mtime_ns)
+        return cls.build_line_index(path_str) if offsets is None else offsets
+
+    @classmethod
+    def _load_line_index(cls, path_obj: Path, size: int, mtime_ns: int) -> array | None:
+        index_path = path_obj.with_name(path_obj.name + cls.LINE_INDEX_SUFFIX)
+        try:
+            with open(index_path, "rb") as f_obj:
+                data = f_obj.read()
+        except OSError:
+            return None
+
+        header_size = cls.LINE_INDEX_HEADER.size
+        if len(data) < header_size or (len(data) - header_size) % 8:
+            return None
+        magic, index_size, index_mtime_ns = cls.LINE_INDEX_HEADER.unpack_from(data)
+        if magic != cls.LINE_INDEX_MAGIC or index_size != size or index_mtime_ns != mtime_ns:
+            return None
+
+        offsets = array("Q")
+        offsets.frombytes(memoryview(data)[header_size:])
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        return offsets
+
+    @classmethod
+    def _save_line_index(cls, path_obj: Path, stat: os.stat_result, offsets: array) -> None:
+        index_path = path_obj.with_name(path_obj.name + cls.LINE_INDEX_SUFFIX)
+        tmp_path = index_path.with_name(f".{index_path.name}.{uuid.uuid4().hex}.tmp")
+        data = offsets
+        if sys.byteorder == "big":
+            data = array("Q", offsets)
+            data.byteswap()
+        try:
+            with open(tmp_path, "xb") as f_obj:
+                f_obj.write(cls.LINE_INDEX_HEADER.pack(cls.LINE_INDEX_MAGIC, stat.st_size, stat.st_mtime_ns))
+                f_obj.write(data.tobytes())
+            os.replace(tmp_path, index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def detect_charset(cls, p: str | PathLike[str], *, sample_size: int = CHARSET_SAMPLE_SIZE) -> str | None:
+        """
+        只读取一次文件开头的样本, 按 CHARSET_CANDIDATES 的顺序选出第一个能解码样本的编码,
+        结果按路径、文件大小和修改时间缓存
 
         Parameters
         ----------
-        f : str | Path
+        p : str | PathLike[str]
+            文件路径
+        sample_size : int, optional
+            样本字节数, by default 64 KiB
+
+        Returns
+        -------
+        str | None
+            检测到的编码, 带 BOM 的 UTF-8 文件返回 UTF-8-SIG, 没有候选编码能解码样本时返回 None
+        """
+        path_obj = cls.get_path_object(p)
+        stat = path_obj.stat()
+        return cls._detect_charset_cached(str(path_obj), stat.st_size, stat.st_mtime_ns, sample_size)
+
+    @classmethod
+    def iter_lines(
+        cls,
+        p: str | PathLike[str],
+        encoding: str = AUTO_ENCODING,
+        *,
+        sample_size: int = CHARSET_SAMPLE_SIZE,
+    ) -> t.Generator[str, None, None]:
+        """
+        流式读取文件行, 换行符的处理与文本模式的 open 一致(统一转换成 \\n)
+
+        Parameters
+        ----------
+        p : str | PathLike[str]
+            文件路径
+        encoding : str, optional
+            文件编码, 为 "auto" 时通过 detect_charset 检测, by default "auto"
+        sample_size : int, optional
+            检测编码时的样本字节数, by default 64 KiB
+
+        Yields
+        ------
+        Generator[str, None, None]
+            文件行
+
+        Raises
+        ------
+        ValueError
+            encoding 为 "auto" 且某一行无法被任何候选编码解码
+        UnicodeDecodeError
+            指定了 encoding 且无法解码
+
+        Notes
+        -----
+        encoding 为 "auto" 时, 如果某一行无法用当前编码解码, 会在该行切换到第一个能解码它的候选编码,
+        并继续使用该编码读取后续内容, 已经返回的行不会重新读取
+        """
+        path_obj = cls.get_path_object(p)
+        auto = encoding == cls.AUTO_ENCODING
+        if auto:
+            encoding = cls.detect_charset(path_obj, sample_size=sample_size) or cls.CHARSET_CANDIDATES[0]
+
+        with open(path_obj, "rb") as f_obj:
+            pending = b""
+            while chunk := f_obj.read(cls.READ_BUFFER_SIZE):
+                # 只在换行符处切分, UTF-8 与 GBK 系列编码的多字节字符中都不会出现 0x0A
+                data = pending + chunk
+                cut = data.rfind(b"\n") + 1
+                pending = data[cut:]
+                if cut:
+                    encoding = yield from cls._decode_lines(data[:cut], encoding, fallback=auto, p=p)
+            if pending:
+                yield from cls._decode_lines(pending, encoding, fallback=auto, p=p)
+
+    @classmethod
+    def get_lines(cls, fs: str | PathLike[str]) -> list[str]:
+        """
+        读取文件所有行, 编码只检测一次, 混合编码的文件会在出错的行切换编码, 不会重复读取文件
+
+        Parameters
+        ----------
+        fs : str | PathLike[str]
             文件路径
 
         Returns
         -------
         list[str]
             文件所有行
+
+        Raises
+        ------
+        ValueError
+            如果某一行无法被任何候选编码解码
         """
-        encoding_lst = ["utf-8", "gbk", "gb2312", "gb18030"]
-        path_obj = cls.get_path_object(fs)
-        for encoding in encoding_lst:
+        return list(cls.iter_lines(fs))
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _detect_charset_cached(cls, path_str: str, size: int, mtime_ns: int, sample_size: int) -> str | None:
+        with open(path_str, "rb") as f_obj:
+            sample = f_obj.read(sample_size)
+        if sample.startswith(codecs.BOM_UTF8):
+            return CharsetUtil.UTF_8_SIG
+
+        # 样本可能截断在多字节字符中间, 只有读到文件末尾时才要求完整解码
+        final = len(sample) < sample_size
+        for charset in cls.CHARSET_CANDIDATES:
             try:
-                with open(path_obj, encoding=encoding) as file:
-                    return list(file)
+                codecs.getincrementaldecoder(charset)().decode(sample, final=final)
             except UnicodeDecodeError:
                 continue
-        raise ValueError(f"Can not decode file {fs}")
+            return charset
+        return None
+
+    @classmethod
+    def _decode_lines(
+        cls,
+        data: bytes,
+        encoding: str,
+        *,
+        fallback: bool,
+        p: str | PathLike[str],
+    ) -> t.Generator[str, None, str]:
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError:
+            if not fallback:
+                raise
+            parts = []
+            for line in data.splitlines(keepends=True):
+                try:
+                    parts.append(line.decode(encoding))
+                except UnicodeDecodeError as err:
+                    encoding = next((c for c in cls.CHARSET_CANDIDATES if cls._can_decode(line, c)), "")
+                    if not encoding:
+                        raise ValueError(f"Can not decode file {p}") from err
+                    parts.append(line.decode(encoding))
+            text = "".join(parts)
+
+        yield from io.StringIO(text, newline=None)
+        return encoding
+
+    @staticmethod
+    def _can_decode(data: bytes, encoding: str) -> bool:
+        try:
+            data.decode(encoding)
+        except UnicodeDecodeError:
+            return False
+        return True
 
     @classmethod
     def windows_to_linux_line_ending(cls, text: str | bytes) -> str:
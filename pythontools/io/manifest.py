@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   manifest.py
+@Date       :   2026/10/18
+@Desc       :   基于 SQLite 的增量文件清单
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterator
+from os import PathLike
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from .fileutils import FileUtil
+
+
+class FileState(NamedTuple):
+    """
+    清单中一个文件的状态
+
+    Attributes
+    ----------
+    path : str
+        相对于根目录的路径, 使用 "/" 分隔
+    size : int
+        文件大小(字节)
+    mtime_ns : int
+        最后修改时间(纳秒)
+    digest : str | None
+        内容哈希的十六进制字符串, 未计算时为 None
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str | None = None
+
+
+class ManifestDiff(NamedTuple):
+    """
+    两次扫描之间的差异, 路径均为相对于根目录的路径
+
+    Attributes
+    ----------
+    added : list[str]
+        新增的文件
+    changed : list[str]
+        内容发生变化的文件
+    removed : list[str]
+        被删除的文件
+    """
+
+    added: list[str]
+    changed: list[str]
+    removed: list[str]
+
+    def is_empty(self) -> bool:
+        """
+        是否没有任何变化
+
+        Returns
+        -------
+        bool
+            没有新增、修改和删除时返回 True
+        """
+        return not (self.added or self.changed or self.removed)
+
+
+class FileManifest:
+    """
+    持久化的文件清单, 记录 路径 -> 大小、修改时间和可选的内容哈希, 用于增量地发现文件变化
+
+    Attributes
+    ----------
+    db_path : str | PathLike
+        SQLite 数据库路径, ":memory:" 表示只保存在内存中
+    hash_contents : bool
+        是否为文件计算并保存内容哈希
+    hash_algorithm : str
+        hashlib 支持的哈希算法名称
+
+    Methods
+    -------
+    get(path: str) -> FileState | None
+        获取清单中的文件状态
+    diff(root: str | PathLike, **walk_kwargs) -> ManifestDiff
+        比较根目录与清单, 不修改清单
+    update(root: str | PathLike, **walk_kwargs) -> ManifestDiff
+        比较根目录与清单, 并将结果写回清单
+    close() -> None
+        关闭数据库连接
+
+    Notes
+    -----
+    判断文件是否变化时先比较大小和修改时间: 大小不同直接视为变化, 两者都相同视为未变化;
+    只有大小相同而修改时间不同, 并且清单中保存了哈希时才会重新计算哈希, 哈希相同的文件不会出现在 changed 中,
+    update 时只刷新其修改时间。diff 不会为新增和大小变化的文件计算哈希。
+    遍历之后被删除的文件视为不存在; 无法读取的文件本次跳过, 清单中保留其原有状态。
+
+    Examples:
+    ----------
+    >>> with FileManifest("backup.manifest", hash_contents=True) as manifest:  # doctest: +SKIP
+    ...     changes = manifest.update("/data/lake", workers=8)
+    ...     sync(changes.added + changes.changed)
+    """
+
+    DEFAULT_HASH_ALGORITHM = "blake2b"
+
+    def __init__(
+        self,
+        db_path: str | PathLike = ":memory:",
+        *,
+        hash_contents: bool = False,
+        hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ) -> None:
+        if hash_algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"unsupported hash algorithm: {hash_algorithm}")
+
+        self.db_path = db_path
+        self.hash_contents = hash_contents
+        self.hash_algorithm = hash_algorithm
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, digest TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path) is not None
+
+    def __iter__(self) -> Iterator[FileState]:
+        for row in self._conn.execute("SELECT path, size, mtime_ns, digest FROM files ORDER BY path"):
+            yield FileState(*row)
+
+    def close(self) -> None:
+        """
+        关闭数据库连接
+        """
+        self._conn.close()
+
+    def get(self, path: str) -> FileState | None:
+        """
+        获取清单中的文件状态
+
+        Parameters
+        ----------
+        path : str
+            相对于根目录的路径, 使用 "/" 分隔
+
+        Returns
+        -------
+        FileState | None
+            文件状态, 不存在时返回 None
+        """
+        row = self._conn.execute("SELECT path, size, mtime_ns, digest FROM files WHERE path = ?", (path,)).fetchone()
+        return None if row is None else FileState(*row)
+
+    def diff(self, root: str | PathLike, **walk_kwargs: Any) -> ManifestDiff:
+        """
+        比较根目录下的文件与清单, 不修改清单
+
+        Parameters
+        ----------
+        root : str | PathLike
+            根目录
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件和 workers 等参数
+
+        Returns
+        -------
+        ManifestDiff
+            新增、变化和删除的文件
+        """
+        changes, _ = self._scan(root, walk_kwargs, store=False)
+        return changes
+
+    def update(self, root: str | PathLike, **walk_kwargs: Any) -> ManifestDiff:
+        """
+        比较根目录下的文件与清单, 并在一个事务中将新的状态写回清单
+
+        Parameters
+        ----------
+        root : str | PathLike
+            根目录
+        **walk_kwargs : Any
+            传递给 FileUtil.walk 的过滤条件和 workers 等参数
+
+        Returns
+        -------
+        ManifestDiff
+            新增、变化和删除的文件
+        """
+        changes, upserts = self._scan(root, walk_kwargs, store=True)
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", upserts)
+            self._conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in changes.removed))
+        return changes
+
+    def _scan(
+        self, root: str | PathLike, walk_kwargs: dict[str, Any], store: bool
+    ) -> tuple[ManifestDiff, list[FileState]]:
+        root_path = os.fspath(FileUtil.get_path_object(root))
+        known = {row[0]: row[1:] for row in self._conn.execute("SELECT path, size, mtime_ns, digest FROM files")}
+        added: list[str] = []
+        changed: list[str] = []
+        upserts: list[FileState] = []
+
+        for entry in FileUtil.walk(root_path, **walk_kwargs):
+            rel_path = os.path.relpath(entry.path, root_path).replace(os.sep, "/")
+            old = known.pop(rel_path, None)
+            try:
+                stat = entry.stat()
+                if old is None:
+                    # 只有写回清单时才需要新文件的哈希
+                    digest = self._get_digest(entry.path) if store else None
+                    upserts.append(FileState(rel_path, stat.st_size, stat.st_mtime_ns, digest))
+                    added.append(rel_path)
+                    continue
+
+                old_size, old_mtime_ns, old_digest = old
+                if stat.st_size == old_size and stat.st_mtime_ns == old_mtime_ns:
+                    continue
+                if stat.st_size != old_size or old_digest is None or not self.hash_contents:
+                    digest = self._get_digest(entry.path) if store else None
+                    upserts.append(FileState(rel_path, stat.st_size, stat.st_mtime_ns, digest))
+                    changed.append(rel_path)
+                    continue
+
+                # 大小相同但修改时间不同, 通过哈希判断内容是否真的变化
+                digest = self._get_digest(entry.path)
+            except FileNotFoundError:
+                # 遍历之后被删除的文件按不存在处理
+                if old is not None:
+                    known[rel_path] = old
+                continue
+            except OSError:
+                # 暂时无法读取的文件本次跳过, 保留清单中原有的状态
+                continue
+            if digest != old_digest:
+                changed.append(rel_path)
+            upserts.append(FileState(rel_path, stat.st_size, stat.st_mtime_ns, digest))
+
+        changes = ManifestDiff(sorted(added), sorted(changed), sorted(known))
+        return changes, upserts
+
+    def _get_digest(self, path: str) -> str | None:
+        if not self.hash_contents:
+            return None
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, self.hash_algorithm).hexdigest()
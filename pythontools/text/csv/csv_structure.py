@@ -14,15 +14,34 @@ Change Activity:
 """
 
 # here put the import lib
+import codecs
 import csv
-from collections.abc import Generator, Mapping, Sequence
+import gzip
+import io
+import mmap
+import os
+import uuid
+import zipfile
+from array import array
+from collections import namedtuple
+from collections.abc import Callable, Generator, Iterable, Iterator, KeysView, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import reduce
+from itertools import compress, islice
+from operator import itemgetter
 from os import PathLike
+from pathlib import Path
+from types import TracebackType
 from typing import Any, NamedTuple, Self
 
+from pythontools.core.constants.pattern_pool import PatternPool
 from pythontools.core.constants.string_constant import CharPool, CharsetUtil
+from pythontools.core.convert.convert_factory import ConvertFactory
+from pythontools.core.convert.converters import BooleanConverter
 from pythontools.core.errors import UnsupportedOperationError
-from pythontools.core.io.fileutils import FileUtil
-from pythontools.core.utils.basicutils import SequenceUtil
+from pythontools.core.utils.basic_utils import SequenceUtil
+from pythontools.io.fileutils import FileUtil
 
 
 class CsvConfig:
@@ -54,6 +73,8 @@ class CsvConfig:
         设置文本限定符
     set_skip_initial_space(skip_initial_space: bool) -> Self
         设置是否跳过初始空格
+    get_dialect_options() -> dict[str, Any]
+        获取传递给 csv.reader / csv.writer 的参数
     """
 
     DEFAULT_DELIMITER = CharPool.COMMA
@@ -96,8 +117,27 @@ class CsvConfig:
         self.skip_initial_space = skip_initial_space
         return self
 
+    def get_dialect_options(self) -> dict[str, Any]:
+        """
+        获取传递给 csv.reader / csv.writer 的参数
+
+        Returns
+        -------
+        dict[str, Any]
+            csv.reader / csv.writer 的关键字参数
+        """
+        return {
+            "delimiter": self.delimiter,
+            "strict": self.strict_mode,
+            "lineterminator": self.lineterminator,
+            "skipinitialspace": self.skip_initial_space,
+            "quotechar": self.text_qualifier,
+        }
+
 
 class CsvRow:
+    __slots__ = ("ori_line_num", "is_header", "data")
+
     def __init__(
         self,
         line_num: int,
@@ -132,9 +172,9 @@ class CsvRow:
         Returns
         -------
         tuple[Any, ...]
-            行原始数据的拷贝
+            行原始数据, 元祖不可变, 因此无需拷贝
         """
-        return tuple(list(self.data))
+        return self.data
 
     def get_data_by_idx(self, idx: int) -> Any:
         """
@@ -191,9 +231,9 @@ class CsvRow:
         if self.data is not None:
             raise ValueError("already set")
         if isinstance(data, Sequence) and not isinstance(data, str):
-            self.data = tuple(list(data))
+            self.data = data if isinstance(data, tuple) else tuple(data)
         elif isinstance(data, Mapping):
-            self.data = tuple(list(self.header_map.values()))
+            self.data = tuple(data.values())
         else:
             raise TypeError("data must be a sequence or mapping")
 
@@ -221,6 +261,8 @@ class CsvHeader(CsvRow):
     由于标题行数据自身即使标题也是数据, 所以无法转换成字典或命名元祖
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         data: list[Any] | Mapping[str, Any] | None,
@@ -234,6 +276,120 @@ class CsvHeader(CsvRow):
         raise UnsupportedOperationError("is header, cannot convert to namedtuple, only to the original data")
 
 
+class RowView:
+    """
+    行视图, 按标题位置索引共享的批次缓冲区, 不拷贝行数据也不创建字典
+
+    Attributes
+    ----------
+    line_num : int
+        行号(不包含标题行)
+
+    Methods
+    -------
+    get(name: str, default: Any = None) -> Any
+        根据标题获取字段值
+    keys() -> KeysView[str]
+        返回标题名称
+    to_tuple() -> tuple[str, ...]
+        拷贝成元祖
+    to_dict() -> dict[str, str]
+        拷贝成字典
+
+    Notes
+    -----
+    同一批次的所有 RowView 共享一个缓冲区, 持有任意一个 RowView 都会使整个批次无法被回收,
+    需要长期保存的行请先调用 to_tuple() 或 to_dict()。
+
+    Examples:
+    ----------
+    >>> view = RowView([["1", "Alice"]], 0, {"id": 0, "name": 1}, 1)
+    >>> view["name"], view[0], view.get("age", "-")
+    ('Alice', '1', '-')
+    """
+
+    __slots__ = ("_buffer", "_idx", "_header_map", "line_num")
+
+    def __init__(
+        self,
+        buffer: Sequence[Sequence[str]],
+        idx: int,
+        header_map: Mapping[str, int],
+        line_num: int = 0,
+    ) -> None:
+        self._buffer = buffer
+        self._idx = idx
+        self._header_map = header_map
+        self.line_num = line_num
+
+    def __getitem__(self, key: str | int) -> str:
+        row = self._buffer[self._idx]
+        return row[key] if isinstance(key, int) else row[self._header_map[key]]
+
+    def __len__(self) -> int:
+        return len(self._buffer[self._idx])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buffer[self._idx])
+
+    def __repr__(self) -> str:
+        return f"RowView({self.line_num}: {self._buffer[self._idx]})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        根据标题获取字段值
+
+        Parameters
+        ----------
+        name : str
+            标题名称
+        default : Any, optional
+            标题不存在或该行字段不足时返回的默认值, by default None
+
+        Returns
+        -------
+        Any
+            字段值
+        """
+        idx = self._header_map.get(name)
+        row = self._buffer[self._idx]
+        return default if idx is None or idx >= len(row) else row[idx]
+
+    def keys(self) -> KeysView[str]:
+        """
+        返回标题名称
+
+        Returns
+        -------
+        KeysView[str]
+            标题名称视图
+        """
+        return self._header_map.keys()
+
+    def to_tuple(self) -> tuple[str, ...]:
+        """
+        拷贝成元祖, 不再引用批次缓冲区
+
+        Returns
+        -------
+        tuple[str, ...]
+            行数据元祖
+        """
+        return tuple(self._buffer[self._idx])
+
+    def to_dict(self) -> dict[str, str]:
+        """
+        拷贝成字典, 不再引用批次缓冲区
+
+        Returns
+        -------
+        dict[str, str]
+            以标题为键的字典
+        """
+        row = self._buffer[self._idx]
+        return {name: row[i] for name, i in self._header_map.items()}
+
+
 class CsvData:
     """
     CSV 数据类, 由多个CsvRow组成。
@@ -319,12 +475,296 @@ class CsvData:
         self.data.append(row)
         self.cnt_of_row += 1
 
+    def to_columnar(self, *, infer_types: bool = True) -> "ColumnarCsvData":
+        """
+        转换成列式存储的 CSV 数据
+
+        Parameters
+        ----------
+        infer_types : bool, optional
+            是否进行列类型推断, by default True
+
+        Returns
+        -------
+        ColumnarCsvData
+            列式存储的 CSV 数据
+        """
+        names = self.header.get_raw_data()
+        raw_columns = zip(*(row.data for row in self.data), strict=True) if self.data else ((),) * len(names)
+        columns = {name: list(column) for name, column in zip(names, raw_columns)}
+        return ColumnarCsvData.from_raw_columns(names, columns, infer_types=infer_types)
+
     def _initialize(self) -> None:
         header_lst = self.header.get_raw_data()
         for i, v in enumerate(header_lst):
             self.header_map[v] = i
 
 
+class ColumnarCsvData:
+    """
+    列式存储的 CSV 数据类, 每一列保存为一个 array 或 list, 适合对单列进行过滤和聚合
+
+    Attributes
+    ----------
+    header : tuple[str, ...]
+        标题
+    columns : dict[str, array | list]
+        列名到列数据的映射, 没有缺失值的 int/float 列使用 array 存储, 其余使用 list
+    dtypes : dict[str, type]
+        列名到列类型的映射
+    cnt_of_row : int
+        数据行数
+
+    Methods
+    -------
+    from_raw_columns(header, raw_columns, *, infer_types=True) -> ColumnarCsvData
+        根据字符串列数据构建, 可选进行类型推断
+    column(name: str) -> array | list
+        获取列数据
+    select(*names: str) -> ColumnarCsvData
+        选择部分列
+    filter(name: str, predicate: Callable[[Any], bool]) -> ColumnarCsvData
+        根据某一列的值过滤行
+    sum(name: str) -> int | float
+        列求和
+    min(name: str) -> Any
+        列最小值
+    max(name: str) -> Any
+        列最大值
+    count_distinct(name: str) -> int
+        列去重计数
+
+    Notes
+    -----
+    类型推断按 int -> float -> bool -> str 的顺序进行, 转换通过 ConvertFactory 中的转换器完成;
+    非字符串列中的空字符串视为缺失值(None), 不参与类型推断和聚合。
+    """
+
+    TYPECODES: Mapping[type, str] = {int: "q", float: "d"}
+    BOOLEAN_STRINGS: frozenset[str] = BooleanConverter.TRUE_SET | BooleanConverter.FALSE_SET
+
+    def __init__(
+        self,
+        header: Sequence[str],
+        columns: Mapping[str, Sequence[Any]],
+        dtypes: Mapping[str, type] | None = None,
+    ) -> None:
+        self.header: tuple[str, ...] = tuple(header)
+        if missing := [name for name in self.header if name not in columns]:
+            raise ValueError(f"columns not found: {missing}")
+
+        self.columns: dict[str, Sequence[Any]] = {name: columns[name] for name in self.header}
+        self.dtypes: dict[str, type] = {name: str for name in self.header} if dtypes is None else dict(dtypes)
+
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"all columns must have the same length, got {sorted(lengths)}")
+        self.cnt_of_row = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self.cnt_of_row
+
+    @classmethod
+    def from_raw_columns(
+        cls,
+        header: Sequence[str],
+        raw_columns: Mapping[str, list[str]],
+        *,
+        infer_types: bool = True,
+    ) -> Self:
+        """
+        根据字符串列数据构建列式 CSV 数据
+
+        Parameters
+        ----------
+        header : Sequence[str]
+            标题
+        raw_columns : Mapping[str, list[str]]
+            列名到字符串列数据的映射
+        infer_types : bool, optional
+            是否进行列类型推断, by default True
+
+        Returns
+        -------
+        ColumnarCsvData
+            列式存储的 CSV 数据
+        """
+        if not infer_types:
+            return cls(header, raw_columns)
+
+        columns, dtypes = {}, {}
+        for name in header:
+            columns[name], dtypes[name] = cls._convert_column(raw_columns[name])
+        return cls(header, columns, dtypes)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        获取列数据, 返回的是内部存储本身, 不会进行拷贝
+
+        Parameters
+        ----------
+        name : str
+            列名
+
+        Returns
+        -------
+        array | list
+            列数据
+
+        Raises
+        ------
+        KeyError
+            如果列不存在
+        """
+        if name not in self.columns:
+            raise KeyError(f"column {name} not found")
+        return self.columns[name]
+
+    def select(self, *names: str) -> Self:
+        """
+        选择部分列, 新对象与当前对象共享列数据
+
+        Parameters
+        ----------
+        *names : str
+            列名
+
+        Returns
+        -------
+        ColumnarCsvData
+            只包含所选列的 CSV 数据
+        """
+        columns = {name: self.column(name) for name in names}
+        return type(self)(names, columns, {name: self.dtypes[name] for name in names})
+
+    def filter(self, name: str, predicate: Callable[[Any], bool]) -> Self:
+        """
+        根据某一列的值过滤行
+
+        Parameters
+        ----------
+        name : str
+            用于过滤的列名
+        predicate : Callable[[Any], bool]
+            过滤条件, 返回 True 的行会被保留
+
+        Returns
+        -------
+        ColumnarCsvData
+            过滤后的 CSV 数据
+        """
+        mask = list(map(predicate, self.column(name)))
+        columns = {
+            column_name: array(column.typecode, compress(column, mask))
+            if isinstance(column, array)
+            else list(compress(column, mask))
+            for column_name, column in self.columns.items()
+        }
+        return type(self)(self.header, columns, self.dtypes)
+
+    def sum(self, name: str) -> int | float:
+        """
+        列求和, 忽略缺失值
+
+        Parameters
+        ----------
+        name : str
+            列名
+
+        Returns
+        -------
+        int | float
+            求和结果
+        """
+        return sum(self._iter_present(name))
+
+    def min(self, name: str) -> Any:
+        """
+        列最小值, 忽略缺失值
+
+        Parameters
+        ----------
+        name : str
+            列名
+
+        Returns
+        -------
+        Any
+            最小值, 如果列为空则返回 None
+        """
+        return min(self._iter_present(name), default=None)
+
+    def max(self, name: str) -> Any:
+        """
+        列最大值, 忽略缺失值
+
+        Parameters
+        ----------
+        name : str
+            列名
+
+        Returns
+        -------
+        Any
+            最大值, 如果列为空则返回 None
+        """
+        return max(self._iter_present(name), default=None)
+
+    def count_distinct(self, name: str) -> int:
+        """
+        列去重计数, 忽略缺失值
+
+        Parameters
+        ----------
+        name : str
+            列名
+
+        Returns
+        -------
+        int
+            不同值的数量
+        """
+        distinct = set(self.column(name))
+        distinct.discard(None)
+        return len(distinct)
+
+    def _iter_present(self, name: str) -> Iterable[Any]:
+        column = self.column(name)
+        if isinstance(column, array) or self.dtypes[name] is str:
+            return column
+        return (v for v in column if v is not None)
+
+    @classmethod
+    def _infer_type(cls, values: Iterable[str]) -> type:
+        distinct = set(values)
+        distinct.discard("")
+        if not distinct:
+            return str
+        if all(PatternPool.INTEGER.match(v) for v in distinct):
+            return int
+        if all(PatternPool.FLOAT_NUM.match(v) for v in distinct):
+            return float
+        if all(v.strip().lower() in cls.BOOLEAN_STRINGS for v in distinct):
+            return bool
+        return str
+
+    @classmethod
+    def _convert_column(cls, values: list[str]) -> tuple[Sequence[Any], type]:
+        dtype = cls._infer_type(values)
+        if dtype is str:
+            return values, dtype
+
+        convert = ConvertFactory().converter_dict[dtype].convert
+        column = [None if v == "" else convert(v, None, raise_exception=True) for v in values]
+        typecode = cls.TYPECODES.get(dtype)
+        if typecode is not None and "" not in values:
+            try:
+                return array(typecode, column), dtype
+            except OverflowError:
+                pass
+        return column, dtype
+
+
 class CsvReader:
     """
     CSV Reader 包装类
@@ -342,6 +782,26 @@ class CsvReader:
     -------
     read() -> CsvData
         读取 CSV 文件
+    read_header() -> CsvHeader | None
+        只读取 CSV 文件的标题行
+    iter_rows() -> Generator[CsvRow, None, None]
+        流式读取 CSV 数据行
+    iter_dicts() -> Generator[dict[str, Any], None, None]
+        流式读取 CSV 数据字典
+    iter_namedtuples(model_cls: type[NamedTuple]) -> Generator[type[NamedTuple], None, None]
+        流式读取 CSV 命名元祖
+    iter_batches(batch_size: int, *, columnar: bool = False) -> Generator[list | dict, None, None]
+        按批次流式读取 CSV 数据行, 支持按列返回
+    read_columnar(*, infer_types: bool = True, batch_size: int = 65536) -> ColumnarCsvData
+        以列式存储的方式读取 CSV 文件
+    read_parallel(workers: int | None = None, *, map_func=None, reduce_func=None, initial=None) -> Any
+        按记录边界切分文件, 使用进程池并行解析
+    iter_views(batch_size: int = 65536) -> Generator[RowView, None, None]
+        流式读取共享批次缓冲区的行视图
+    get_dict_factory() -> Callable[[Iterable[str]], dict[str, str]]
+        获取缓存的行转字典函数
+    get_namedtuple_factory() -> Callable[[Iterable[str]], tuple]
+        获取缓存的行转命名元祖函数
     get_dicts_from_csv(f_name: str | PathLike) -> Generator[Mapping[str, Any], None, None]
         获取 CSV 数据字典生成器
     get_namedtuple_from_csv(f_name: str | PathLike, model_cls: type[NamedTuple]) -> \
@@ -350,6 +810,8 @@ class CsvReader:
     """
 
     DEFAULT_ENCODING = CharsetUtil.UTF_8
+    MIN_PARALLEL_CHUNK_SIZE = 1024 * 1024
+    CHUNKS_PER_WORKER = 4
 
     def __init__(
         self,
@@ -360,6 +822,8 @@ class CsvReader:
         self.file_path: str | PathLike = file_path
         self.encoding = encoding
         self.config: CsvConfig = CsvConfig() if config is None else config
+        self._header_names: tuple[str, ...] | None = None
+        self._namedtuple_cls: type[tuple] | None = None
 
     @classmethod
     def get_dicts_from_csv(
@@ -367,7 +831,7 @@ class CsvReader:
         f_name: str | PathLike,
     ) -> Generator[Mapping[str, Any], None, None]:
         """
-        根据 CSV 文件名获取 CSV 数据字典生成器
+        根据 CSV 文件名获取 CSV 数据字典生成器, 流式读取, 不会将整个文件加载到内存
 
         Parameters
         ----------
@@ -379,10 +843,7 @@ class CsvReader:
         Generator[Mapping[str, Any], None, None]
             字典生成器
         """
-        reader = cls(f_name)
-        csv_data = reader.read()
-        for row in csv_data.data:
-            yield row.to_dict(csv_data.header_map)
+        yield from cls(f_name).iter_dicts()
 
     @classmethod
     def get_namedtuple_from_csv(
@@ -391,7 +852,7 @@ class CsvReader:
         model_cls: type[NamedTuple],
     ) -> Generator[type[NamedTuple], None, None]:
         """
-        根据给定的文件描述符和命名元祖获取元祖生成器
+        根据给定的文件描述符和命名元祖获取元祖生成器, 流式读取, 不会将整个文件加载到内存
 
         Parameters
         ----------
@@ -405,10 +866,7 @@ class CsvReader:
         Generator[type[NamedTuple], None, None]
             命名元祖生成器
         """
-        reader = cls(f_name)
-        csv_data = reader.read()
-        for row in csv_data.data:
-            yield row.to_namedtuple(model_cls)
+        yield from cls(f_name).iter_namedtuples(model_cls)
 
     def read(self) -> CsvData:
         """
@@ -418,20 +876,16 @@ class CsvReader:
         -------
         CsvData
             读取到的 CSV 数据, 包含 header 和 data
+
+        Raises
+        ------
+        ValueError
+            如果 CSV 文件为空
         """
-        self._check_path()
-        path_obj = FileUtil.get_path_object(self.file_path)
-        path_obj = FileUtil.get_path_object(self.file_path)
-        with open(path_obj, encoding=self.encoding) as csv_file:
-            reader = csv.reader(
-                csv_file,
-                delimiter=self.config.delimiter,
-                strict=self.config.strict_mode,
-                lineterminator=self.config.lineterminator,
-                skipinitialspace=self.config.skip_initial_space,
-                quotechar=self.config.text_qualifier,
-            )
-            header_line = next(reader)
+        with self._open_reader() as reader:
+            header_line = next(reader, None)
+            if header_line is None:
+                raise ValueError(f"file {self.file_path} is empty")
             header_obj = CsvHeader(header_line)
 
             csv_data = CsvData(header_obj)
@@ -441,11 +895,613 @@ class CsvReader:
 
             return csv_data
 
+    def read_header(self) -> CsvHeader | None:
+        """
+        只读取 CSV 文件的标题行
+
+        Returns
+        -------
+        CsvHeader | None
+            标题行, 如果文件为空则返回 None
+        """
+        with self._open_reader() as reader:
+            header_line = next(reader, None)
+        return None if header_line is None else CsvHeader(header_line)
+
+    def iter_rows(self) -> Generator[CsvRow, None, None]:
+        """
+        流式读取 CSV 数据行(不包含标题行), 同一时刻只持有当前行
+
+        Yields
+        ------
+        Generator[CsvRow, None, None]
+            CsvRow 生成器, 行号与 read() 保持一致
+        """
+        with self._open_reader() as reader:
+            if next(reader, None) is None:
+                return
+            for row_num, row in enumerate(reader, 1):
+                yield CsvRow(row_num, row, False)
+
+    def iter_dicts(self) -> Generator[dict[str, Any], None, None]:
+        """
+        流式读取 CSV 数据行并转换成以标题为键的字典
+
+        Yields
+        ------
+        Generator[dict[str, Any], None, None]
+            字典生成器
+
+        Raises
+        ------
+        ValueError
+            如果某行字段数量少于标题字段数量
+        """
+        with self._open_reader() as reader:
+            header_line = next(reader, None)
+            if header_line is None:
+                return
+            header_len = len(header_line)
+            for row in reader:
+                if len(row) < header_len:
+                    raise ValueError(f"row has {len(row)} fields, less than header: {header_len}")
+                yield dict(zip(header_line, row))
+
+    def iter_namedtuples(self, model_cls: type[NamedTuple]) -> Generator[type[NamedTuple], None, None]:
+        """
+        流式读取 CSV 数据行并转换成命名元祖
+
+        Parameters
+        ----------
+        model_cls : type[NamedTuple]
+            命名元祖类
+
+        Yields
+        ------
+        Generator[type[NamedTuple], None, None]
+            命名元祖生成器
+        """
+        make = model_cls._make
+        with self._open_reader() as reader:
+            if next(reader, None) is None:
+                return
+            for row in reader:
+                yield make(row)  # type: ignore
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        *,
+        columnar: bool = False,
+    ) -> Generator[list[list[str]] | dict[str, list[str]], None, None]:
+        """
+        按批次流式读取 CSV 数据行, 同一时刻只持有一个批次
+
+        Parameters
+        ----------
+        batch_size : int
+            每个批次的最大行数
+        columnar : bool, optional
+            是否以列的方式返回批次, by default False
+
+        Yields
+        ------
+        Generator[list[list[str]] | dict[str, list[str]], None, None]
+            columnar 为 False 时返回行列表, 否则返回以标题为键、列数据列表为值的字典
+
+        Raises
+        ------
+        ValueError
+            如果 batch_size 小于等于 0, 或者 columnar 为 True 时某行字段数量与标题不一致
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        with self._open_reader() as reader:
+            header_line = next(reader, None)
+            if header_line is None:
+                return
+            header_len = len(header_line)
+            while batch := list(islice(reader, batch_size)):
+                if not columnar:
+                    yield batch
+                    continue
+                if any(len(row) != header_len for row in batch):
+                    raise ValueError(f"row length does not match header length: {header_len}")
+                yield {name: list(column) for name, column in zip(header_line, zip(*batch))}
+
+    def iter_views(self, batch_size: int = 65536) -> Generator[RowView, None, None]:
+        """
+        按批次读取 CSV 数据行, 为每一行返回一个共享批次缓冲区的 RowView
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            每个批次的最大行数, by default 65536
+
+        Yields
+        ------
+        Generator[RowView, None, None]
+            行视图生成器, 行号与 read() 保持一致
+
+        Raises
+        ------
+        ValueError
+            如果 batch_size 小于等于 0
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        with self._open_reader() as reader:
+            header_line = next(reader, None)
+            if header_line is None:
+                return
+            header_map = {name: i for i, name in enumerate(header_line)}
+            line_num = 0
+            while batch := list(islice(reader, batch_size)):
+                for idx in range(len(batch)):
+                    line_num += 1
+                    yield RowView(batch, idx, header_map, line_num)
+
+    def get_dict_factory(self) -> Callable[[Iterable[str]], dict[str, str]]:
+        """
+        获取行转字典函数, 标题只在第一次调用时读取并缓存在当前 reader 中
+
+        Returns
+        -------
+        Callable[[Iterable[str]], dict[str, str]]
+            接收一行数据(list、tuple 或 RowView)并返回以标题为键的字典
+        """
+        names = self._get_header_names()
+        return lambda row: dict(zip(names, row))
+
+    def get_namedtuple_factory(self) -> Callable[[Iterable[str]], tuple]:
+        """
+        获取行转命名元祖函数, 命名元祖类根据标题生成并缓存在当前 reader 中
+
+        Returns
+        -------
+        Callable[[Iterable[str]], tuple]
+            接收一行数据(list、tuple 或 RowView)并返回命名元祖
+
+        Notes
+        -----
+        不是合法标识符的标题会被重命名为 _0、_1 等位置名称
+        """
+        if self._namedtuple_cls is None:
+            self._namedtuple_cls = namedtuple("CsvRecord", self._get_header_names(), rename=True)  # type: ignore
+        return self._namedtuple_cls._make  # type: ignore
+
+    def read_columnar(self, *, infer_types: bool = True, batch_size: int = 65536) -> ColumnarCsvData:
+        """
+        以列式存储的方式读取 CSV 文件, 不会为每一行创建 CsvRow 对象
+
+        Parameters
+        ----------
+        infer_types : bool, optional
+            是否进行列类型推断, by default True
+        batch_size : int, optional
+            每次从文件读取的行数, by default 65536
+
+        Returns
+        -------
+        ColumnarCsvData
+            列式存储的 CSV 数据
+
+        Raises
+        ------
+        ValueError
+            如果 CSV 文件为空, 或者某行字段数量与标题不一致
+        """
+        header = self.read_header()
+        if header is None:
+            raise ValueError(f"file {self.file_path} is empty")
+
+        names = header.get_raw_data()
+        raw_columns: dict[str, list[str]] = {name: [] for name in names}
+        for batch in self.iter_batches(batch_size, columnar=True):
+            for name, values in batch.items():  # type: ignore
+                raw_columns[name].extend(values)
+        return ColumnarCsvData.from_raw_columns(names, raw_columns, infer_types=infer_types)
+
+    def read_parallel(
+        self,
+        workers: int | None = None,
+        *,
+        chunk_size: int | None = None,
+        map_func: Callable[[list[list[str]]], Any] | None = None,
+        reduce_func: Callable[[Any, Any], Any] | None = None,
+        initial: Any = None,
+    ) -> Any:
+        """
+        按记录边界将文件切分成多个块, 在进程池中并行解析
+
+        Parameters
+        ----------
+        workers : int | None, optional
+            进程数, 默认为 CPU 核数; 为 1 时在当前进程中解析
+        chunk_size : int | None, optional
+            每个块的大致字节数, 默认按 workers 数量均分(每个进程约 4 个块, 最小 1 MiB)
+        map_func : Callable[[list[list[str]]], Any] | None, optional
+            在子进程中对每个块的数据行(不含标题行)调用的函数, 必须可以被 pickle
+        reduce_func : Callable[[Any, Any], Any] | None, optional
+            在当前进程中按块顺序合并 map_func 结果的函数
+        initial : Any, optional
+            reduce_func 的初始值, 为 None 时使用第一个块的结果(没有数据块时返回 None)
+
+        Returns
+        -------
+        Any
+            未指定 map_func 时返回按原始顺序合并的 CsvData;
+            指定 map_func 时返回按块顺序排列的结果列表, 若同时指定 reduce_func 则返回合并后的结果
+
+        Raises
+        ------
+        ValueError
+            如果 workers 或 chunk_size 不合法, CSV 文件为空, 或者文件编码无法按字节切分(utf-8-sig 按 utf-8 切分)
+
+        Notes
+        -----
+        切分点只会落在文本限定符之外的换行符上, 通过统计限定符出现次数的奇偶性判断,
+        因此要求限定符只出现在被限定的字段中(与 csv 模块默认的 doublequote 行为一致)。
+        """
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        header = self.read_header()
+        if header is None:
+            raise ValueError(f"file {self.file_path} is empty")
+
+        path_obj = FileUtil.get_path_object(self.file_path)
+        # utf-8-sig 只在文件开头多一个 BOM, 数据块都在标题行之后, 按 utf-8 切分和解码
+        is_utf8_sig = codecs.lookup(self.encoding).name == "utf-8-sig"
+        encoding = "utf-8" if is_utf8_sig else self.encoding
+        ranges = self._split_ranges(path_obj, encoding, workers, chunk_size, skip_bom=is_utf8_sig)
+        tasks = [(path_obj, encoding, self.config, start, end, map_func) for start, end in ranges]
+        if workers == 1 or len(tasks) <= 1:
+            results = list(map(_parse_csv_chunk, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                results = list(executor.map(_parse_csv_chunk, tasks))
+
+        if map_func is not None:
+            if reduce_func is None:
+                return results
+            if initial is None:
+                return reduce(reduce_func, results) if results else None
+            return reduce(reduce_func, results, initial)
+
+        csv_data = CsvData(header)
+        row_num = 0
+        for rows in results:
+            for row in rows:
+                row_num += 1
+                csv_data.append_row(CsvRow(row_num, row, False))
+        return csv_data
+
+    def _get_header_names(self) -> tuple[str, ...]:
+        if self._header_names is None:
+            header = self.read_header()
+            if header is None:
+                raise ValueError(f"file {self.file_path} is empty")
+            self._header_names = header.get_raw_data()
+        return self._header_names
+
+    def _split_ranges(
+        self, path_obj: PathLike, encoding: str, workers: int, chunk_size: int | None, *, skip_bom: bool = False
+    ) -> list[tuple[int, int]]:
+        newline, quote = "\n".encode(encoding), self.config.text_qualifier.encode(encoding)
+        if newline != b"\n" or len(quote) != 1:
+            raise ValueError(f"encoding {self.encoding} cannot be split on byte boundaries")
+
+        with open(path_obj, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                # 第一个记录是标题行, 数据从其后的第一个安全换行符开始
+                bom = codecs.BOM_UTF8 if skip_bom else b""
+                header_start = len(bom) if buf[: len(bom)] == bom else 0
+                data_start = next(self._iter_record_boundaries(buf, header_start, 0, quote), size)
+                if chunk_size is None:
+                    chunk_size = max(
+                        self.MIN_PARALLEL_CHUNK_SIZE, -(-(size - data_start) // (workers * self.CHUNKS_PER_WORKER))
+                    )
+                starts = [data_start, *self._iter_record_boundaries(buf, data_start, chunk_size, quote)]
+
+        ends = [*starts[1:], size]
+        return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+    @staticmethod
+    def _iter_record_boundaries(buf: mmap.mmap, start: int, chunk_size: int, quote: bytes) -> Iterator[int]:
+        step = 16 * 1024 * 1024
+        size = len(buf)
+        pos, in_quotes = start, False
+        target = start + chunk_size
+        while target < size:
+            newline_pos = buf.find(b"\n", max(target, pos))
+            if newline_pos == -1:
+                return
+            cnt = sum(buf[i : min(i + step, newline_pos)].count(quote) for i in range(pos, newline_pos, step))
+            in_quotes ^= cnt % 2 == 1
+            pos = newline_pos + 1
+            if not in_quotes:
+                yield pos
+                target = pos + chunk_size
+
+    @contextmanager
+    def _open_reader(self) -> Iterator[Iterator[list[str]]]:
+        self._check_path()
+        path_obj = FileUtil.get_path_object(self.file_path)
+        with open(path_obj, encoding=self.encoding, newline="") as csv_file:
+            yield csv.reader(csv_file, **self.config.get_dialect_options())
+
     def _check_path(self) -> None:
-        if not FileUtil.is_exist(self.file_path):
         if not FileUtil.is_exist(self.file_path):
             raise FileNotFoundError(f"file {self.file_path} not found")
 
-        if not FileUtil.is_match_extension(self.file_path, "csv"):
         if not FileUtil.is_match_extension(self.file_path, "csv"):
             raise ValueError(f"file {self.file_path} is not a csv file")
+
+
+class CsvWriter:
+    """
+    CSV Writer 包装类, 与 CsvReader 共用 CsvConfig
+
+    Attributes
+    ----------
+    file_path : str | PathLike
+        CSV 文件路径
+    encoding : str
+        文件编码
+    config : CsvConfig
+        CSV 配置
+    buffer_size : int
+        写缓冲区大小(字节), 数据先在缓冲区中累积, 写满后才落盘(或送入压缩器)
+    compression : str | None
+        压缩格式, 支持 gzip 和 zip, 默认根据文件扩展名(.gz / .zip)推断
+    atomic : bool
+        是否先写入同目录下的临时文件, 成功关闭后再原子地重命名为目标文件
+    cnt_of_row : int
+        已写入的行数(包含标题行)
+
+    Methods
+    -------
+    open() -> Self
+        打开写入流
+    close() -> None
+        刷新缓冲区并完成写入
+    abort() -> None
+        放弃写入并删除临时文件
+    write_header(header: Sequence[str]) -> None
+        写入标题行
+    write_row(row: Iterable[Any]) -> None
+        写入一行
+    write_many(rows: Iterable[Iterable[Any]]) -> None
+        批量写入多行
+    write_dicts(rows: Iterable[Mapping[str, Any]], field_names: Sequence[str]) -> None
+        按给定的字段顺序批量写入字典
+
+    Examples:
+    ----------
+    >>> with CsvWriter("export.csv.gz") as writer:  # doctest: +SKIP
+    ...     writer.write_header(["id", "name"])
+    ...     writer.write_many([(1, "Alice"), (2, "Bob")])
+    """
+
+    DEFAULT_ENCODING = CharsetUtil.UTF_8
+    DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+    BATCH_SIZE = 65536
+    GZIP = "gzip"
+    ZIP = "zip"
+    COMPRESSION_EXTENSIONS: Mapping[str, str] = {".gz": GZIP, ".zip": ZIP}
+
+    def __init__(
+        self,
+        file_path: str | PathLike,
+        encoding: str = DEFAULT_ENCODING,
+        config: CsvConfig | None = None,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: str | None = None,
+        compress_level: int = 6,
+        atomic: bool = True,
+    ) -> None:
+        if buffer_size <= 0:
+            raise ValueError(f"buffer_size must be positive, got {buffer_size}")
+
+        self.file_path: str | PathLike = file_path
+        self.encoding = encoding
+        self.config: CsvConfig = CsvConfig() if config is None else config
+        self.buffer_size = buffer_size
+        path_obj = FileUtil.get_path_object(file_path)
+        self.compression = self.COMPRESSION_EXTENSIONS.get(path_obj.suffix) if compression is None else compression
+        if self.compression not in (None, self.GZIP, self.ZIP):
+            raise ValueError(f"unsupported compression: {self.compression}")
+        self.compress_level = compress_level
+        self.atomic = atomic
+        self.cnt_of_row = 0
+
+        self._path = path_obj
+        self._tmp_path: Path | None = None
+        self._stack: ExitStack | None = None
+        self._writer: Any = None
+
+    def __enter__(self) -> Self:
+        return self.open()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> Self:
+        """
+        打开写入流, 原子模式下写入同目录的临时文件
+
+        Returns
+        -------
+        Self
+            当前 writer
+
+        Raises
+        ------
+        ValueError
+            如果 writer 已经打开
+        """
+        if self._stack is not None:
+            raise ValueError(f"writer for {self.file_path} is already opened")
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self.atomic:
+            self._tmp_path = self._path.with_name(f".{self._path.name}.{uuid.uuid4().hex}.tmp")
+        target = self._tmp_path if self.atomic else self._path
+
+        with ExitStack() as stack:
+            raw = stack.enter_context(open(target, "xb" if self.atomic else "wb", buffering=self.buffer_size))  # type: ignore
+            if self.compression == self.GZIP:
+                sink = stack.enter_context(
+                    gzip.GzipFile(filename=self._path.stem, mode="wb", fileobj=raw, compresslevel=self.compress_level)
+                )
+            elif self.compression == self.ZIP:
+                archive = stack.enter_context(
+                    zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compress_level)
+                )
+                sink = stack.enter_context(archive.open(self._get_arcname(), "w", force_zip64=True))
+            else:
+                sink = raw
+
+            if sink is not raw:
+                sink = stack.enter_context(io.BufferedWriter(sink, self.buffer_size))  # type: ignore
+            text = stack.enter_context(io.TextIOWrapper(sink, encoding=self.encoding, newline="", write_through=False))
+            self._writer = csv.writer(text, **self.config.get_dialect_options())
+            self._stack = stack.pop_all()
+        return self
+
+    def close(self) -> None:
+        """
+        刷新缓冲区并关闭所有流, 原子模式下将临时文件重命名为目标文件
+        """
+        if self._stack is None:
+            return
+        try:
+            self._stack.close()
+        except BaseException:
+            self._remove_tmp()
+            raise
+        finally:
+            self._stack, self._writer = None, None
+
+        if self._tmp_path is not None:
+            os.replace(self._tmp_path, self._path)
+            self._tmp_path = None
+
+    def abort(self) -> None:
+        """
+        放弃写入, 关闭所有流并删除临时文件; 非原子模式下已写入的内容会保留
+        """
+        if self._stack is not None:
+            try:
+                self._stack.close()
+            finally:
+                self._stack, self._writer = None, None
+        self._remove_tmp()
+
+    def write_header(self, header: Sequence[str]) -> None:
+        """
+        写入标题行
+
+        Parameters
+        ----------
+        header : Sequence[str]
+            标题
+        """
+        self.write_row(header)
+
+    def write_row(self, row: Iterable[Any]) -> None:
+        """
+        写入一行
+
+        Parameters
+        ----------
+        row : Iterable[Any]
+            行数据, 可以是 list、tuple、命名元祖或者 RowView
+        """
+        self._get_writer().writerow(row)
+        self.cnt_of_row += 1
+
+    def write_many(self, rows: Iterable[Iterable[Any]]) -> None:
+        """
+        批量写入多行, 按批次调用 csv.writer.writerows, 避免逐行的 Python 调用开销
+
+        Parameters
+        ----------
+        rows : Iterable[Iterable[Any]]
+            多行数据
+        """
+        writer = self._get_writer()
+        if isinstance(rows, Sequence):
+            writer.writerows(rows)
+            self.cnt_of_row += len(rows)
+            return
+
+        iterator = iter(rows)
+        while batch := list(islice(iterator, self.BATCH_SIZE)):
+            writer.writerows(batch)
+            self.cnt_of_row += len(batch)
+
+    def write_dicts(self, rows: Iterable[Mapping[str, Any]], field_names: Sequence[str]) -> None:
+        """
+        按给定的字段顺序批量写入字典, 不会写入标题行
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[str, Any]]
+            字典数据
+        field_names : Sequence[str]
+            字段顺序
+
+        Raises
+        ------
+        KeyError
+            如果某个字典缺少字段
+        """
+        getter = itemgetter(*field_names)
+        if len(field_names) == 1:
+            self.write_many((getter(row),) for row in rows)
+        else:
+            self.write_many(map(getter, rows))
+
+    def _get_writer(self) -> Any:
+        if self._writer is None:
+            raise ValueError(f"writer for {self.file_path} is not opened")
+        return self._writer
+
+    def _get_arcname(self) -> str:
+        name = self._path.stem if self._path.suffix == ".zip" else self._path.name
+        return name if name.endswith(".csv") else f"{name}.csv"
+
+    def _remove_tmp(self) -> None:
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            self._tmp_path = None
+
+
+def _parse_csv_chunk(
+    task: tuple[PathLike, str, CsvConfig, int, int, Callable[[list[list[str]]], Any] | None],
+) -> Any:
+    path_obj, encoding, config, start, end, map_func = task
+    with open(path_obj, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    rows = list(csv.reader(io.StringIO(text, newline=""), **config.get_dialect_options()))
+    return rows if map_func is None else map_func(rows)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   config_test.py
+@Date       :   2026/10/18
+@Desc       :   None
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import json
+import threading
+import warnings
+
+import allure  # type: ignore
+import pytest
+
+from .context_test import Configurations, FrozenConfig, flatten_dict
+
+
+def write_config(path, configs) -> None:
+    path.write_text(json.dumps(configs), encoding="utf-8")
+
+
+@allure.feature("配置")
+@allure.description("配置加载、快照与热加载")
+@allure.tag("Config", "tag")
+class TestConfigurations:
+    @allure.title("测试配置快照与变化通知")
+    def test_snapshot_and_subscribe(cls, tmp_path) -> None:
+        config_file = tmp_path / "config.json"
+        write_config(config_file, {"debug_enable": "true", "owner": "etl"})
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            config = Configurations(str(config_file))
+
+        with allure.step("步骤1:从快照读取配置"):
+            assert config.get_boolean_value("debug_enable") is True
+            assert config.get_config_value("owner") == "etl"
+            assert config.get_numeric_value("text_scale") == 150.0
+            snapshot = config.get_snapshot()
+            assert snapshot.basic["debug_enable"] is True
+            with pytest.raises(TypeError):
+                snapshot.basic["debug_enable"] = False  # type: ignore
+            with pytest.raises(KeyError):
+                config.get_basic_config_value("missing")
+
+        with allure.step("步骤2:修改配置时发布新快照并通知订阅者"):
+            events = []
+            config.subscribe(lambda new, changed: events.append((new.version, changed)))
+            config.set_basic_config("text_scale", 200)
+            config.set_customer_config("owner", "etl")
+            config.reset_config("text_scale")
+            assert [changed for _, changed in events] == [{"text_scale"}, {"text_scale"}]
+            assert events[0][0] > snapshot.version
+            assert snapshot.basic["text_scale"] == 150.0
+
+        with allure.step("步骤3:重新加载配置文件"):
+            write_config(config_file, {"debug_enable": False, "text_fill_char": "*"})
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                changed = config.reload()
+            assert changed == {"debug_enable", "text_fill_char", "owner"}
+            assert config.get_string_value("text_fill_char") == "*"
+            assert config.is_not_customer_config("owner")
+
+            config_file.write_text("{broken", encoding="utf-8")
+            with pytest.raises(ValueError):
+                config.reload()
+            assert config.get_string_value("text_fill_char") == "*"
+
+    @allure.title("测试监听配置文件")
+    def test_watch(cls, tmp_path) -> None:
+        config_file = tmp_path / "config.json"
+        write_config(config_file, {"text_scale": 10})
+        reloaded = threading.Event()
+        config = Configurations(str(config_file), watch=True, poll_interval=0.01)
+        config.subscribe(lambda new, changed: reloaded.set())
+        try:
+            with allure.step("步骤1:文件变化后在后台线程中替换快照"):
+                write_config(config_file, {"text_scale": 2000})
+                assert reloaded.wait(5)
+                assert config.get_numeric_value("text_scale") == 2000.0
+        finally:
+            config.stop_watching()
+
+        with allure.step("步骤2:没有配置文件时不能监听"):
+            with pytest.raises(ValueError):
+                Configurations().watch()
+
+    @allure.title("测试展平配置与预先解析的读取器")
+    def test_flatten_and_accessor(cls, tmp_path) -> None:
+        config_file = tmp_path / "config.json"
+        nested = {"db": {"host": "localhost", "port": "3306", "replica": {}}, "text_scale": 80, "hosts": ["a", "b"]}
+        write_config(config_file, nested)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            config = Configurations(str(config_file))
+
+        with allure.step("步骤1:加载时展平嵌套字典"):
+            assert flatten_dict(nested) == {
+                "db.host": "localhost",
+                "db.port": "3306",
+                "db.replica": {},
+                "text_scale": 80,
+                "hosts": ["a", "b"],
+            }
+            assert config.get_config_value("db.host") == "localhost"
+            assert config.get_numeric_value("text_scale") == 80.0
+
+        with allure.step("步骤2:读取器转换类型并在快照变化后刷新"):
+            port = config.accessor("db.port", int)
+            debug = config.accessor("DEBUG_ENABLE", bool)
+            timeout = config.accessor("db.timeout", float, default=1.5)
+            assert port() == 3306
+            assert debug() is False
+            assert timeout() == 1.5
+            with pytest.raises(KeyError):
+                config.accessor("db.missing")
+            config.set_customer_config("db.port", "5432")
+            config.set_basic_config("debug_enable", "true")
+            assert port() == 5432
+            assert debug() is True
+
+        with allure.step("步骤3:只读配置对象"):
+            frozen = config.freeze()
+            assert isinstance(frozen, FrozenConfig)
+            assert frozen is config.freeze()
+            assert frozen.db.host == "localhost"
+            assert frozen["db.port"] == "5432"
+            assert frozen.debug_enable is True
+            assert not hasattr(frozen, "__dict__")
+            with pytest.raises(AttributeError):
+                frozen.db.host = "remote"
+            config.set_customer_config("db.host", "remote")
+            assert config.freeze().db.host == "remote"
+            assert frozen.db.host == "localhost"
+
+        with allure.step("步骤4:与内部成员冲突的名称只能通过下标读取"):
+            frozen = FrozenConfig.from_flat(
+                {"__priv": 2, "_values": 3, "to_dict": 4, "from_flat.x": 5, "name": "svc", "_hidden.port": 6}
+            )
+            assert frozen.name == "svc"
+            assert frozen["__priv"] == 2
+            assert frozen["_values"] == 3
+            assert frozen["from_flat.x"] == 5
+            assert frozen["_hidden.port"] == 6
+            assert frozen.to_dict()["to_dict"] == 4
+            assert callable(FrozenConfig.from_flat)
@@ -21,8 +21,11 @@ from pythontools.date.relativedelta import relativedelta  # noqa: F401
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from pythontools.bigdata.sketches import BloomFilter, CountingBloomFilter, CountMinSketch, HyperLogLog  # noqa: F401
 from pythontools.collection.utils import CollectionUtil  # noqa: F401
 from pythontools.core import log  # noqa: F401
+from pythontools.compress.zip import ZipIndex, ZipUtil  # noqa: F401
+from pythontools.config.config import Configurations, ConfigSnapshot, FrozenConfig, flatten_dict  # noqa: F401
 from pythontools.core.constants.datetime_constant import (  # noqa: F401
     Month,
     Quarter,  # type: ignore # noqa: F401
@@ -42,20 +45,11 @@ from pythontools.core.constants.string_constant import (
 )
 from pythontools.core.convert.convertor import BasicConvertor  # noqa: F401
 from pythontools.core.decorator import Singleton, TraceUsedTime, UnCheckFunction  # noqa: F401
-from pythontools.core.errors import ConversionError, UnsupportedOperationError, ValidationError  # noqa: F401
-from pythontools.core.io.fileutils import (
-    # noqa: F401
-    FileUtil,  # noqa: F401
-)
-from pythontools.core.text.csv.csv_structure import CsvConfig, CsvReader  # noqa: F401
-
-# from pythontools.core.text.csv.csv_utils import CsvUtil  # noqa: F401
-from pythontools.core.text.finder.strfinder import AbstractStrFinder, PatternFinder, StrFinder  # noqa: F401
-from pythontools.core.text.passwd import PasswdStrengthUtil  # noqa: F401
-from pythontools.core.text.strjoiner import NullMode, StrJoiner  # noqa: F401
-from pythontools.core.utils.basicutils import (
+from pythontools.core.errors import ConversionError, DatetimeParseError, UnsupportedOperationError  # noqa: F401
+from pythontools.core.utils.basic_utils import (
     BooleanUtil,  # noqa: F401
     RandomUtil,  # noqa: F401
+    ReUtil,  # noqa: F401
     SequenceUtil,  # noqa: F401
     StringUtil,  # noqa: F401
 )
@@ -63,7 +57,12 @@ from pythontools.core.utils.boolean_utils import BooleanUtil  # noqa: F401
 from pythontools.core.utils.datetime_utils import DatetimeUtil  # noqa: F401
 from pythontools.core.utils.desensitized_utils import DesensitizedUtil  # noqa: F401
 from pythontools.core.utils.encoding.graycode import GrayCode  # noqa: F401
-from pythontools.core.utils.encoding.hash.hashutils import FnvHash  # noqa: F401
+from pythontools.core.utils.encoding.hash.hashutils import FnvHash, FnvHasher, MetroHash  # noqa: F401
+from pythontools.core.utils.encoding.hash.sharding import (  # noqa: F401
+    ConsistentHashRing,
+    JumpHashSharder,
+    RendezvousHashSharder,
+)
 from pythontools.core.utils.env_utils import EnvUtil  # noqa: F401
 from pythontools.core.utils.id_utils import IDCard, IDCardUtil  # noqa: F401
 from pythontools.core.utils.numberutils import NumberUtil  # noqa: F401,
@@ -77,11 +76,21 @@ from pythontools.core.validators.string_validator import StringValidator  # noqa
 from pythontools.core.validators.type_validator import TypeValidator  # noqa: F401
 from pythontools.date.format.iso8601 import ISO8601  # noqa: F401
 from pythontools.date.format.rfc822 import RFC822  # noqa: F401
+from pythontools.io.dedup import DuplicateFinder, blake2b_hexdigest  # noqa: F401
 from pythontools.io.fileutils import (
     # noqa: F401
     FileUtil,  # noqa: F401
 )
-from pythontools.text.csv.csv_structure import CsvConfig, CsvReader  # noqa: F401
+from pythontools.io.manifest import FileManifest, ManifestDiff  # noqa: F401
+from pythontools.text.csv.csv_structure import (  # noqa: F401
+    ColumnarCsvData,
+    CsvConfig,
+    CsvHeader,
+    CsvReader,
+    CsvRow,
+    CsvWriter,
+    RowView,
+)
 
 # from pythontools.core.text.csv.csv_utils import CsvUtil  # noqa: F401
 from pythontools.text.finder.strfinder import AbstractStrFinder, PatternFinder, StrFinder  # noqa: F401
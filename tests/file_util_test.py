@@ -14,12 +14,22 @@ Change Activity:
 """
 # here put the import lib
 
+import json
+import os
+import time
+from pathlib import Path
+
 import allure  # type: ignore
+import pytest
 from faker import Faker
 from loguru import logger
 
 from .context_test import (
+    DuplicateFinder,
+    FileManifest,
     FileUtil,
+    ManifestDiff,
+    blake2b_hexdigest,
 )
 
 BASIC_FAKE = Faker()
@@ -62,6 +72,227 @@ class TestFileUtil:
         logger.debug(nanoseconds)
         logger.debug(format_str)
 
+    @allure.title("测试按字节统计文件行数")
+    def test_get_line_cnt_of_file(cls, tmp_path) -> None:
+        cases = {"l1\nl2\r\nl3": 3, "l1\nl2\n": 2, "": 0, "\n\n": 2}
+        for i, (content, cnt) in enumerate(cases.items()):
+            log_file = tmp_path / f"{i}.log"
+            log_file.write_bytes(content.encode())
+            assert FileUtil.get_line_cnt_of_file(log_file) == cnt
+
+    @allure.title("测试行索引与按行号读取")
+    def test_line_index(cls, tmp_path) -> None:
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(b"".join(b"line %d\r\n" % i for i in range(1, 1001)) + b"tail")
+
+        with allure.step("步骤1:构建行索引并保存旁路文件"):
+            offsets = FileUtil.build_line_index(log_file)
+            assert len(offsets) == FileUtil.get_line_cnt_of_file(log_file) == 1001
+            assert offsets[:3].tolist() == [0, 8, 16]
+            assert (tmp_path / "app.log.lidx").exists()
+
+        with allure.step("步骤2:根据行号读取"):
+            assert FileUtil.get_line(log_file, 1) == "line 1\r\n"
+            assert FileUtil.get_line(log_file, 1001) == "tail"
+            assert FileUtil.get_lines_range(log_file, 999, 1001) == ["line 999\r\n", "line 1000\r\n", "tail"]
+            with pytest.raises(IndexError):
+                FileUtil.get_line(log_file, 1002)
+
+        with allure.step("步骤3:文件变化后索引重新构建"):
+            with open(log_file, "ab") as f:
+                f.write(b"\nappended\n")
+            assert FileUtil.get_line(log_file, 1002) == "appended\n"
+
+    @allure.title("测试编码检测与流式读取")
+    def test_iter_lines(cls, tmp_path) -> None:
+        with allure.step("步骤1:根据样本检测编码"):
+            gbk_file = tmp_path / "gbk.log"
+            gbk_file.write_bytes("你好\r\n世界".encode("gbk"))
+            assert FileUtil.detect_charset(gbk_file) == "GBK"
+            assert FileUtil.get_lines(gbk_file) == ["你好\n", "世界"]
+
+            bom_file = tmp_path / "bom.log"
+            bom_file.write_bytes(b"\xef\xbb\xbfhello\n")
+            assert FileUtil.detect_charset(bom_file) == "UTF-8-SIG"
+            assert FileUtil.get_lines(bom_file) == ["hello\n"]
+
+        with allure.step("步骤2:混合编码文件在出错的行切换编码"):
+            mixed_file = tmp_path / "mixed.log"
+            mixed_file.write_bytes("中文 utf8\n".encode() + "中文 gbk\n".encode("gbk") * 2)
+            assert FileUtil.detect_charset(mixed_file, sample_size=8) == "UTF-8"
+            lines = list(FileUtil.iter_lines(mixed_file, sample_size=8))
+            assert lines == ["中文 utf8\n", "中文 gbk\n", "中文 gbk\n"]
+            with pytest.raises(UnicodeDecodeError):
+                list(FileUtil.iter_lines(mixed_file, "utf-8"))
+
+        with allure.step("步骤3:无法解码的文件"):
+            bad_file = tmp_path / "bad.log"
+            bad_file.write_bytes(b"ok\n\xff\xff\n")
+            with pytest.raises(ValueError):
+                FileUtil.get_lines(bad_file)
+
+    @allure.title("测试基于scandir的目录遍历")
+    def test_walk(cls, tmp_path) -> None:
+        for rel_path, size in [
+            ("a.sql", 10),
+            ("b.csv", 2000),
+            ("sub/c.sql", 5),
+            ("sub/deep/d.txt", 1),
+            (".hidden/e.sql", 1),
+            ("sub/.f.sql", 1),
+        ]:
+            f_path = tmp_path / rel_path
+            f_path.parent.mkdir(parents=True, exist_ok=True)
+            f_path.write_bytes(b"x" * size)
+
+        def names(**kwargs) -> list[str]:
+            return sorted(os.path.relpath(entry.path, tmp_path) for entry in FileUtil.walk(tmp_path, **kwargs))
+
+        with allure.step("步骤1:与os.walk的结果和顺序一致"):
+            expected = [Path(root) / f for root, _, fs in os.walk(tmp_path) for f in fs]
+            assert FileUtil.list_files_from_path(tmp_path) == expected
+            assert len(FileUtil.get_file_from_dir_by_extension(tmp_path)) == 4
+
+        with allure.step("步骤2:过滤条件"):
+            assert names(extensions=["sql"], include_hidden=False) == ["a.sql", os.path.join("sub", "c.sql")]
+            assert names(min_size=100) == ["b.csv"]
+            assert names(max_size=1, pattern="*.txt") == [os.path.join("sub", "deep", "d.txt")]
+            assert names(modified_before=time.time() - 3600) == []
+            assert names(include_files=False, include_dirs=True, include_hidden=False) == [
+                "sub",
+                os.path.join("sub", "deep"),
+            ]
+            assert names(predicate=lambda entry: entry.stat().st_size == 5) == [os.path.join("sub", "c.sql")]
+
+        with allure.step("步骤3:线程池并行遍历"):
+            assert names(workers=4) == names()
+            with pytest.raises(ValueError):
+                next(FileUtil.walk(tmp_path / "a.sql"))
+
+        with allure.step("步骤4:指向文件夹的链接按文件夹处理, 只在跟随链接时进入"):
+            files = names()
+            (tmp_path / "link").symlink_to(tmp_path / "sub", target_is_directory=True)
+            assert names() == files
+            assert "link" in names(include_files=False, include_dirs=True)
+            assert os.path.join("link", "deep") not in names(include_files=False, include_dirs=True)
+            assert os.path.join("link", "deep", "d.txt") in names(follow_symlinks=True)
+
+
+@allure.feature("增量文件清单")
+@allure.description("增量文件清单测试")
+@allure.tag("util")
+class TestFileManifest:
+    @allure.title("测试清单的新增、修改与删除")
+    def test_update(cls, tmp_path) -> None:
+        root = tmp_path / "data"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.txt").write_text("aaa")
+        (root / "sub" / "b.txt").write_text("bbb")
+
+        with FileManifest(tmp_path / "files.manifest") as manifest:
+            with allure.step("步骤1:首次扫描全部为新增"):
+                assert manifest.update(root) == ManifestDiff(["a.txt", "sub/b.txt"], [], [])
+                assert len(manifest) == 2
+                assert manifest.get("a.txt").size == 3
+                assert manifest.diff(root).is_empty()
+
+            with allure.step("步骤2:只扫描变化"):
+                (root / "a.txt").write_text("a longer line")
+                (root / "c.txt").write_text("c")
+                (root / "sub" / "b.txt").unlink()
+                assert manifest.diff(root) == ManifestDiff(["c.txt"], ["a.txt"], ["sub/b.txt"])
+                assert len(manifest) == 2
+                manifest.update(root)
+                assert [state.path for state in manifest] == ["a.txt", "c.txt"]
+
+        with FileManifest(tmp_path / "files.manifest") as manifest:
+            assert "c.txt" in manifest
+            assert manifest.diff(root).is_empty()
+
+    @allure.title("测试大小相同、修改时间不同时通过哈希判断变化")
+    def test_hash_contents(cls, tmp_path) -> None:
+        (tmp_path / "touched.txt").write_text("same")
+        (tmp_path / "edited.txt").write_text("1234")
+        with FileManifest(hash_contents=True) as manifest:
+            manifest.update(tmp_path)
+            assert manifest.get("edited.txt").digest is not None
+
+            os.utime(tmp_path / "touched.txt", ns=(1, 1))
+            (tmp_path / "edited.txt").write_text("5678")
+            os.utime(tmp_path / "edited.txt", ns=(2, 2))
+            assert manifest.update(tmp_path) == ManifestDiff([], ["edited.txt"], [])
+            assert manifest.get("touched.txt").mtime_ns == 1
+            assert manifest.diff(tmp_path).is_empty()
+
+        with pytest.raises(ValueError):
+            FileManifest(hash_algorithm="not-a-hash")
+
+    @allure.title("测试只在需要时计算哈希, 并跳过扫描期间消失或无法读取的文件")
+    def test_lazy_digest_and_unreadable_files(cls, tmp_path, monkeypatch) -> None:
+        for name in ("a.txt", "gone.txt", "locked.txt"):
+            (tmp_path / name).write_text(name)
+        with FileManifest(hash_contents=True) as manifest:
+            hashed: list[str] = []
+            get_digest = manifest._get_digest
+
+            def fake_get_digest(path: str) -> str | None:
+                hashed.append(os.path.basename(path))
+                if path.endswith("locked.txt"):
+                    raise PermissionError(path)
+                return get_digest(path)
+
+            monkeypatch.setattr(manifest, "_get_digest", fake_get_digest)
+            with allure.step("步骤1:diff 不为新增文件计算哈希"):
+                assert manifest.diff(tmp_path) == ManifestDiff(["a.txt", "gone.txt", "locked.txt"], [], [])
+                assert hashed == []
+
+            with allure.step("步骤2:无法读取的文件本次跳过"):
+                assert manifest.update(tmp_path) == ManifestDiff(["a.txt", "gone.txt"], [], [])
+                assert "locked.txt" not in manifest
+
+            with allure.step("步骤3:遍历之后被删除的文件视为删除"):
+
+                def remove_gone(entry: os.DirEntry[str]) -> bool:
+                    if entry.name == "gone.txt":
+                        os.remove(entry.path)
+                    return True
+
+                assert manifest.update(tmp_path, predicate=remove_gone).removed == ["gone.txt"]
+                assert "gone.txt" not in manifest
+
+
+class TestDuplicateFinder:
+    @allure.title("测试按大小、部分哈希与全量哈希查找重复文件")
+    def test_find(cls, tmp_path) -> None:
+        content = os.urandom(4096)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.bin").write_bytes(content)
+        (tmp_path / "sub" / "b.bin").write_bytes(content)
+        # 首尾相同、中间不同, 只能在全量哈希阶段区分
+        (tmp_path / "c.bin").write_bytes(content[:2048] + b"x" + content[2049:])
+        (tmp_path / "d.txt").write_text("dup")
+        (tmp_path / "e.txt").write_text("dup")
+        (tmp_path / "f.txt").write_text("one")
+        (tmp_path / "empty1").touch()
+        (tmp_path / "empty2").touch()
+
+        finder = DuplicateFinder(partial_size=512, workers=2)
+        with allure.step("步骤1:按文件大小从大到小返回重复组"):
+            groups = finder.find(tmp_path, tmp_path / "sub")
+            assert [[Path(p).name for p in group.paths] for group in groups] == [["a.bin", "b.bin"], ["d.txt", "e.txt"]]
+            assert groups[0].wasted_bytes == 4096
+
+        with allure.step("步骤2:小文件的摘要与全量哈希一致"):
+            assert [group.digest for group in finder.iter_duplicates(tmp_path, extensions=[".txt"])] == [
+                blake2b_hexdigest(b"dup")
+            ]
+
+        with allure.step("步骤3:生成 JSON 报告"):
+            report = finder.write_report(tmp_path / "report" / "dup.json", tmp_path)
+            assert report["duplicate_files"] == 2
+            assert report["wasted_bytes"] == 4096 + 3
+            assert json.loads((tmp_path / "report" / "dup.json").read_text(encoding="utf-8")) == report
+
 
 # class TestSysUtil:
 #     @classmethod
@@ -15,9 +15,15 @@ Change Activity:
 
 # here put the import lib
 
+import gzip
+import io
 import json
+import logging
+import os
+import queue
 
 import allure
+import pytest
 
 from .context_test import log
 
@@ -48,3 +54,352 @@ class TestLog:
                 }
             )
         )
+
+    @allure.title("测试异步日志模式")
+    def test_async_mode(self, tmp_path):
+        logfile = tmp_path / "async.log"
+        logger = logging.getLogger("test_async_mode")
+        logger.propagate = False
+        params = log.LoggerParams(
+            log.INFO, str(logfile), log.FileHandlerType.INFINITE, log.DEFAULT_MAX_LOG_SIZE, False, True, "|", "utf-8"
+        )
+        params = params._replace(async_mode=True, batch_size=16)
+        log.LogInitializer.setup_file_logger(logger, params)
+
+        with allure.step("步骤1:logger 上只保留队列 handler"):
+            assert len(logger.handlers) == 1
+            queue_handler = logger.handlers[0]
+            assert isinstance(queue_handler, log.AsyncQueueHandler)
+
+        with allure.step("步骤2:关闭后队列中的日志全部写出"):
+            for i in range(1000):
+                logger.info("record %d", i)
+            logger.error("failed")
+            logger.removeHandler(queue_handler)
+            listener = queue_handler.listener
+            queue_handler.close()
+            queue_handler.close()
+            assert queue_handler.listener is None
+            for handler in listener.handlers:
+                handler.close()
+            lines = logfile.read_text(encoding="utf-8").splitlines()
+            assert sum("record" in line for line in lines) == 1000
+            assert lines[-1].endswith("record 999")
+            assert "failed" in (tmp_path / "async.log.wf").read_text(encoding="utf-8")
+
+    @allure.title("测试异步日志队列溢出策略")
+    def test_async_overflow_policy(self):
+        record = logging.makeLogRecord({"msg": "message %s", "args": ("arg",)})
+        drop_handler = log.AsyncQueueHandler(queue.Queue(3), log.QueueOverflowPolicy.DROP)
+        for _ in range(10):
+            drop_handler.handle(record)
+        assert drop_handler.dropped == 7
+        assert drop_handler.queue.get_nowait().getMessage() == "message arg"
+
+        sample_handler = log.AsyncQueueHandler(queue.Queue(1), log.QueueOverflowPolicy.SAMPLE, sample_rate=0.0)
+        for _ in range(5):
+            sample_handler.handle(record)
+        assert sample_handler.dropped == 4
+        assert record.msg == "message %s" and record.args == ("arg",)
+
+    @allure.title("测试后台线程按批写入日志")
+    def test_batch_queue_listener(self):
+        class CountingHandler(logging.StreamHandler):
+            flushes = 0
+
+            def flush(self):
+                self.flushes += 1
+                super().flush()
+
+        stream = io.StringIO()
+        handler = CountingHandler(stream)
+        error_handler = CountingHandler(io.StringIO())
+        error_handler.setLevel(logging.ERROR)
+        log_queue: queue.Queue = queue.Queue()
+        for i in range(50):
+            log_queue.put(logging.makeLogRecord({"msg": f"record {i}", "levelno": logging.INFO}))
+        listener = log.BatchQueueListener(log_queue, handler, error_handler, batch_size=100)
+        listener.start()
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == [f"record {i}" for i in range(50)]
+        assert error_handler.stream.getvalue() == ""
+        assert handler.flushes == 1
+        assert "flush" not in vars(handler)
+
+    @allure.title("测试级别未启用时回溯日志不获取栈帧")
+    def test_backtrace_level_fast_path(self, monkeypatch):
+        log.init_comlog("test", is_print_console=True)
+        calls = []
+        original = log.LogInitializer.log_file_func_info.__func__
+
+        def spy(cls, msg, back_trace_len=0):
+            calls.append(msg)
+            return original(cls, msg, back_trace_len + 1)
+
+        monkeypatch.setattr(log.LogInitializer, "log_file_func_info", classmethod(spy))
+        log.set_log_level(log.INFO)
+        log.backtrace_debug("skipped")
+        log.debug_if(True, "skipped")
+        assert calls == []
+
+        log.backtrace_info("kept")
+        log.warn_if(True, "kept too")
+        assert calls == ["kept", "kept too"]
+        assert log.LogInitializer.get_code_file() == "log_test.py"
+
+    @allure.title("测试日志解析与聚合")
+    def test_parse_file(self, tmp_path):
+        logfile = tmp_path / "parse.log"
+        logger = logging.getLogger("test_parse_file")
+        logger.propagate = False
+        params = log.LoggerParams(
+            log.DEBUG, str(logfile), log.FileHandlerType.INFINITE, log.DEFAULT_MAX_LOG_SIZE, False, False, "|", "utf-8"
+        )
+        log.LogInitializer.setup_file_logger(logger, params)
+        for i in range(30):
+            logger.info("第 %d 条", i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        for handler in logger.handlers:
+            handler.close()
+            logger.removeHandler(handler)
+
+        with allure.step("步骤1:解析单行与多行日志"):
+            parser = log.LogParser()
+            lines = logfile.read_text(encoding="utf-8").splitlines(keepends=True)
+            record = parser.parse(lines[0])
+            assert record.loglevel == "INFO"
+            assert record.msg == "第 0 条"
+            assert record.func == "test_parse_file"
+            assert record.to_dict()["srcline"] == f"{__file__}:{record.lineno}"
+            assert parser.parse("Traceback (most recent call last):") is None
+            records = list(parser.iter_records(lines))
+            assert len(records) == 31
+            assert records[-1].msg.startswith("failed\nTraceback")
+            assert records[-1].msg.endswith("ValueError: boom")
+
+        with allure.step("步骤2:按维度聚合单个文件与多个文件"):
+            stats = log.parse_file(logfile, bucket="day")
+            assert stats.records == 31
+            assert stats.levels == {"INFO": 30, "ERROR": 1}
+            assert list(stats.buckets) == [records[0].date]
+            assert sum(stats.threads.values()) == 31
+            assert stats.srclines[records[0].srcline] == 30
+            merged = log.parse_files([logfile, logfile], workers=2)
+            assert merged.levels == {"INFO": 60, "ERROR": 2}
+            with pytest.raises(ValueError):
+                log.parse_file(logfile, bucket="week")
+
+    @allure.title("测试 JSON Lines 日志格式")
+    def test_json_format(self, tmp_path):
+        logfile = tmp_path / "json.log"
+        logger = logging.getLogger("test_json_format")
+        logger.propagate = False
+        params = log.LoggerParams(
+            log.DEBUG,
+            str(logfile),
+            log.FileHandlerType.INFINITE,
+            log.DEFAULT_MAX_LOG_SIZE,
+            False,
+            False,
+            "|",
+            "utf-8",
+            log_format=log.LogFormat.JSON,
+        )
+        log.LogInitializer.setup_file_logger(logger, params)
+        for i in range(3):
+            logger.info('第 %d 条 "quoted"\n%s', i, "next line")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        for handler in logger.handlers:
+            handler.close()
+            logger.removeHandler(handler)
+
+        with allure.step("步骤1:每行都是独立的 JSON 对象"):
+            lines = logfile.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 4
+            records = [json.loads(line) for line in lines]
+
+        with allure.step("步骤2:校验字段"):
+            first = records[0]
+            assert first["level"] == "INFO"
+            assert first["logger"] == "test_json_format"
+            assert first["msg"] == '第 0 条 "quoted"\nnext line'
+            assert first["file"] == __file__
+            assert first["func"] == "test_json_format"
+            assert first["pid"] == log.os.getpid()
+            assert first["platform"] == log.get_platform_info()
+            assert len(first["ts"]) == len("2026-10-18T00:00:00.000+08:00")
+            assert records[1]["line"] == first["line"]
+            assert "exc_info" not in first
+            assert records[-1]["level"] == "ERROR"
+            assert records[-1]["exc_info"].endswith("ValueError: boom")
+
+        with allure.step("步骤3:异步模式下异常和调用栈仍输出为独立字段"):
+            async_logfile = tmp_path / "json-async.log"
+            async_logger = logging.getLogger("test_json_format_async")
+            async_logger.propagate = False
+            log.LogInitializer.setup_file_logger(
+                async_logger, params._replace(logfile=str(async_logfile), async_mode=True)
+            )
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                async_logger.exception("failed %s", "async")
+            async_logger.info("with stack", stack_info=True)
+            for handler in list(async_logger.handlers):
+                handler.close()
+                async_logger.removeHandler(handler)
+
+            failed, stacked = (json.loads(line) for line in async_logfile.read_text(encoding="utf-8").splitlines())
+            assert failed["msg"] == "failed async"
+            assert failed["exc_info"].endswith("ValueError: boom")
+            assert stacked["msg"] == "with stack"
+            assert stacked["stack_info"].startswith("Stack (most recent call last)")
+
+    @allure.title("测试按大小或时间分割日志并在后台压缩")
+    def test_size_time_rotation(self, tmp_path):
+        logfile = tmp_path / "rotate.log"
+        handler = log.SizeTimeRotatingFileHandler(
+            logfile, max_bytes=1024, interval=60, backup_count=0, compression=log.RotationCompression.GZIP
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        with allure.step("步骤1:超过大小后分割, 压缩后的内容与原日志一致"):
+            for i in range(100):
+                handler.handle(logging.makeLogRecord({"msg": f"{i:03d} " + "x" * 60}))
+            handler.close()
+            rotated = handler.get_rotated_files()
+            assert len(rotated) == 6
+            assert all(path.endswith(".gz") for path in rotated)
+            lines = [
+                line for path in rotated for line in gzip.decompress(open(path, "rb").read()).decode().splitlines()
+            ]
+            lines += logfile.read_text().splitlines()
+            assert lines == [f"{i:03d} " + "x" * 60 for i in range(100)]
+
+        with allure.step("步骤2:到达时间间隔后分割"):
+            handler = log.SizeTimeRotatingFileHandler(
+                logfile, max_bytes=0, interval=60, compression=log.RotationCompression.ZIP
+            )
+            handler.handle(logging.makeLogRecord({"msg": "now"}))
+            handler.handle(logging.makeLogRecord({"msg": "later", "created": log.time.time() + 120}))
+            handler.close()
+            assert handler.get_rotated_files()[-1].endswith(".zip")
+            assert logfile.read_text() == "later\n"
+
+        with allure.step("步骤3:按磁盘预算清理旧文件"):
+            budget = os.path.getsize(handler.get_rotated_files()[-1]) * 2
+            handler = log.SizeTimeRotatingFileHandler(logfile, max_bytes=64, max_total_size=budget)
+            for i in range(50):
+                handler.handle(logging.makeLogRecord({"msg": f"{i:03d} " + "y" * 60}))
+            handler.close()
+            assert sum(os.path.getsize(path) for path in handler.get_rotated_files()) <= budget
+
+        with allure.step("步骤4:重命名失败时不会留下登记的分割文件"):
+            handler = log.SizeTimeRotatingFileHandler(logfile, max_bytes=0, interval=0)
+            handler.handle(logging.makeLogRecord({"msg": "keep"}))
+
+            def fail_replace(src, dst):
+                assert dst in handler._queued
+                raise PermissionError(dst)
+
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(log.os, "replace", fail_replace)
+                with pytest.raises(PermissionError):
+                    handler.doRollover()
+            assert handler._queued == set()
+            handler.close()
+
+    @allure.title("测试限流与去重过滤器")
+    def test_rate_limit_and_dedup(self, tmp_path, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(log.time, "monotonic", lambda: clock[0])
+
+        def make_record(msg, lineno=10, level=logging.INFO):
+            return logging.makeLogRecord({"name": "svc", "msg": msg, "lineno": lineno, "levelno": level})
+
+        with allure.step("步骤1:每个调用点独立的令牌桶"):
+            limiter = log.RateLimitFilter(rate=2, burst=3)
+            assert [limiter.filter(make_record("a")) for _ in range(5)] == [True, True, True, False, False]
+            assert limiter.filter(make_record("a", lineno=11))
+            assert limiter.filter(make_record("a", level=logging.ERROR))
+            clock[0] += 0.5
+            record = make_record("a")
+            assert limiter.filter(record)
+            assert record.getMessage() == "a [rate limited, 2 similar records suppressed]"
+            assert not limiter.filter(make_record("a"))
+            assert limiter.suppressed == 3
+
+        with allure.step("步骤2:窗口内的重复日志合并为一条"):
+            dedup = log.DedupFilter(window=1.0)
+            assert dedup.filter(make_record("disk full"))
+            assert not any(dedup.filter(make_record("disk full")) for _ in range(4))
+            assert dedup.filter(make_record("other"))
+            clock[0] += 1.0
+            record = make_record("disk full")
+            assert dedup.filter(record)
+            assert record.getMessage() == "disk full [previous message repeated 4 times]"
+            assert dedup.suppressed == 4
+
+        with allure.step("步骤3:通过 LoggerParams 配置"):
+            logfile = tmp_path / "storm.log"
+            logger = logging.getLogger("test_rate_limit_and_dedup")
+            logger.propagate = False
+            params = log.LoggerParams(
+                log.DEBUG,
+                str(logfile),
+                log.FileHandlerType.INFINITE,
+                log.DEFAULT_MAX_LOG_SIZE,
+                False,
+                False,
+                "|",
+                "utf-8",
+                rate_limit=5,
+                dedup_window=60,
+            )
+            log.LogInitializer.setup_file_logger(logger, params)
+            for i in range(100):
+                logger.error("storm %d", i % 2)
+                logger.warning("step %d", i)
+            for handler in logger.handlers:
+                handler.close()
+                logger.removeHandler(handler)
+            lines = logfile.read_text(encoding="utf-8").splitlines()
+            assert sum("storm" in line for line in lines) == 2
+            assert sum("step" in line for line in lines) == 5
+
+        with allure.step("步骤4:子 logger 传播上来的日志同样被过滤, 多个 handler 只计数一次"):
+            for async_mode in (False, True):
+                logfile = tmp_path / f"child-{async_mode}.log"
+                parent = logging.getLogger(f"test_filter_parent_{async_mode}")
+                parent.propagate = False
+                params = log.LoggerParams(
+                    log.DEBUG,
+                    str(logfile),
+                    log.FileHandlerType.INFINITE,
+                    log.DEFAULT_MAX_LOG_SIZE,
+                    False,
+                    True,
+                    "|",
+                    "utf-8",
+                    async_mode=async_mode,
+                    rate_limit=1,
+                    dedup_window=10,
+                )
+                log.LogInitializer.setup_file_logger(parent, params)
+                child = parent.getChild("child")
+                for _ in range(50):
+                    child.info("storm")
+                    child.warning("alarm")
+                for handler in list(parent.handlers):
+                    handler.close()
+                    parent.removeHandler(handler)
+                assert sum("storm" in line for line in logfile.read_text(encoding="utf-8").splitlines()) == 1
+                wf_lines = (tmp_path / f"child-{async_mode}.log.wf").read_text(encoding="utf-8").splitlines()
+                assert sum("alarm" in line for line in wf_lines) == 1
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   sharding_test.py
+@Date       :   2026/10/18
+@Desc       :   None
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import allure  # type: ignore
+import pytest
+
+from .context_test import (
+    ConsistentHashRing,
+    FnvHash,
+    JumpHashSharder,
+    MetroHash,
+    RendezvousHashSharder,
+)
+
+TEST_KEYS = [f"user:{i}" for i in range(5000)]
+
+
+@allure.feature("分片路由")
+@allure.description("一致性哈希环、Jump Consistent Hash、Rendezvous Hash")
+@allure.tag("Hash", "tag")
+class TestSharding:
+    @allure.title("测试一致性哈希环")
+    def test_consistent_hash_ring(cls) -> None:
+        with allure.step("步骤1:测试批量查找与单个查找一致"):
+            ring = ConsistentHashRing(["a", "b", "c", "d"], vnodes=50)
+            before = ring.assign_many(TEST_KEYS)
+            assert before == [ring.get_node(k) for k in TEST_KEYS]
+            assert set(before) == {"a", "b", "c", "d"}
+
+        with allure.step("步骤2:测试增加节点只会把键移动到新节点"):
+            ring.add_node("e")
+            after = ring.assign_many(TEST_KEYS)
+            assert all(new == "e" for old, new in zip(before, after) if old != new)
+
+        with allure.step("步骤3:测试删除节点后恢复原有分布"):
+            ring.remove_node("e")
+            assert ring.assign_many(TEST_KEYS) == before
+            with pytest.raises(KeyError):
+                ring.remove_node("e")
+
+        with allure.step("步骤4:测试逐个添加与批量添加结果一致"):
+            other = ConsistentHashRing(vnodes=50)
+            for node in "abcd":
+                other.add_node(node)
+            assert other.assign_many(TEST_KEYS) == before
+
+        with allure.step("步骤5:测试异常情况"):
+            with pytest.raises(ValueError):
+                ring.add_node("a")
+            with pytest.raises(LookupError):
+                ConsistentHashRing().get_node("x")
+            with pytest.raises(TypeError):
+                ConsistentHashRing(["a"], hasher=object())  # type: ignore
+
+        with allure.step("步骤6:测试使用不同的哈希器"):
+            assert ConsistentHashRing("abc", hasher=FnvHash()).get_node("x") in "abc"
+            assert ConsistentHashRing("abc", hasher=MetroHash).get_node("x") in "abc"
+
+    @allure.title("测试Jump Consistent Hash")
+    def test_jump_hash(cls) -> None:
+        with allure.step("步骤1:测试批量查找与单个查找一致"):
+            sharder = JumpHashSharder(10)
+            before = sharder.assign_many(TEST_KEYS)
+            assert before == [sharder.get_node(k) for k in TEST_KEYS]
+            assert set(before) == set(range(10))
+
+        with allure.step("步骤2:测试增加桶只会把键移动到新桶"):
+            sharder.set_num_buckets(11)
+            after = sharder.assign_many(TEST_KEYS)
+            assert all(new == 10 for old, new in zip(before, after) if old != new)
+
+        with allure.step("步骤3:测试异常桶数量"):
+            with pytest.raises(ValueError):
+                JumpHashSharder(0)
+
+    @allure.title("测试Rendezvous Hash")
+    def test_rendezvous_hash(cls) -> None:
+        with allure.step("步骤1:测试批量查找与单个查找一致"):
+            sharder = RendezvousHashSharder(["a", "b", "c"])
+            before = sharder.assign_many(TEST_KEYS)
+            assert before == [sharder.get_node(k) for k in TEST_KEYS]
+
+        with allure.step("步骤2:测试增加节点只会把键移动到新节点"):
+            sharder.add_node("d")
+            after = sharder.assign_many(TEST_KEYS)
+            assert all(new == "d" for old, new in zip(before, after) if old != new)
+            sharder.remove_node("d")
+            assert sharder.assign_many(TEST_KEYS) == before
+
+        with allure.step("步骤3:测试按节点分组"):
+            groups = sharder.partition(TEST_KEYS)
+            assert sum(len(v) for v in groups.values()) == len(TEST_KEYS)
+            with pytest.raises(LookupError):
+                RendezvousHashSharder().get_node("x")
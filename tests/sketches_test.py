@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   sketches_test.py
+@Date       :   2026/10/18
+@Desc       :   None
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import allure  # type: ignore
+import pytest
+
+from .context_test import (
+    BloomFilter,
+    CountingBloomFilter,
+    CountMinSketch,
+    FnvHash,
+    HyperLogLog,
+)
+
+TEST_KEYS = [f"key:{i}" for i in range(20000)]
+OTHER_KEYS = [f"other:{i}" for i in range(20000)]
+
+
+@allure.feature("概率数据结构")
+@allure.description("布隆过滤器、计数布隆过滤器、Count-Min Sketch、HyperLogLog")
+@allure.tag("bigdata")
+class TestSketches:
+    @allure.title("测试布隆过滤器")
+    def test_bloom_filter(cls) -> None:
+        with allure.step("步骤1:测试添加元素后一定存在, 误判率接近设定值"):
+            bf = BloomFilter(len(TEST_KEYS), 0.01)
+            bf.add_many(TEST_KEYS)
+            assert all(bf.contains_many(TEST_KEYS))
+            false_positive = sum(bf.contains_many(OTHER_KEYS)) / len(OTHER_KEYS)
+            assert false_positive < 0.02
+            assert len(bf) == len(TEST_KEYS)
+
+        with allure.step("步骤2:测试序列化与反序列化"):
+            restored = BloomFilter.from_bytes(bf.to_bytes())
+            assert restored.bits == bf.bits
+            assert restored.count == bf.count
+            with pytest.raises(ValueError):
+                CountMinSketch.from_bytes(bf.to_bytes())
+
+        with allure.step("步骤3:测试合并"):
+            other = BloomFilter(len(TEST_KEYS), 0.01)
+            other.add("merged")
+            assert "merged" not in bf
+            bf.merge(other)
+            assert "merged" in bf
+            with pytest.raises(ValueError):
+                bf.merge(BloomFilter(10, 0.01))
+
+        with allure.step("步骤4:测试使用FnvHash"):
+            fnv_bf = BloomFilter(100, hasher=FnvHash())
+            fnv_bf.add("fnv")
+            assert "fnv" in fnv_bf
+
+    @allure.title("测试计数布隆过滤器")
+    def test_counting_bloom_filter(cls) -> None:
+        cbf = CountingBloomFilter(1000, 0.01)
+        cbf.add_many(["a", "b", "a"])
+        cbf.remove("a")
+        assert "a" in cbf
+        cbf.remove("a")
+        assert "a" not in cbf
+        assert "b" in cbf
+
+        restored = CountingBloomFilter.from_bytes(cbf.to_bytes())
+        assert restored.bits == cbf.bits
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(cbf.to_bytes())
+
+        other = CountingBloomFilter(1000, 0.01)
+        other.add("c")
+        cbf.merge(other)
+        assert "c" in cbf
+
+    @allure.title("测试Count-Min Sketch")
+    def test_count_min_sketch(cls) -> None:
+        cms = CountMinSketch(0.001, 0.01)
+        cms.add_many(["a", "a", "b"])
+        cms.add("c", 10)
+        assert cms.estimate_many(["a", "b", "c"]) == [2, 1, 10]
+        assert cms.total == 13
+
+        restored = CountMinSketch.from_bytes(cms.to_bytes())
+        assert restored.estimate("c") == 10
+        restored.merge(cms)
+        assert restored.estimate("a") == 4
+        with pytest.raises(ValueError):
+            cms.add("a", -1)
+
+    @allure.title("测试HyperLogLog")
+    def test_hyperloglog(cls) -> None:
+        with allure.step("步骤1:测试基数估算误差"):
+            hll = HyperLogLog(14)
+            hll.add_many(TEST_KEYS)
+            hll.add_many(TEST_KEYS[:1000])
+            assert abs(hll.count() - len(TEST_KEYS)) / len(TEST_KEYS) < 0.03
+
+        with allure.step("步骤2:测试合并与序列化"):
+            other = HyperLogLog(14)
+            other.add_many(OTHER_KEYS)
+            hll.merge(other)
+            expected = len(TEST_KEYS) + len(OTHER_KEYS)
+            assert abs(hll.count() - expected) / expected < 0.03
+            assert HyperLogLog.from_bytes(hll.to_bytes()).count() == hll.count()
+
+        with allure.step("步骤3:测试异常参数"):
+            with pytest.raises(ValueError):
+                HyperLogLog(2)
+            with pytest.raises(ValueError):
+                hll.merge(HyperLogLog(10))
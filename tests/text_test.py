@@ -14,6 +14,14 @@ Change Activity:
 """
 # here put the import lib
 
+import array
+import codecs
+import csv
+import gzip
+import io
+import operator
+import sys
+import zipfile
 from collections import namedtuple
 
 import allure  # type: ignore
@@ -23,9 +31,15 @@ from loguru import logger
 from .context_test import (
     AbstractStrFinder,
     CharsetUtil,
+    ColumnarCsvData,
     CsvConfig,
+    CsvHeader,
     CsvReader,
+    CsvRow,
+    CsvWriter,
     FnvHash,
+    FnvHasher,
+    MetroHash,
     NullMode,
     PasswdStrengthUtil,
     PatternFinder,
@@ -262,6 +276,65 @@ class TestHash:
 
         h.hash_32("hello world".encode(CharsetUtil.UTF_8))
 
+    @allure.title("测试FNV-1a参考向量")
+    def test_fnv_hash(cls) -> None:
+        h = FnvHash()
+        with allure.step("步骤1:测试FNV-1a参考向量"):
+            assert h.hash_32("") == 0x811C9DC5
+            assert h.hash_32("a") == 0xE40C292C
+            assert h.hash_32("foobar") == 0xBF9CF968
+            assert h.hash_64("a") == 0xAF63DC4C8601EC8C
+            assert h.hash_64("foobar") == 0x85944171F73967E8
+            assert h.hash_128("a") == 0xD228CB696F1A8CAF78912B704E4A8964
+
+        with allure.step("步骤2:测试非ASCII字符按UTF-8字节计算"):
+            assert h.hash_64("Hello, 世界") == h.hash_64("Hello, 世界".encode(CharsetUtil.UTF_8))
+            assert h.hash_64(memoryview("😀".encode(CharsetUtil.UTF_8))) == h.hash_64("😀")
+
+        with allure.step("步骤3:测试增量哈希"):
+            for bits in (32, 64, 128):
+                hasher = FnvHasher(bits)
+                hasher.update("foo").update(b"bar")
+                assert hasher.intdigest() == h.fnv_1a(b"foobar", *FnvHash.PARAMS[bits])
+                assert len(hasher.digest()) == bits // 8
+                assert hasher.copy().hexdigest() == hasher.hexdigest()
+            with pytest.raises(ValueError):
+                FnvHasher(16)
+
+        with allure.step("步骤4:测试批量哈希"):
+            keys = ["", "a", b"foobar", bytearray(b"abc"), memoryview(b"xyz")]
+            assert h.hash_many(keys) == [h.hash_64(k) for k in keys]
+            assert h.hash_many(keys, bits=32) == [h.hash_32(k) for k in keys]
+            assert h.hash_many(array.array("Q", [1, 2]), bits=128) == [
+                h.hash_128((1).to_bytes(8, sys.byteorder)),
+                h.hash_128((2).to_bytes(8, sys.byteorder)),
+            ]
+
+    @allure.title("测试MetroHash参考向量")
+    def test_metro_hash(cls) -> None:
+        key = b"012345678901234567890123456789012345678901234567890123456789012"
+        with allure.step("步骤1:测试MetroHash64参考向量"):
+            assert MetroHash.hash_64(key) == 0xAD4B7006AE3D756B
+            assert MetroHash.hash_64(key, seed=1) == 0xDFB8B9F41C480D3B
+
+        with allure.step("步骤2:测试MetroHash128参考向量"):
+            assert MetroHash.hash_128(key) == 0x97A27450ACB248059B9FEDA4BFE27CC7
+            assert MetroHash.hash_128(key, seed=1) == 0xEFEC147A868DD6BD7F9D1938B8CDA345
+
+        with allure.step("步骤3:测试不同缓冲区类型结果一致"):
+            expected = MetroHash.hash_64(key)
+            assert MetroHash.hash_64(bytearray(key)) == expected
+            assert MetroHash.hash_64(memoryview(key)) == expected
+            assert MetroHash.hash_64(key.decode(CharsetUtil.UTF_8)) == expected
+
+        with allure.step("步骤4:测试批量哈希"):
+            keys = [key, b"", "hello", bytearray(b"world")]
+            assert MetroHash.hash_many(keys) == [MetroHash.hash_64(k) for k in keys]
+            assert MetroHash.hash_many(keys, bits=128) == [MetroHash.hash_128(k) for k in keys]
+            assert MetroHash.hash_many(keys, bits=32) == [MetroHash.hash_32(k) for k in keys]
+            with pytest.raises(ValueError):
+                MetroHash.hash_many(keys, bits=16)
+
 
 @allure.feature("CSV工具类")
 @allure.description("CSV工具类，提供CSV读取方法")
@@ -307,3 +380,184 @@ class TestCsv:
         namedtuple_lst = CsvReader.get_namedtuple_from_csv(cls.TEST_CSV_FILE, Row)
         for row in namedtuple_lst:
             logger.debug(row)
+
+    @allure.title("测试流式读取CSV文件数据行")
+    def test_iter_rows(cls) -> None:
+        reader = CsvReader(cls.TEST_CSV_FILE)
+        assert reader.read_header().get_raw_data() == ("id", "name", "age", "gender")
+        rows = list(reader.iter_rows())
+        assert [row.ori_line_num for row in rows] == [1, 2, 3, 4]
+        assert rows[0].get_raw_data() == ("1", "Alice", "25", "female")
+        assert [row.get_raw_data() for row in rows] == [row.get_raw_data() for row in reader.read().data]
+
+    @allure.title("测试流式读取CSV文件字典与命名元祖")
+    def test_iter_dicts_and_namedtuples(cls) -> None:
+        reader = CsvReader(cls.TEST_CSV_FILE)
+        dicts = list(reader.iter_dicts())
+        assert len(dicts) == 4
+        assert dicts[1] == {"id": "2", "name": "Bob", "age": "30", "gender": "male"}
+        assert dicts == list(CsvReader.get_dicts_from_csv(cls.TEST_CSV_FILE))
+
+        Row = namedtuple("Row", ["id", "name", "age", "gender"])
+        rows = list(reader.iter_namedtuples(Row))
+        assert rows[-1] == Row("4", "David", "40", "male")
+        assert rows == list(CsvReader.get_namedtuple_from_csv(cls.TEST_CSV_FILE, Row))
+
+    @allure.title("测试按批次流式读取CSV文件")
+    def test_iter_batches(cls) -> None:
+        reader = CsvReader(cls.TEST_CSV_FILE)
+        batches = list(reader.iter_batches(3))
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert batches[1] == [["4", "David", "40", "male"]]
+
+        columns = list(reader.iter_batches(3, columnar=True))
+        assert columns[0]["name"] == ["Alice", "Bob", "Charlie"]
+        assert columns[1] == {"id": ["4"], "name": ["David"], "age": ["40"], "gender": ["male"]}
+
+        with pytest.raises(ValueError):
+            next(reader.iter_batches(0))
+
+    @allure.title("测试列式读取CSV文件并推断列类型")
+    def test_read_columnar(cls) -> None:
+        reader = CsvReader(cls.TEST_CSV_FILE)
+        data = reader.read_columnar()
+        assert len(data) == 4
+        assert data.dtypes == {"id": int, "name": str, "age": int, "gender": str}
+        assert data.column("age") == array.array("q", [25, 30, 35, 40])
+        assert data.column("name") == ["Alice", "Bob", "Charlie", "David"]
+        assert reader.read().to_columnar().columns == data.columns
+        assert reader.read_columnar(infer_types=False).column("age") == ["25", "30", "35", "40"]
+        with pytest.raises(KeyError):
+            data.column("salary")
+
+    @allure.title("测试列式CSV数据的选择、过滤与聚合")
+    def test_columnar_select_filter_aggregate(cls) -> None:
+        data = CsvReader(cls.TEST_CSV_FILE).read_columnar()
+        assert data.sum("age") == 130
+        assert data.min("age") == 25
+        assert data.max("name") == "David"
+        assert data.count_distinct("gender") == 2
+
+        older = data.filter("age", lambda age: age > 28)
+        assert older.column("name") == ["Bob", "Charlie", "David"]
+        assert older.column("id") == array.array("q", [2, 3, 4])
+
+        selected = older.select("name", "gender")
+        assert selected.header == ("name", "gender")
+        assert selected.count_distinct("gender") == 1
+
+    @allure.title("测试列式CSV数据的缺失值处理")
+    def test_columnar_missing_values(cls) -> None:
+        data = ColumnarCsvData.from_raw_columns(
+            ["a", "b", "c"],
+            {"a": ["1", "", "3"], "b": ["1.5", "2", ""], "c": ["yes", "no", "x"]},
+        )
+        assert data.dtypes == {"a": int, "b": float, "c": str}
+        assert data.column("a") == [1, None, 3]
+        assert data.sum("a") == 4
+        assert data.max("b") == 2.0
+        assert data.count_distinct("a") == 2
+
+    @allure.title("测试按记录边界并行解析CSV文件")
+    def test_read_parallel(cls, tmp_path) -> None:
+        csv_file = tmp_path / "quoted.csv"
+        with open(csv_file, "w", encoding="utf-8", newline="") as f:
+            f.write('id,"multi\nline",value\r\n')
+            for i in range(300):
+                text = f'"say ""hi""\r\nrow {i}"' if i % 3 == 0 else f"row {i}"
+                f.write(f"{i},{text},{i % 5}\r\n")
+
+        reader = CsvReader(csv_file)
+        expected = [row.get_raw_data() for row in reader.read().data]
+        for workers, chunk_size in [(1, None), (2, 64), (3, 1)]:
+            csv_data = reader.read_parallel(workers, chunk_size=chunk_size)
+            assert csv_data.header.get_raw_data() == ("id", "multi\nline", "value")
+            assert [row.get_raw_data() for row in csv_data.data] == expected
+            assert csv_data.data[-1].ori_line_num == 300
+
+        assert reader.read_parallel(2, chunk_size=256, map_func=len, reduce_func=operator.add) == 300
+        assert sum(reader.read_parallel(2, chunk_size=256, map_func=len)) == 300
+        with pytest.raises(ValueError):
+            reader.read_parallel(0)
+
+        bom_file = tmp_path / "bom.csv"
+        bom_file.write_bytes(codecs.BOM_UTF8 + csv_file.read_bytes())
+        bom_reader = CsvReader(bom_file, CharsetUtil.UTF_8_SIG)
+        for workers, chunk_size in [(1, None), (3, 1)]:
+            csv_data = bom_reader.read_parallel(workers, chunk_size=chunk_size)
+            assert csv_data.header.get_raw_data() == ("id", "multi\nline", "value")
+            assert [row.get_raw_data() for row in csv_data.data] == expected
+
+    @allure.title("测试CsvRow使用__slots__")
+    def test_csv_row_slots(cls) -> None:
+        row = CsvRow(1, ["1", "Alice"])
+        assert not hasattr(row, "__dict__")
+        assert row.get_raw_data() == ("1", "Alice")
+        assert CsvRow(2, {"id": "2", "name": "Bob"}).get_raw_data() == ("2", "Bob")
+        with pytest.raises(AttributeError):
+            row.extra = 1
+        assert not hasattr(CsvHeader(["id", "name"]), "__dict__")
+
+    @allure.title("测试共享批次缓冲区的行视图与缓存的行转换函数")
+    def test_iter_views(cls) -> None:
+        reader = CsvReader(cls.TEST_CSV_FILE)
+        views = list(reader.iter_views(batch_size=3))
+        assert [view.line_num for view in views] == [1, 2, 3, 4]
+        assert views[1]["name"] == "Bob"
+        assert views[1][2] == "30"
+        assert views[3].get("salary", "-") == "-"
+        assert list(views[0].keys()) == ["id", "name", "age", "gender"]
+        assert views[2].to_tuple() == ("3", "Charlie", "35", "male")
+        assert views[0].to_dict() == {"id": "1", "name": "Alice", "age": "25", "gender": "female"}
+
+        to_dict = reader.get_dict_factory()
+        to_record = reader.get_namedtuple_factory()
+        assert to_dict(views[3]) == views[3].to_dict()
+        assert to_record(views[3]).name == "David"
+        assert type(reader.get_namedtuple_factory()(views[0])) is type(to_record(views[0]))
+
+    @allure.title("测试CsvWriter批量写入并原子重命名")
+    def test_csv_writer(cls, tmp_path) -> None:
+        csv_file = tmp_path / "out" / "export.csv"
+        rows = [(i, f"name,{i}", 'say "hi"') for i in range(1000)]
+        with CsvWriter(csv_file, buffer_size=4096) as writer:
+            writer.write_header(["id", "name", "comment"])
+            writer.write_many(rows[:500])
+            writer.write_many(iter(rows[500:]))
+            writer.write_dicts([{"id": "x", "name": "y", "comment": "z"}], ["id", "name", "comment"])
+            assert not csv_file.exists()
+
+        assert writer.cnt_of_row == 1002
+        assert [p.name for p in csv_file.parent.iterdir()] == ["export.csv"]
+        read_rows = [row.get_raw_data() for row in CsvReader(csv_file).iter_rows()]
+        assert read_rows[1] == ("1", "name,1", 'say "hi"')
+        assert read_rows[-1] == ("x", "y", "z")
+
+        with pytest.raises(ValueError):
+            writer.write_row([1])
+
+    @allure.title("测试CsvWriter异常时放弃写入")
+    def test_csv_writer_abort(cls, tmp_path) -> None:
+        csv_file = tmp_path / "export.csv"
+        with pytest.raises(RuntimeError), CsvWriter(csv_file) as writer:
+            writer.write_row(["id"])
+            raise RuntimeError("boom")
+        assert list(tmp_path.iterdir()) == []
+
+    @allure.title("测试CsvWriter写入gzip与zip压缩文件")
+    def test_csv_writer_compression(cls, tmp_path) -> None:
+        rows = [["id", "name"], *([str(i), f"name {i}"] for i in range(100))]
+        with CsvWriter(tmp_path / "export.csv.gz") as writer:
+            writer.write_many(rows)
+        with gzip.open(tmp_path / "export.csv.gz", "rt", encoding="utf-8", newline="") as f:
+            assert list(csv.reader(f)) == rows
+
+        with CsvWriter(tmp_path / "export.zip") as writer:
+            writer.write_many(rows)
+        with zipfile.ZipFile(tmp_path / "export.zip") as archive:
+            assert archive.namelist() == ["export.csv"]
+            text = archive.read("export.csv").decode("utf-8")
+        assert list(csv.reader(io.StringIO(text, newline=""))) == rows
+
+        with pytest.raises(ValueError):
+            CsvWriter(tmp_path / "export.csv", compression="bz2")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""
+-------------------------------------------------
+@File       :   zip_util_test.py
+@Date       :   2026/10/18
+@Desc       :   None
+@Version    :   1.0
+-------------------------------------------------
+Change Activity:
+@Date       :   2026/10/18
+@Author     :   Plord117
+@Desc       :   None
+-------------------------------------------------
+"""
+
+# here put the import lib
+import os
+import zipfile
+
+import allure  # type: ignore
+import pytest
+
+from .context_test import ZipIndex, ZipUtil
+
+
+@allure.feature("压缩工具类")
+@allure.description("zip 归档的压缩、解压与修改")
+@allure.tag("util")
+class TestZipUtil:
+    @allure.title("测试并行分块压缩目录")
+    def test_zip_dir(cls, tmp_path) -> None:
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        text = "".join(f"line {i % 97} of the log file\n" for i in range(20_000)).encode()
+        (src / "app.log").write_bytes(text)
+        (src / "sub" / "image.png").write_bytes(os.urandom(5000))
+        (src / "sub" / "中文.txt").write_text("你好" * 100, encoding="utf-8")
+        (src / "empty").touch()
+
+        with allure.step("步骤1:多线程分块压缩结果可以被标准库正确读取"):
+            zip_path = ZipUtil.zip_dir(src, tmp_path / "out.zip", workers=3, block_size=4096)
+            with zipfile.ZipFile(zip_path) as z:
+                assert z.testzip() is None
+                assert z.namelist() == ["app.log", "empty", "sub/image.png", "sub/中文.txt"]
+                assert z.read("app.log") == text
+                assert z.getinfo("app.log").compress_size < len(text) // 10
+                assert z.getinfo("sub/image.png").compress_type == zipfile.ZIP_STORED
+
+        with allure.step("步骤2:与单线程压缩的内容一致"):
+            single = ZipUtil.zip_dir(src, tmp_path / "single.zip", workers=1, compress_level=1)
+            with zipfile.ZipFile(single) as z:
+                assert z.read("app.log") == text
+                assert z.read("sub/中文.txt").decode("utf-8") == "你好" * 100
+
+        with allure.step("步骤3:其他压缩方法按顺序写入"):
+            bz2_path = ZipUtil.zip_dir(src, tmp_path / "bz2.zip", compression=zipfile.ZIP_BZIP2, extensions=[".log"])
+            with zipfile.ZipFile(bz2_path) as z:
+                assert z.namelist() == ["app.log"]
+                assert z.getinfo("app.log").compress_type == zipfile.ZIP_BZIP2
+                assert z.read("app.log") == text
+
+        with allure.step("步骤4:解压"):
+            out_dir = ZipUtil.unzip_to_dir(zip_path, tmp_path / "out")
+            assert (out_dir / "app.log").read_bytes() == text
+
+        with pytest.raises(ValueError):
+            ZipUtil.zip_dir(src / "app.log", tmp_path / "bad.zip")
+
+    @allure.title("测试批量修改归档文件时原样复制未修改的成员")
+    def test_update_zip(cls, tmp_path) -> None:
+        zip_path = tmp_path / "data.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            for i in range(5):
+                z.writestr(f"part-{i}.txt", f"part {i}\n" * 1000)
+        with zipfile.ZipFile(zip_path) as z:
+            raw_sizes = {info.filename: (info.compress_size, info.CRC) for info in z.infolist()}
+
+        with allure.step("步骤1:一次完成替换、新增和删除"):
+            (tmp_path / "extra.txt").write_text("from file")
+            ZipUtil.update_zip(
+                zip_path,
+                {"part-1.txt": "replaced", "new.bin": b"\x00\x01", "extra.txt": tmp_path / "extra.txt"},
+                ["part-3.txt", "missing.txt"],
+            )
+            with zipfile.ZipFile(zip_path) as z:
+                assert z.testzip() is None
+                assert z.namelist() == ["part-0.txt", "part-2.txt", "part-4.txt", "part-1.txt", "new.bin", "extra.txt"]
+                assert z.read("part-1.txt") == b"replaced"
+                assert z.read("extra.txt") == b"from file"
+                assert z.read("part-4.txt") == b"part 4\n" * 1000
+                assert all(
+                    (z.getinfo(name).compress_size, z.getinfo(name).CRC) == raw_sizes[name]
+                    for name in ["part-0.txt", "part-2.txt", "part-4.txt"]
+                )
+            assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+        with allure.step("步骤2:兼容原有的单个替换与删除"):
+            ZipUtil.replace_zip_data(str(zip_path), "part-0.txt", "zero")
+            ZipUtil.remove_from_zip(zip_path, "part-2.txt")
+            with zipfile.ZipFile(zip_path) as z:
+                assert z.read("part-0.txt") == b"zero"
+                assert "part-2.txt" not in z.namelist()
+
+    @allure.title("测试成员索引、流式读取与并行解压")
+    def test_zip_index(cls, tmp_path) -> None:
+        zip_path = tmp_path / "bundle.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            for i in range(20):
+                z.writestr(f"assets/{i % 3}/item-{i}.txt", f"item {i}\n" * (i + 1) * 100)
+            z.writestr("empty/", "")
+            z.writestr("../escape.txt", "escape")
+
+        with allure.step("步骤1:索引按文件修改时间缓存"):
+            index = ZipIndex.of(zip_path)
+            assert ZipIndex.of(zip_path) is index
+            assert len(index) == 22
+            assert "assets/1/item-4.txt" in index
+            with pytest.raises(KeyError):
+                index.get_info("missing.txt")
+
+        with allure.step("步骤2:流式读取成员"):
+            with index.open_member("assets/1/item-4.txt") as f:
+                assert f.readline() == b"item 4\n"
+                assert len(f.read()) == len("item 4\n") * 499
+            assert ZipUtil.get_from_zip(zip_path, "assets/2/item-5.txt") == b"item 5\n" * 600
+            with pytest.raises(AttributeError):
+                ZipUtil.get_from_zip(zip_path, "missing.txt")
+
+        with allure.step("步骤3:并行解压, 路径不会逃逸出目标目录"):
+            out_dir = ZipUtil.unzip_to_dir(zip_path, tmp_path / "out", workers=4)
+            assert len(list((out_dir / "assets").rglob("*.txt"))) == 20
+            assert (out_dir / "assets" / "0" / "item-9.txt").read_bytes() == b"item 9\n" * 1000
+            assert (out_dir / "empty").is_dir()
+            assert (out_dir / "escape.txt").read_text() == "escape"
+            assert not (tmp_path / "escape.txt").exists()
+
+        with allure.step("步骤4:归档文件变化后索引失效"):
+            ZipUtil.remove_from_zip(zip_path, "../escape.txt")
+            os.utime(zip_path, ns=(1, 1))
+            assert ZipIndex.of(zip_path) is not index
+            assert len(ZipIndex.of(zip_path)) == 21
+
+    @allure.title("测试 zipfile 私有成员不可用时退回到公开接口")
+    def test_public_api_fallback(cls, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr("pythontools.compress.zip._ZipInternals.can_write_raw", classmethod(lambda _, zf: False))
+        monkeypatch.setattr("pythontools.compress.zip._ZipInternals.can_read_raw", classmethod(lambda _: False))
+        src = tmp_path / "src"
+        src.mkdir()
+        text = b"fallback line\n" * 5000
+        (src / "a.log").write_bytes(text)
+        (src / "b.png").write_bytes(os.urandom(1000))
+
+        with allure.step("步骤1:压缩目录"):
+            zip_path = ZipUtil.zip_dir(src, tmp_path / "out.zip", compress_level=9)
+            bz2_path = ZipUtil.zip_dir(src, tmp_path / "bz2.zip", compression=zipfile.ZIP_BZIP2, compress_level=1)
+            for path in (zip_path, bz2_path):
+                with zipfile.ZipFile(path) as z:
+                    assert z.testzip() is None
+                    assert z.read("a.log") == text
+                    assert z.getinfo("b.png").compress_type == zipfile.ZIP_STORED
+
+        with allure.step("步骤2:修改归档与读取成员"):
+            ZipUtil.update_zip(zip_path, {"c.txt": "new"}, ["b.png"])
+            with zipfile.ZipFile(zip_path) as z:
+                assert z.testzip() is None
+                assert z.namelist() == ["a.log", "c.txt"]
+            with ZipIndex.of(zip_path).open_member("a.log") as f:
+                assert f.read() == text
+
+    @allure.title("测试加密成员与文件头不一致的成员交给 ZipFile.open 校验")
+    def test_open_member_checks(cls, tmp_path) -> None:
+        def make_zip(path, patch) -> None:
+            with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+                z.writestr("plain.txt", "plain")
+                z.writestr("secret.txt", "secret " * 100)
+            data = bytearray(path.read_bytes())
+            with zipfile.ZipFile(path) as z:
+                offset = z.getinfo("secret.txt").header_offset
+            patch(data, offset)
+            path.write_bytes(bytes(data))
+
+        def set_encrypted(data: bytearray, offset: int) -> None:
+            # 同时设置本地文件头和中央目录中的加密标志位
+            data[offset + 6] |= 0x01
+            central = data.index(b"PK\x01\x02", data.index(b"PK\x01\x02") + 1)
+            data[central + 8] |= 0x01
+
+        def rename_local_header(data: bytearray, offset: int) -> None:
+            data[offset + 30] = ord("S")
+
+        with allure.step("步骤1:加密成员抛出 RuntimeError 且不会留下解压文件"):
+            zip_path = tmp_path / "encrypted.zip"
+            make_zip(zip_path, set_encrypted)
+            index = ZipIndex.of(zip_path)
+            assert index.get_info("secret.txt").flag_bits & 0x01
+            with index.open_member("plain.txt") as f:
+                assert f.read() == b"plain"
+            with pytest.raises(RuntimeError, match="password required"):
+                index.open_member("secret.txt")
+            with pytest.raises(RuntimeError):
+                index.extract_all(tmp_path / "out", members=["secret.txt"])
+            assert not (tmp_path / "out" / "secret.txt").exists()
+
+        with allure.step("步骤2:本地文件头中的文件名与中央目录不一致"):
+            zip_path = tmp_path / "renamed.zip"
+            make_zip(zip_path, rename_local_header)
+            with pytest.raises(zipfile.BadZipFile):
+                ZipIndex.of(zip_path).open_member("secret.txt")